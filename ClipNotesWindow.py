@@ -1,18 +1,28 @@
 import sys, os, time, json, subprocess, signal,fcntl, tempfile
 
 from PyQt6.QtGui import QPainter, QColor, QIcon, QPalette, QPixmap, QPainterPath, QDesktopServices, QDrag
-from PyQt6.QtCore import Qt, QSize, QTimer, QEvent, QVariantAnimation, QUrl, QMimeData, QPoint
+from PyQt6.QtCore import Qt, QSize, QTimer, QEvent, QVariantAnimation, QUrl, QMimeData, QPoint, QObject, QSortFilterProxyModel
+from PyQt6.QtNetwork import QLocalServer
 from PyQt6.QtWidgets import QApplication, QWidget, QPushButton, QMainWindow, QVBoxLayout, QHBoxLayout, QSlider, QDialog, QLineEdit, QGridLayout, QSizePolicy
-from PyQt6.QtWidgets import QTextEdit, QTextBrowser, QLabel, QFileDialog, QCheckBox, QScrollArea, QListWidgetItem, QAbstractItemView, QTabWidget
+from PyQt6.QtWidgets import QTextEdit, QTextBrowser, QLabel, QFileDialog, QCheckBox, QScrollArea, QListWidgetItem, QAbstractItemView, QTabWidget, QTableView, QHeaderView
 
 from utils import *
-from utils import load_clip_notes_data, populate_actions_map_from_data, get_json_order_from_data, get_clip_data_from_data
-from ui import EmojiSelector, AutoScrollListWidget, WhiteDropIndicatorStyle, HoverSubMenu, CursorTracker, TooltipWindow, RadialMenu, CalibrationWindow
-from ui import KeyboardShortcutsManager, CircularColorPicker, CircularSlider
+from utils import load_clip_notes_data, populate_actions_map_from_data, get_json_order_from_data, get_clip_data, get_clip_record, clip_tooltip_from_record
+from utils import use_native_clipboard, copy_kwargs, group_child_html, exec_kwargs
+from ui import EmojiSelector, AutoScrollListWidget, WhiteDropIndicatorStyle, HoverSubMenu, CursorTracker, TooltipWindow, RadialMenu, CalibrationWindow, button_pixmap
+from ui import KeyboardShortcutsManager, CircularColorPicker, CircularSlider, StoredClipsModel, StoredClipsDelegate, RecentRunsView
+from clipnotes_client import get_socket_path, send_command, COMMANDS
+from app_icon_index import get_app_icon_index
+from emoji_catalog import get_emoji_catalog, push_recent_emoji
+from screen_profiles import screen_at, clamp_center_to_screen
+from terminal_launcher import configure_terminal, TERMINAL_MODES, DEFAULT_TMUX_SESSION
+from action_runner import start_action_runner, get_action_runner, DEFAULT_MAX_CONCURRENT, DEFAULT_TIMEOUT
 
 # Cache pour colors.json (chargé une seule fois)
 _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 _COLOR_PALETTE_CACHE = None
+# Attente maximale d'une position du curseur remontée par Wayland avant d'afficher le menu (ms)
+SHOW_POSITION_TIMEOUT_MS = 250
 
 def _get_color_palette():
     global _COLOR_PALETTE_CACHE
@@ -25,6 +35,11 @@ class ClipNotesWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.tracker = None
+        # Affichage demandé par show_at_cursor, en attente d'une position fraîche
+        self.show_pending = False
+        self.show_timer = None
+        # Mode résident (daemon) : le tracker est caché au lieu d'être fermé
+        self.resident = False
         self.current_popup = None
         self.actions_map_sub = {}
         self.buttons_sub = []
@@ -77,16 +92,38 @@ class ClipNotesWindow(QMainWindow):
         # Pagination du menu radial
         self.clips_per_page = 20  # Nombre max de clips par page
         self.page_flip_direction = "horizontal"  # "horizontal" ou "vertical"
+        # Moteur du menu radial : "widgets" (un QPushButton par clip) ou "painted" (dessiné, un seul widget)
+        self.menu_engine = "widgets"
+        # Emojis récemment choisis (affichés en tête du sélecteur)
+        self.recent_emojis = []
+        # Clips "term" : terminal imposé ("auto" = détecté), "window" (nouvel émulateur) ou "tmux"
+        self.terminal = "auto"
+        self.terminal_mode = "window"
+        self.tmux_session = DEFAULT_TMUX_SESSION
+        # Clips "exec" suivis par le daemon : commandes simultanées max, délai max en secondes (0 = sans limite)
+        self.exec_max_concurrent = DEFAULT_MAX_CONCURRENT
+        self.exec_timeout = DEFAULT_TIMEOUT
         self.current_page = 0  # Page actuelle (0-indexed)
         self.all_clips_data = []  # Tous les clips (pour la pagination)
         self.all_clips_by_link = []  # Tous les clips_by_link (pour la pagination)
         self.total_pages = 1  # Nombre total de pages
         self.page_selector = None  # Widget sélecteur de pages
+        self.page_selector_buttons = []  # Numéros de page (restylés en place)
+        self.prerender_queue = []  # Labels des pages voisines dont l'icône reste à préparer
+        # Un seul minuteur pour le prérendu : relancé à chaque changement de page
+        self.prerender_timer = QTimer(self)
+        self.prerender_timer.setInterval(0)
+        self.prerender_timer.timeout.connect(self._prerender_next_icons)
         self.is_changing_page = False  # Flag pour éviter les conflits pendant le changement de page
         
         # Tri des clips stockés
         self.stored_clips_sort_column = None  # None = ordre naturel, "alias", "action", "string"
         self.stored_clips_sort_ascending = True
+        # Onglet des clips stockés (modèle/vue, créés avec le dialogue)
+        self.stored_clips_model = None
+        self.stored_clips_proxy = None
+        self.stored_clips_view = None
+        self.stored_clips_reset_btn = None
         
         self.dialog_style = """
             QWidget {
@@ -177,6 +214,8 @@ class ClipNotesWindow(QMainWindow):
         os.makedirs(self.thumbnails_dir, exist_ok=True)
         # Charger la configuration au démarrage
         self.load_config()
+        # Index des icônes d'applications (dialogue de création) : construit en arrière-plan
+        get_app_icon_index()
     
     def get_update_mode(self):
         return self.update_mode
@@ -264,6 +303,17 @@ class ClipNotesWindow(QMainWindow):
             self.clips_per_page = config.get('clips_per_page', self.clips_per_page)
             self.page_flip_direction = config.get('page_flip_direction', self.page_flip_direction)
             
+            loaded_menu_engine = config.get('menu_engine', self.menu_engine)
+            self.menu_engine = loaded_menu_engine if loaded_menu_engine in ("widgets", "painted") else "widgets"
+            self.recent_emojis = [e for e in config.get('recent_emojis', self.recent_emojis) if isinstance(e, str)]
+            self.terminal = config.get('terminal', self.terminal) or "auto"
+            loaded_terminal_mode = config.get('terminal_mode', self.terminal_mode)
+            self.terminal_mode = loaded_terminal_mode if loaded_terminal_mode in TERMINAL_MODES else "window"
+            self.tmux_session = config.get('tmux_session', self.tmux_session) or DEFAULT_TMUX_SESSION
+            configure_terminal(self.terminal, self.terminal_mode, self.tmux_session)
+            self.exec_max_concurrent = config.get('exec_max_concurrent', self.exec_max_concurrent)
+            self.exec_timeout = config.get('exec_timeout', self.exec_timeout)
+            
             print(f"[Config] Configuration chargée: {config}")
         except Exception as e:
             print(f"[Erreur] Impossible de charger la configuration: {e}")
@@ -289,7 +339,14 @@ class ClipNotesWindow(QMainWindow):
             'shadow_enabled': self.shadow_enabled,
             'shadow_angle': self.shadow_angle,
             'clips_per_page': self.clips_per_page,
-            'page_flip_direction': self.page_flip_direction
+            'page_flip_direction': self.page_flip_direction,
+            'menu_engine': self.menu_engine,
+            'recent_emojis': self.recent_emojis,
+            'terminal': self.terminal,
+            'terminal_mode': self.terminal_mode,
+            'tmux_session': self.tmux_session,
+            'exec_max_concurrent': self.exec_max_concurrent,
+            'exec_timeout': self.exec_timeout
         }
         
         try:
@@ -320,9 +377,11 @@ class ClipNotesWindow(QMainWindow):
         # Utiliser les coordonnées stockées
         # x, y = getattr(self, 'x', 0), getattr(self, 'y', 0)
         # self._complete_page_change(self.current_page, x, y)
+        records = {item.get('alias'): item for item in json_data}
         for name, (action_data, value, action) in sorted_clips:
-            tooltip = value.replace(r'\n', '\n')
-            _, clip_html = get_clip_data_from_data(json_data, name)
+            # Aperçus tronqués calculés à l'enregistrement (contenu complet à défaut)
+            tooltip, clip_html = clip_tooltip_from_record(records.get(name, {}))
+            tooltip = tooltip or value.replace(r'\n', '\n')
             all_clips_buttons.append((name, self.make_handler_sub(name, value, x, y), tooltip, action, clip_html))
             
             func, children, meta = action_data
@@ -386,21 +445,21 @@ class ClipNotesWindow(QMainWindow):
         delete_from_json(self.clip_notes_file_json, alias)
         print(f"[Stored Clips] Clip '{alias}' supprimé définitivement")
 
-    def sort_stored_clips(self, clips, column, ascending=True):
-        """Trie les clips stockés par colonne"""
-        if column is None:
-            return clips  # Ordre naturel
-        
-        def get_sort_key(clip):
-            value = clip.get(column, '')
-            if value is None:
-                value = ''
-            # Pour created_at, garder la valeur telle quelle pour un tri chronologique
-            if column == 'created_at':
-                return value if value else ''
-            return str(value).lower()
-        
-        return sorted(clips, key=get_sort_key, reverse=not ascending)
+    def apply_stored_clips_sort(self):
+        """Applique le tri courant au proxy de l'onglet des clips stockés (sans relire le fichier)"""
+        try:
+            if self.stored_clips_proxy is None:
+                return
+            column = self.stored_clips_sort_column
+            order = Qt.SortOrder.AscendingOrder if self.stored_clips_sort_ascending else Qt.SortOrder.DescendingOrder
+            # -1 = ordre naturel (ordre du fichier)
+            section = StoredClipsModel.COLUMNS.index(column) if column else -1
+            self.stored_clips_proxy.sort(section, order)
+            self.stored_clips_view.horizontalHeader().setSortIndicator(section, order)
+            self.stored_clips_reset_btn.setVisible(column is not None)
+        except RuntimeError:
+            # Le dialogue a été fermé
+            self.stored_clips_proxy = None
     
     def toggle_stored_clips_sort(self, column, parent_dialog, x, y):
         """Toggle le tri sur une colonne"""
@@ -412,13 +471,13 @@ class ClipNotesWindow(QMainWindow):
             self.stored_clips_sort_column = column
             self.stored_clips_sort_ascending = True
         
-        self.refresh_stored_clips_tab(parent_dialog, x, y)
+        self.apply_stored_clips_sort()
     
     def reset_stored_clips_sort(self, parent_dialog, x, y):
         """Réinitialise le tri à l'ordre naturel"""
         self.stored_clips_sort_column = None
         self.stored_clips_sort_ascending = True
-        self.refresh_stored_clips_tab(parent_dialog, x, y)
+        self.apply_stored_clips_sort()
 
     def eventFilter(self, watched, event):
         """Gère les événements de hover et de clic sur les widgets du dialogue"""
@@ -437,41 +496,9 @@ class ClipNotesWindow(QMainWindow):
                 html_string = watched.property("html_string")
                 
                 if help_text:
-                    # Déterminer si c'est multiligne
-                    line_count = help_text.count('\n') + 1
-                    is_multiline = line_count > 1
-                    
-                    if is_multiline and hasattr(self, 'dialog_help_browser') and self.dialog_help_browser:
-                        # Multilignes → utiliser le QTextBrowser
-                        if html_string:
-                            self.dialog_help_browser.setHtml(html_string)
-                        else:
-                            self.dialog_help_browser.setPlainText(help_text)
-                        self.dialog_help_browser.setVisible(True)
-                        if self.dialog_help_label:
-                            self.dialog_help_label.setVisible(False)
-                    elif self.dialog_help_label:
-                        # Une seule ligne → utiliser le label simple (avec HTML si disponible)
-                        if html_string:
-                            # Activer le rendu HTML et afficher le HTML
-                            self.dialog_help_label.setTextFormat(Qt.TextFormat.RichText)
-                            self.dialog_help_label.setText(html_string)
-                        else:
-                            # Texte simple
-                            self.dialog_help_label.setTextFormat(Qt.TextFormat.PlainText)
-                            self.dialog_help_label.setText(help_text)
-                        self.dialog_help_label.setVisible(True)
-                        if hasattr(self, 'dialog_help_browser') and self.dialog_help_browser:
-                            self.dialog_help_browser.setVisible(False)
+                    self.show_dialog_help(help_text, html_string)
         elif event.type() == QEvent.Type.Leave:
-            # Vider et cacher les widgets d'aide
-            if self.dialog_help_label:
-                self.dialog_help_label.setTextFormat(Qt.TextFormat.PlainText)
-                self.dialog_help_label.setText("")
-                self.dialog_help_label.setVisible(True)
-            if hasattr(self, 'dialog_help_browser') and self.dialog_help_browser:
-                self.dialog_help_browser.clear()
-                self.dialog_help_browser.setVisible(False)
+            self.clear_dialog_help()
         elif event.type() == QEvent.Type.MouseButtonPress:
             # Gérer les clics sur les emojis pour changer le slider
             if watched in self.dialog_emoji_labels and self.dialog_slider:
@@ -485,21 +512,78 @@ class ClipNotesWindow(QMainWindow):
         
         return super().eventFilter(watched, event)
 
+    def show_emoji_selector(self, parent_dialog, line_edit):
+        """Ouvre le sélecteur d'emojis et place l'emoji choisi dans line_edit"""
+        # emojis.txt n'est relu que s'il a changé depuis la dernière ouverture
+        catalog = get_emoji_catalog(self.emojis_file)
+        if catalog is None:
+            return
+        selector = EmojiSelector(catalog, self.recent_emojis, parent=parent_dialog)
+
+        def on_emoji_selected(emoji):
+            # Remplacer tout le texte par l'emoji sélectionné
+            line_edit.setFocus()
+            line_edit.setText(emoji)
+            line_edit.setCursorPosition(len(emoji))
+            # Les emojis récents sont proposés en premier à la prochaine ouverture
+            self.recent_emojis = push_recent_emoji(self.recent_emojis, emoji)
+            self.save_config()
+            selector.accept()
+
+        selector.emoji_selected = on_emoji_selected
+        selector.exec()
+
+    def show_dialog_help(self, help_text, html_string=None):
+        """Affiche l'aide d'un widget (ou d'une cellule) sous le contenu du dialogue"""
+        # Déterminer si c'est multiligne
+        line_count = help_text.count('\n') + 1
+        is_multiline = line_count > 1
+        
+        if is_multiline and hasattr(self, 'dialog_help_browser') and self.dialog_help_browser:
+            # Multilignes → utiliser le QTextBrowser
+            if html_string:
+                self.dialog_help_browser.setHtml(html_string)
+            else:
+                self.dialog_help_browser.setPlainText(help_text)
+            self.dialog_help_browser.setVisible(True)
+            if self.dialog_help_label:
+                self.dialog_help_label.setVisible(False)
+        elif self.dialog_help_label:
+            # Une seule ligne → utiliser le label simple (avec HTML si disponible)
+            if html_string:
+                # Activer le rendu HTML et afficher le HTML
+                self.dialog_help_label.setTextFormat(Qt.TextFormat.RichText)
+                self.dialog_help_label.setText(html_string)
+            else:
+                # Texte simple
+                self.dialog_help_label.setTextFormat(Qt.TextFormat.PlainText)
+                self.dialog_help_label.setText(help_text)
+            self.dialog_help_label.setVisible(True)
+            if hasattr(self, 'dialog_help_browser') and self.dialog_help_browser:
+                self.dialog_help_browser.setVisible(False)
+
+    def clear_dialog_help(self):
+        """Vide et cache les widgets d'aide"""
+        if self.dialog_help_label:
+            self.dialog_help_label.setTextFormat(Qt.TextFormat.PlainText)
+            self.dialog_help_label.setText("")
+            self.dialog_help_label.setVisible(True)
+        if hasattr(self, 'dialog_help_browser') and self.dialog_help_browser:
+            self.dialog_help_browser.clear()
+            self.dialog_help_browser.setVisible(False)
+
     def get_action_from_json(self, alias):
         """Lit l'action d'un clip depuis le fichier JSON"""
         try:
-            if os.path.exists(self.clip_notes_file_json):
-                with open(self.clip_notes_file_json, 'r', encoding='utf-8') as f:
-                    clips = json.load(f)
-                    for clip in clips:
-                        if clip.get('alias') == alias:
-                            action = clip.get('action', 'copy')
-                            action_to_slider = {
-                                'copy': 0,
-                                'term': 1,
-                                'exec': 2
-                            }
-                            return action_to_slider.get(action, 0)
+            clip = get_clip_record(self.clip_notes_file_json, alias)
+            if clip is not None:
+                action = clip.get('action', 'copy')
+                action_to_slider = {
+                    'copy': 0,
+                    'term': 1,
+                    'exec': 2
+                }
+                return action_to_slider.get(action, 0)
         except Exception as e:
             print(f"Erreur lecture JSON: {e}")
         return 0
@@ -512,21 +596,18 @@ class ClipNotesWindow(QMainWindow):
             tuple: (slider_value, html_string ou None)
         """
         try:
-            if os.path.exists(self.clip_notes_file_json):
-                with open(self.clip_notes_file_json, 'r', encoding='utf-8') as f:
-                    clips = json.load(f)
-                    for clip in clips:
-                        if clip.get('alias') == alias:
-                            action = clip.get('action', 'copy')
-                            action_to_slider = {
-                                'copy': 0,
-                                'term': 1,
-                                'exec': 2
-                            }
-                            slider_value = action_to_slider.get(action, 0)
-                            string = clip.get('string', None)
-                            html_string = clip.get('html_string', None)
-                            return (slider_value, string, html_string)
+            clip = get_clip_record(self.clip_notes_file_json, alias)
+            if clip is not None:
+                action = clip.get('action', 'copy')
+                action_to_slider = {
+                    'copy': 0,
+                    'term': 1,
+                    'exec': 2
+                }
+                slider_value = action_to_slider.get(action, 0)
+                string = clip.get('string', None)
+                html_string = clip.get('html_string', None)
+                return (slider_value, string, html_string)
         except Exception as e:
             print(f"Erreur lecture JSON: {e}")
         return (0, None)
@@ -570,9 +651,11 @@ class ClipNotesWindow(QMainWindow):
         all_clips_buttons = []
         all_clips_by_link = []
         
+        records = {item.get('alias'): item for item in json_data}
         for name, (action_data, value, action) in sorted_clips:
-            tooltip = value.replace(r'\n', '\n')
-            _, clip_html = get_clip_data_from_data(json_data, name)
+            # Aperçus tronqués calculés à l'enregistrement (contenu complet à défaut)
+            tooltip, clip_html = clip_tooltip_from_record(records.get(name, {}))
+            tooltip = tooltip or value.replace(r'\n', '\n')
             all_clips_buttons.append((name, self.make_handler_sub(name, value, x, y), tooltip, action, clip_html))
             
             func, children, meta = action_data
@@ -873,7 +956,7 @@ class ClipNotesWindow(QMainWindow):
         dialog.setFixedSize(350, 250 if is_image else 180)
         
         if x is None or y is None:
-            screen = QApplication.primaryScreen().geometry()
+            screen = screen_at().geometry()
             x = screen.center().x() - dialog.width() // 2
             y = screen.center().y() - dialog.height() // 2
         dialog.move(x - dialog.width() // 2, y - dialog.height() // 2)
@@ -1036,7 +1119,7 @@ class ClipNotesWindow(QMainWindow):
             elif self.store_mode:
                 handler = self.make_group_child_store_handler(group_alias, child_alias, child_string, child_action, x, y)
             else:
-                handler = self.make_group_child_handler(child_alias, child_string, child_action, group_alias)
+                handler = self.make_group_child_handler(child_alias, child_string, child_action, group_alias, group_child_html(child), exec_kwargs(child))
             
             tooltip = child_string.replace(r'\n', '\n')
             # Format: (label, callback, tooltip)
@@ -1100,20 +1183,21 @@ class ClipNotesWindow(QMainWindow):
             self.store_group_child_clip(group_alias, child_alias, child_string, child_action, x_pos, y_pos)
         return handler
     
-    def make_group_child_handler(self, alias, string, action, group_alias):
+    def make_group_child_handler(self, alias, string, action, group_alias, html_string=None, command_kwargs=None):
         """Crée un handler pour un clip enfant d'un groupe"""
         def handler():
             from utils import paperclip_copy, execute_terminal, execute_command
             
             # Exécuter l'action du clip
             if action == "copy":
-                paperclip_copy(string)
+                paperclip_copy(string, html_string)
                 message = f'"{string}" copié'
             elif action == "term":
                 execute_terminal(string)
                 message = f'"{string}" exécuté dans un terminal'
             elif action == "exec":
-                execute_command(string)
+                # "tracked" suit le clip dans les groupes comme au premier niveau
+                execute_command(string, **(command_kwargs or {}))
                 message = f'"{string}" lancé'
             else:
                 message = None
@@ -1161,7 +1245,7 @@ class ClipNotesWindow(QMainWindow):
             self.tracker.update_pos()
             x, y = self.tracker.last_x, self.tracker.last_y
         if x is None or y is None:
-            screen = QApplication.primaryScreen().geometry()
+            screen = screen_at().geometry()
             x = screen.center().x() - dialog.width() // 2
             y = screen.center().y() - dialog.height() // 2
         dialog.move(x - dialog.width() // 2, y - dialog.height() // 2)
@@ -1250,26 +1334,7 @@ class ClipNotesWindow(QMainWindow):
         emoji_button.installEventFilter(self)
         
         def open_emoji_selector():
-            path = self.emojis_file
-            if not os.path.exists(path):
-                print(f"Fichier introuvable : {path}")
-                return
-            with open(path, "r", encoding="utf-8") as f:
-                emojis = [line.strip() for line in f if line.strip()]
-            selector = EmojiSelector(emojis, parent=dialog)
-
-            def on_emoji_selected(emoji):
-                # Remplacer tout le texte par l'emoji sélectionné
-                icon_input.setFocus()
-                icon_input.setText(emoji)
-                icon_input.setCursorPosition(len(emoji))
-                # update_icon_preview(emoji)
-                selector.accept()
-
-            selector.emoji_selected = on_emoji_selected
-            # if selector.exec() == QDialog.DialogCode.Accepted and selector.selected_emoji:
-            #     icon_input.setText(selector.selected_emoji)
-            selector.exec()
+            self.show_emoji_selector(dialog, icon_input)
         
         emoji_button.clicked.connect(open_emoji_selector)
         icon_row.addWidget(emoji_button)
@@ -1840,11 +1905,77 @@ class ClipNotesWindow(QMainWindow):
         # Réinitialiser la page à 0 pour la prochaine ouverture
         self.current_page = 0
         
-        if self.tracker:
-            self.tracker.close()
+        self.dismiss_tracker()
         if self.current_popup:
             self.current_popup.close()
 
+    def dismiss_tracker(self):
+        """Ferme le tracker, ou le cache simplement en mode résident"""
+        if not self.tracker:
+            return
+        if self.resident:
+            self.tracker.on_click_callback = None
+            self.tracker.hide()
+        else:
+            self.tracker.close()
+
+    def show_at_cursor(self):
+        """
+        Affiche le menu à la position du curseur (commande "show" du daemon).
+        Le tracker doit être visible pour que Wayland remonte la position du curseur.
+        """
+        if not self.tracker:
+            return
+        # Un menu est déjà ouvert : détacher son listener clavier avant de le remplacer
+        if self.current_popup:
+            try:
+                if hasattr(self.current_popup, 'keyboard_listener'):
+                    QApplication.instance().removeEventFilter(self.current_popup.keyboard_listener)
+                self.current_popup.tooltip_window.hide()
+            except RuntimeError:
+                self.current_popup = None
+        self.close_page_selector()
+        self.tracker.show()
+        self.tracker.raise_()
+        if QApplication.platformName() != "wayland":
+            self.tracker.update_pos()
+            self.show_window_at(self.tracker.last_x, self.tracker.last_y, "")
+            return
+        # Wayland : la dernière position connue peut dater de l'affichage précédent.
+        # Afficher dès que l'overlay reçoit la position actuelle (entrée ou mouvement),
+        # sans bloquer la boucle d'événements, ou au bout du délai avec la dernière connue.
+        if self.show_timer is None:
+            self.show_timer = QTimer(self)
+            self.show_timer.setSingleShot(True)
+            self.show_timer.timeout.connect(self.show_at_tracker_pos)
+            self.tracker.position_changed.connect(self.show_at_tracker_pos)
+        self.show_pending = True
+        self.show_timer.start(SHOW_POSITION_TIMEOUT_MS)
+
+    def show_at_tracker_pos(self, *args):
+        """Termine un show_at_cursor en attente, à la position du tracker"""
+        if not self.show_pending:
+            return
+        self.show_pending = False
+        self.show_timer.stop()
+        if not args:
+            # Délai écoulé sans nouvelle position
+            self.tracker.update_pos()
+        self.show_window_at(self.tracker.last_x, self.tracker.last_y, "")
+
+    def hide_menu(self):
+        """Cache le menu et le tracker sans quitter (commande "hide" du daemon)"""
+        # Un affichage encore en attente de position est annulé
+        self.show_pending = False
+        if self.current_popup:
+            try:
+                if self.current_popup.isVisible():
+                    self.current_popup.close_with_animation()
+                    return
+            except RuntimeError:
+                self.current_popup = None
+        self.close_popup()
+
     def create_clip_dialog(self, title, button_text, x, y, initial_name="", initial_value="", 
                            initial_slider_value=0, initial_html=None, placeholder="", on_submit_callback=None, on_close_callback=None):
         dialog = QDialog(self.tracker)
@@ -2227,36 +2358,8 @@ class ClipNotesWindow(QMainWindow):
             if not app_name or len(app_name) < 2:
                 return None
             
-            # Commande qui priorise les grandes icônes (512 > 256 > 128 > etc.)
-            cmd = f'''APP="{app_name}"; (
-                find /usr/share/icons -path "*/512x512/*" -iname "*$APP*.png" 2>/dev/null
-                find /usr/share/icons -path "*/256x256/*" -iname "*$APP*.png" 2>/dev/null
-                find /usr/share/icons -path "*/128x128/*" -iname "*$APP*.png" 2>/dev/null
-                find /usr/share/icons -path "*/96x96/*" -iname "*$APP*.png" 2>/dev/null
-                find /usr/share/icons -path "*/64x64/*" -iname "*$APP*.png" 2>/dev/null
-                find /usr/share/icons -path "*/48x48/*" -iname "*$APP*.png" 2>/dev/null
-                find /usr/share/pixmaps -iname "*$APP*.png" 2>/dev/null
-                find /snap/$APP/current/meta/gui -iname "*.png" 2>/dev/null
-                find /var/lib/flatpak ~/.local/share/flatpak -path "*$APP*/icons/*" -iname "*.png" 2>/dev/null
-            )'''
-            
-            try:
-                result = subprocess.run(
-                    ['bash', '-c', cmd + ' | head -n1'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                icon_path = result.stdout.strip()
-                
-                # Si vide, pas d'icône trouvée
-                if not icon_path:
-                    return None
-                
-                return icon_path
-            except Exception as e:
-                print(f"Erreur lors de la recherche d'icône: {e}")
-                return None
+            # Index construit en arrière-plan au démarrage (voir app_icon_index.py)
+            return get_app_icon_index().find(app_name)
         
         # === Détection en temps réel d'icône d'application ===
         # Styles pour le bouton image
@@ -2286,7 +2389,7 @@ class ClipNotesWindow(QMainWindow):
         """
         image_button.setStyleSheet(image_button_style_normal)
         
-        # Timer pour debounce (éviter trop de requêtes bash)
+        # Timer pour debounce (éviter une recherche à chaque frappe)
         icon_check_timer = QTimer()
         icon_check_timer.setSingleShot(True)
         
@@ -2524,23 +2627,7 @@ class ClipNotesWindow(QMainWindow):
                         print("Erreur lors du chargement de l'image")
 
         def open_emoji_selector():
-            path = self.emojis_file
-            if not os.path.exists(path):
-                print(f"Fichier introuvable : {path}")
-                return
-            with open(path, "r", encoding="utf-8") as f:
-                emojis = [line.strip() for line in f if line.strip()]
-            selector = EmojiSelector(emojis, parent=dialog)
-
-            def on_emoji_selected(emoji):
-                # Remplacer tout le texte par l'emoji sélectionné
-                name_input.setFocus()
-                name_input.setText(emoji)
-                name_input.setCursorPosition(len(emoji))
-                selector.accept()
-
-            selector.emoji_selected = on_emoji_selected
-            selector.exec()
+            self.show_emoji_selector(dialog, name_input)
 
         emoji_button.clicked.connect(open_emoji_selector)
         image_button.clicked.connect(open_image_selector)
@@ -2714,14 +2801,104 @@ class ClipNotesWindow(QMainWindow):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(10)
         
-        # Zone de défilement pour la liste
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setObjectName("stored_clips_scroll")  # Pour pouvoir le retrouver lors du refresh
-        scroll.setStyleSheet("""
-            QScrollArea {
+        # Recherche + réinitialisation du tri
+        top_layout = QHBoxLayout()
+        search_edit = QLineEdit()
+        search_edit.setPlaceholderText("🔍 Rechercher...")
+        search_edit.setClearButtonEnabled(True)
+        search_edit.setStyleSheet("""
+            QLineEdit {
+                background-color: rgba(50, 50, 50, 150);
+                border: 1px solid rgba(100, 100, 100, 150);
+                border-radius: 6px;
+                padding: 4px 8px;
+                color: white;
+            }
+        """)
+        
+        # Bouton de réinitialisation (visible seulement si tri actif)
+        reset_btn = QPushButton("⟳")
+        reset_btn.setFixedSize(30, 26)
+        reset_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        reset_btn.setProperty("help_text", "Réinitialiser l'ordre")
+        reset_btn.installEventFilter(self)
+        reset_btn.setStyleSheet("""
+            QPushButton {
+                background-color: rgba(100, 150, 200, 100);
+                border: 1px solid rgba(100, 150, 200, 150);
+                border-radius: 4px;
+                font-size: 14px;
+                color: white;
+            }
+            QPushButton:hover {
+                background-color: rgba(100, 150, 200, 180);
+            }
+        """)
+        reset_btn.clicked.connect(lambda: self.reset_stored_clips_sort(parent_dialog, x, y))
+        
+        top_layout.addWidget(search_edit)
+        top_layout.addWidget(reset_btn)
+        layout.addLayout(top_layout)
+        
+        # Liste des clips : modèle + proxy de tri/filtre, seules les lignes visibles sont peintes
+        view = QTableView()
+        view.setObjectName("stored_clips_view")
+        model = StoredClipsModel(stored_clips, view)
+        proxy = QSortFilterProxyModel(view)
+        proxy.setSourceModel(model)
+        proxy.setSortRole(StoredClipsModel.SortRole)
+        proxy.setFilterRole(StoredClipsModel.SortRole)
+        proxy.setFilterKeyColumn(-1)
+        proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        search_edit.textChanged.connect(proxy.setFilterFixedString)
+        view.setModel(proxy)
+        
+        delegate = StoredClipsDelegate(self.action_zone_colors, view)
+        delegate.button_clicked.connect(lambda name, clip_data: self.on_stored_clip_button(name, clip_data, parent_dialog, x, y))
+        delegate.help_requested.connect(self.show_dialog_help)
+        view.setItemDelegate(delegate)
+        
+        view.setMouseTracking(True)
+        view.setShowGrid(False)
+        view.setWordWrap(False)
+        view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        # Hauteur de ligne fixe : la vue n'a pas à mesurer chaque ligne
+        view.verticalHeader().setVisible(False)
+        view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        view.verticalHeader().setDefaultSectionSize(54)
+        
+        header = view.horizontalHeader()
+        header.setHighlightSections(False)
+        header.setSortIndicatorShown(True)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(StoredClipsModel.COLUMNS.index("string"), QHeaderView.ResizeMode.Stretch)
+        for column, width in (("alias", 54), ("action", 80), ("created_at", 120), ("buttons", StoredClipsDelegate.BUTTONS_WIDTH)):
+            view.setColumnWidth(StoredClipsModel.COLUMNS.index(column), width)
+        header.setSectionsClickable(True)
+        header.sectionClicked.connect(
+            lambda section: self.toggle_stored_clips_sort(StoredClipsModel.COLUMNS[section], parent_dialog, x, y)
+            if StoredClipsModel.COLUMNS[section] != "buttons" else self.apply_stored_clips_sort()
+        )
+        
+        view.setStyleSheet("""
+            QTableView {
+                background-color: transparent;
+                border: none;
+            }
+            QHeaderView::section {
+                font-weight: bold;
+                color: white;
                 background-color: transparent;
                 border: none;
+                border-bottom: 1px solid rgba(100, 100, 100, 150);
+                padding: 4px 0px;
+            }
+            QHeaderView::section:hover {
+                color: rgba(200, 200, 255, 255);
             }
             QScrollBar:vertical {
                 background-color: rgba(50, 50, 50, 100);
@@ -2738,319 +2915,36 @@ class ClipNotesWindow(QMainWindow):
             }
         """)
         
-        scroll_content = QWidget()
-        scroll_content.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        scroll_layout = QVBoxLayout(scroll_content)
-        scroll_layout.setSpacing(5)
-        
-        if not stored_clips:
-            empty_label = QLabel("Aucun clip stocké")
-            empty_label.setStyleSheet("color: gray; padding: 20px; font-style: italic;")
-            empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            scroll_layout.addWidget(empty_label)
-        else:
-            # Appliquer le tri
-            sorted_clips = self.sort_stored_clips(stored_clips, self.stored_clips_sort_column, self.stored_clips_sort_ascending)
-            
-            # Indicateur de tri
-            def get_sort_indicator(column):
-                if self.stored_clips_sort_column == column:
-                    return " ↑" if self.stored_clips_sort_ascending else " ↓"
-                return ""
-            
-            # Style commun pour les boutons d'en-tête (apparence de header)
-            header_btn_style = """
-                QPushButton {
-                    font-weight: bold;
-                    color: white;
-                    background-color: transparent;
-                    border: none;
-                    padding: 4px 0px;
-                    text-align: left;
-                }
-                QPushButton:hover {
-                    color: rgba(200, 200, 255, 255);
-                }
-            """
-            
-            # En-tête avec boutons cliquables
-            header_layout = QHBoxLayout()
-            
-            alias_header = QPushButton(f"Alias{get_sort_indicator('alias')}")
-            alias_header.setStyleSheet(header_btn_style)
-            alias_header.setFixedWidth(50)
-            alias_header.setCursor(Qt.CursorShape.PointingHandCursor)
-            alias_header.clicked.connect(lambda: self.toggle_stored_clips_sort('alias', parent_dialog, x, y))
-            
-            action_header = QPushButton(f"Action{get_sort_indicator('action')}")
-            action_header.setStyleSheet(header_btn_style)
-            action_header.setFixedWidth(80)
-            action_header.setCursor(Qt.CursorShape.PointingHandCursor)
-            action_header.clicked.connect(lambda: self.toggle_stored_clips_sort('action', parent_dialog, x, y))
-            
-            value_header = QPushButton(f"Valeur{get_sort_indicator('string')}")
-            value_header.setStyleSheet(header_btn_style)
-            value_header.setCursor(Qt.CursorShape.PointingHandCursor)
-            value_header.clicked.connect(lambda: self.toggle_stored_clips_sort('string', parent_dialog, x, y))
-            
-            date_header = QPushButton(f"Date{get_sort_indicator('created_at')}")
-            date_header.setStyleSheet(header_btn_style)
-            date_header.setFixedWidth(120)
-            date_header.setCursor(Qt.CursorShape.PointingHandCursor)
-            date_header.clicked.connect(lambda: self.toggle_stored_clips_sort('created_at', parent_dialog, x, y))
-            
-            # Bouton de réinitialisation (visible seulement si tri actif)
-            reset_btn = QPushButton("⟳")
-            reset_btn.setFixedSize(30, 26)
-            reset_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            reset_btn.setProperty("help_text", "Réinitialiser l'ordre")
-            reset_btn.installEventFilter(self)
-            reset_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: rgba(100, 150, 200, 100);
-                    border: 1px solid rgba(100, 150, 200, 150);
-                    border-radius: 4px;
-                    font-size: 14px;
-                    color: white;
-                }
-                QPushButton:hover {
-                    background-color: rgba(100, 150, 200, 180);
-                }
-            """)
-            reset_btn.clicked.connect(lambda: self.reset_stored_clips_sort(parent_dialog, x, y))
-            reset_btn.setVisible(self.stored_clips_sort_column is not None)
-            
-            header_layout.addWidget(alias_header)
-            header_layout.addWidget(action_header)
-            header_layout.addWidget(value_header)
-            header_layout.addStretch()
-            header_layout.addWidget(date_header)
-            # Spacer pour aligner avec les boutons des lignes (6 boutons de 30px + spacing 10px = 190px)
-            header_layout.addSpacing(190)
-            header_layout.addWidget(reset_btn)
-            
-            scroll_layout.addLayout(header_layout)
-            
-            # Ligne de séparation
-            separator = QLabel()
-            separator.setFixedHeight(1)
-            separator.setStyleSheet("background-color: rgba(100, 100, 100, 150);")
-            scroll_layout.addWidget(separator)
-            
-            # Liste des clips (triés)
-            for clip_data in sorted_clips:
-                clip_layout = QHBoxLayout()
-                
-                alias = clip_data.get('alias', '')
-                
-                # Alias (image, emoji ou texte)
-                alias_label = QLabel()
-                alias_label.setFixedSize(50, 50)
-                
-                if "/" in alias:
-                    # C'est une image - vérifier si elle existe encore
-                    if os.path.exists(alias):
-                        pixmap = image_pixmap(alias, 48)
-                        alias_label.setPixmap(pixmap)
-                        alias_label.setScaledContents(True)
-                    else:
-                        # Image manquante - afficher un placeholder
-                        alias_label.setText("🖼️")
-                        alias_label.setStyleSheet("color: gray; font-size: 32px;")
-                        alias_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                elif is_emoji(alias):
-                    # C'est un emoji
-                    pixmap = emoji_pixmap(alias, 32)
-                    alias_label.setPixmap(pixmap)
-                    alias_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                else:
-                    # C'est du texte
-                    alias_label.setText(alias)
-                    alias_label.setStyleSheet("color: white;")
-                    alias_label.setWordWrap(True)
-                    alias_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                
-                # Action "✂️", "💻", "🚀"
-                actions_readable = {
-                    "copy" : "copier",
-                    "term" : "exécuter terminal",
-                    "exec" : "exécuter",
-                }
-
-                actions_readable_tooltip = {
-                    "copy" : "copie la valeur dans le presse-papier",
-                    "term" : "exécute la valeur dans un terminal",
-                    "exec" : "exécute la valeur hors terminal",
-                }
-                
-                action_label = QLabel(actions_readable.get(clip_data.get('action', 'copy'), 'copy'))
-                action_label.setFixedWidth(80)
-                action_label.setProperty("help_text", actions_readable_tooltip.get(clip_data.get('action', 'copy'), ''))
-                action_label.installEventFilter(self)
-                action_label.setStyleSheet("color: lightblue;")
-                action_label.setWordWrap(True)
-                
-                # String (tronquée si trop longue)
-                string = clip_data.get('string', '')
-                html_string = clip_data.get('html_string', None)
-                string_display = string[:50] + "..." if len(string) > 50 else string
-                string_label = QLabel(string_display)
-                help_text = string.replace(r"\n", "\n")
-                string_label.setProperty("help_text", help_text)
-                string_label.setProperty("html_string", html_string)
-                string_label.installEventFilter(self)
-                string_label.setStyleSheet("color: white;")
-                string_label.setWordWrap(True)
-                
-                # Date de création
-                created_at = clip_data.get('created_at', '')
-                if created_at:
-                    try:
-                        from datetime import datetime
-                        dt = datetime.fromisoformat(created_at)
-                        date_display = dt.strftime("%d/%m/%Y %H:%M")
-                    except:
-                        date_display = created_at[:16] if len(created_at) > 16 else created_at
-                else:
-                    date_display = "-"
-                date_label = QLabel(date_display)
-                date_label.setFixedWidth(120)
-                date_label.setStyleSheet("color: rgba(180, 180, 180, 255); font-size: 11px;")
-                date_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                
-                # Convertir l'action en slider_value
-                action = clip_data.get('action', 'copy')
-                action_to_slider = {'copy': 0, 'term': 1, 'exec': 2}
-                slider_value = action_to_slider.get(action, 0)
-                
-                # Bouton restaurer
-                restore_btn = QPushButton("↩️")
-                restore_btn.setFixedSize(30, 30)
-                restore_btn.setProperty("help_text", "Restaurer")
-                restore_btn.installEventFilter(self)
-                restore_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: rgba(100, 200, 100, 100);
-                        border: 1px solid rgba(100, 255, 100, 150);
-                        border-radius: 10px;
-                    }
-                    QPushButton:hover {
-                        background-color: rgba(100, 255, 100, 150);
-                    }
-                """)
-                restore_btn.clicked.connect(lambda checked, a=alias, cd=clip_data, d=parent_dialog: self.restore_clip_to_menu_from_tab(a, cd, d, x, y))
-                
-                # Bouton Editer
-                edit_btn = QPushButton("🔧")
-                edit_btn.setFixedSize(30, 30)
-                edit_btn.setProperty("help_text", "Modifier")
-                edit_btn.installEventFilter(self)
-                edit_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: rgba(255, 255, 150, 100);
-                        border: 1px solid rgba(255, 255, 150, 150);
-                        border-radius: 10px;
-                    }
-                    QPushButton:hover {
-                        background-color: rgba(255, 255, 150, 150);
-                    }
-                """)
-                edit_btn.clicked.connect(lambda checked, a=alias, s=string, sv=slider_value, d=parent_dialog, hs=html_string: self.edit_clip_from_storage_tab(a, s, x, y, sv, d, hs))
-
-                # Bouton supprimer
-                delete_btn = QPushButton("🗑️")
-                delete_btn.setFixedSize(30, 30)
-                delete_btn.setProperty("help_text", "Supprimer")
-                delete_btn.installEventFilter(self)
-                delete_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: rgba(255, 100, 100, 100);
-                        border: 1px solid rgba(255, 100, 100, 150);
-                        border-radius: 10px;
-                    }
-                    QPushButton:hover {
-                        background-color: rgba(255, 100, 100, 150);
-                    }
-                """)
-                delete_btn.clicked.connect(lambda checked, a=alias, d=parent_dialog: self.delete_stored_clip_and_refresh_tab(a, d, x, y))
-
-                # Bouton Copier
-                copy_btn = QPushButton("✂️")
-                copy_btn.setFixedSize(30, 30)
-                copy_btn.setProperty("help_text", "Copier dans le presse-papier")
-                copy_btn.installEventFilter(self)
-                r, g, b = self.action_zone_colors.get("copy", (98, 160, 234))
-                copy_btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: rgba({r}, {g}, {b}, 100);
-                        border: 1px solid rgba({r}, {g}, {b}, 150);
-                        border-radius: 10px;
-                        Padding-left: 10px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: rgba({r}, {g}, {b}, 150);
-                    }}
-                """)
-                copy_btn.clicked.connect(lambda checked, s=string: paperclip_copy(s))
-
-                # Bouton Lancer
-                term_btn = QPushButton("💻")
-                term_btn.setFixedSize(30, 30)
-                term_btn.setProperty("help_text", "Lancer dans un terminal")
-                term_btn.installEventFilter(self)
-                r, g, b = self.action_zone_colors.get("term", (248, 228, 92))
-                term_btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: rgba({r}, {g}, {b}, 100);
-                        border: 1px solid rgba({r}, {g}, {b}, 150);
-                        border-radius: 10px;
-                        Padding-left: 10px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: rgba({r}, {g}, {b}, 150);
-                    }}
-                """)
-                term_btn.clicked.connect(lambda checked, s=string: execute_terminal(s))
-
-                # Bouton Lancer dans un terminal
-                exec_btn = QPushButton("🚀")
-                exec_btn.setFixedSize(30, 30)
-                exec_btn.setProperty("help_text", "Lancer")
-                exec_btn.installEventFilter(self)
-                r, g, b = self.action_zone_colors.get("exec", (224, 27, 36))
-                exec_btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: rgba({r}, {g}, {b}, 100);
-                        border: 1px solid rgba({r}, {g}, {b}, 150);
-                        border-radius: 10px;
-                        Padding-left: 10px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: rgba({r}, {g}, {b}, 150);
-                    }}
-                """)
-
-                exec_btn.clicked.connect(lambda checked, s=string: execute_command(s))
-                
-                clip_layout.addWidget(alias_label)
-                clip_layout.addWidget(action_label)
-                clip_layout.addWidget(string_label)
-                clip_layout.addStretch()
-                clip_layout.addWidget(date_label)
-                clip_layout.addWidget(restore_btn)
-                clip_layout.addWidget(edit_btn)
-                # clip_layout.addWidget(edit_sys_btn)
-                clip_layout.addWidget(delete_btn)
-                clip_layout.addSpacing(10)
-                clip_layout.addWidget(copy_btn)
-                clip_layout.addWidget(term_btn)
-                clip_layout.addWidget(exec_btn)
-                
-                scroll_layout.addLayout(clip_layout)
-        
-        scroll_layout.addStretch()
-        scroll.setWidget(scroll_content)
-        layout.addWidget(scroll)
+        # Aide sous la liste au survol des cellules (comme les autres widgets du dialogue)
+        def on_entered(index):
+            help_data = index.data(StoredClipsModel.HelpRole)
+            if help_data and help_data[0]:
+                self.show_dialog_help(*help_data)
+            else:
+                self.clear_dialog_help()
+        view.entered.connect(on_entered)
+        view.viewport().installEventFilter(self)
+        
+        empty_label = QLabel("Aucun clip stocké")
+        empty_label.setStyleSheet("color: gray; padding: 20px; font-style: italic;")
+        empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        def update_empty_state():
+            is_empty = model.rowCount() == 0
+            empty_label.setVisible(is_empty)
+            view.setVisible(not is_empty)
+        model.modelReset.connect(update_empty_state)
+        model.rowsRemoved.connect(update_empty_state)
+        
+        layout.addWidget(empty_label)
+        layout.addWidget(view)
+        
+        self.stored_clips_model = model
+        self.stored_clips_proxy = proxy
+        self.stored_clips_view = view
+        self.stored_clips_reset_btn = reset_btn
+        update_empty_state()
+        self.apply_stored_clips_sort()
         
         # Conteneur pour le preview adaptatif
         preview_container = QWidget()
@@ -3093,11 +2987,32 @@ class ClipNotesWindow(QMainWindow):
         
         return container
     
+    def on_stored_clip_button(self, name, clip_data, parent_dialog, x, y):
+        """Clic sur un des boutons d'une ligne de l'onglet des clips stockés"""
+        alias = clip_data.get('alias', '')
+        string = clip_data.get('string', '')
+        html_string = clip_data.get('html_string', None)
+        if name == "restore":
+            self.restore_clip_to_menu_from_tab(alias, clip_data, parent_dialog, x, y)
+        elif name == "edit":
+            # Convertir l'action en slider_value
+            action_to_slider = {'copy': 0, 'term': 1, 'exec': 2}
+            slider_value = action_to_slider.get(clip_data.get('action', 'copy'), 0)
+            self.edit_clip_from_storage_tab(alias, string, x, y, slider_value, parent_dialog, html_string)
+        elif name == "delete":
+            self.delete_stored_clip_and_refresh_tab(alias, parent_dialog, x, y)
+        elif name == "copy":
+            paperclip_copy(string, html_string)
+        elif name == "term":
+            execute_terminal(string)
+        elif name == "exec":
+            execute_command(string, **exec_kwargs(clip_data))
+
     def restore_clip_to_menu_from_tab(self, alias, clip_data, parent_dialog, x, y):
         """Restaure un clip depuis l'onglet des clips stockés"""
         self.restore_clip_to_menu(alias, clip_data, None, x, y)
-        # Rafraîchir l'onglet des clips stockés
-        self.refresh_stored_clips_tab(parent_dialog, x, y)
+        # Retirer la ligne de l'onglet des clips stockés
+        self.remove_stored_clip_row(alias, parent_dialog, x, y)
     
     def edit_clip_from_storage_tab(self, alias, string, x, y, slider_value, parent_dialog, html_string):
         """Édite un clip depuis l'onglet des clips stockés"""
@@ -3216,8 +3131,8 @@ class ClipNotesWindow(QMainWindow):
                 self.current_popup.tooltip_window.show_message(f"✓ {display_name} supprimé", 1500)
                 self.current_popup.update_tooltip_position()
             
-            # Rafraîchir l'onglet des clips stockés
-            self.refresh_stored_clips_tab(parent_dialog, x, y)
+            # Retirer la ligne de l'onglet des clips stockés
+            self.remove_stored_clip_row(alias, parent_dialog, x, y)
         
         delete_button.clicked.connect(confirm_delete)
         
@@ -3232,52 +3147,34 @@ class ClipNotesWindow(QMainWindow):
         confirm_dialog.exec()
     
     def refresh_stored_clips_tab(self, parent_dialog, x, y):
-        """Rafraîchit l'onglet des clips stockés dans le dialogue de configuration"""
-        # Trouver le QTabWidget dans le dialogue
-        tabs = parent_dialog.findChild(QTabWidget)
-        if tabs:
-            # Trouver l'onglet des clips stockés (index 2)
-            for i in range(tabs.count()):
-                if "Clips stockés" in tabs.tabText(i):
-                    old_widget = tabs.widget(i)
-                    old_layout = old_widget.layout()
-                    if old_layout:
-                        # Trouver et supprimer uniquement le widget des clips stockés (premier widget)
-                        # en conservant le layout des boutons (Fermer, etc.)
-                        old_scroll = old_widget.findChild(QScrollArea, "stored_clips_scroll")
-                        if old_scroll:
-                            # Trouver le widget parent contenant le scroll (c'est le container retourné par create_stored_clips_widget)
-                            old_container = old_scroll.parent()
-                            if old_container and old_container != old_widget:
-                                # Trouver l'index de l'ancien container dans le layout
-                                idx = old_layout.indexOf(old_container)
-                                if idx >= 0:
-                                    # Retirer proprement du layout
-                                    old_layout.takeAt(idx)
-                                old_container.setParent(None)
-                                old_container.deleteLater()
-                                # Créer le nouveau contenu
-                                new_content = self.create_stored_clips_widget(parent_dialog, x, y)
-                                # Insérer au début du layout (avant le bouton Fermer)
-                                old_layout.insertWidget(0, new_content)
-                            else:
-                                # Fallback: supprimer seulement le premier item
-                                child = old_layout.takeAt(0)
-                                if child and child.widget():
-                                    child.widget().setParent(None)
-                                    child.widget().deleteLater()
-                                new_content = self.create_stored_clips_widget(parent_dialog, x, y)
-                                old_layout.insertWidget(0, new_content)
-                        else:
-                            # Fallback si pas de scroll trouvé: supprimer seulement le premier item
-                            if old_layout.count() > 0:
-                                child = old_layout.takeAt(0)
-                                if child and child.widget():
-                                    child.widget().setParent(None)
-                                    child.widget().deleteLater()
-                            new_content = self.create_stored_clips_widget(parent_dialog, x, y)
-                            old_layout.insertWidget(0, new_content)
-                    break
+        """Rafraîchit l'onglet des clips stockés : relit le fichier dans le modèle existant"""
+        try:
+            if self.stored_clips_model is not None:
+                self.stored_clips_model.set_clips(self.load_stored_clips())
+        except RuntimeError:
+            # Le dialogue a été fermé
+            self.stored_clips_model = None
+
+    def remove_stored_clip_row(self, alias, parent_dialog, x, y):
+        """Retire la ligne d'un clip de l'onglet, sans relire le fichier ni reconstruire la liste"""
+        try:
+            if self.stored_clips_model is not None and self.stored_clips_model.remove_clip(alias):
+                return
+        except RuntimeError:
+            self.stored_clips_model = None
+            return
+        self.refresh_stored_clips_tab(parent_dialog, x, y)
+
+    def update_stored_clip_row(self, old_alias, new_alias, parent_dialog, x, y):
+        """Met à jour la ligne d'un clip modifié dans l'onglet (dataChanged sur cette ligne seulement)"""
+        clip = get_clip_record(self.clip_notes_file_json, new_alias)
+        try:
+            if self.stored_clips_model is not None and clip is not None and self.stored_clips_model.update_clip(old_alias, clip):
+                return
+        except RuntimeError:
+            self.stored_clips_model = None
+            return
+        self.refresh_stored_clips_tab(parent_dialog, x, y)
 
     def show_stored_clips_dialog(self, x, y):
         """Affiche la fenêtre de dialogue avec la liste des clips stockés"""
@@ -3718,11 +3615,11 @@ class ClipNotesWindow(QMainWindow):
         
         # Ajouter directement dans actions_map_sub pour mise à jour immédiate
         if action == "copy":
-            self.actions_map_sub[alias] = [(paperclip_copy, [string], {}), string, action]
+            self.actions_map_sub[alias] = [(paperclip_copy, [string], copy_kwargs(clip_data.get('html_string'))), string, action]
         elif action == "term":
             self.actions_map_sub[alias] = [(execute_terminal, [string], {}), string, action]
         elif action == "exec":
-            self.actions_map_sub[alias] = [(execute_command, [string], {}), string, action]
+            self.actions_map_sub[alias] = [(execute_command, [string], exec_kwargs(clip_data)), string, action]
         
         # Mettre à jour le menu radial
         self.refresh_menu()
@@ -3802,8 +3699,7 @@ class ClipNotesWindow(QMainWindow):
         
         # Charger les clips depuis le JSON
         try:
-            with open(self.clip_notes_file_json, 'r', encoding='utf-8') as f:
-                all_clips = json.load(f)
+            all_clips = load_all_clips_data(self.clip_notes_file_json)
         except Exception:
             all_clips = []
         
@@ -4112,7 +4008,7 @@ class ClipNotesWindow(QMainWindow):
         """)
         
         if x is None or y is None:
-            screen = QApplication.primaryScreen().geometry()
+            screen = screen_at().geometry()
             x = screen.center().x() - dialog.width() // 2
             y = screen.center().y() - dialog.height() // 2
         dialog.move(x, y)
@@ -5308,9 +5204,17 @@ class ClipNotesWindow(QMainWindow):
         stored_clips_buttons_layout.addWidget(stored_clips_close_btn)
         stored_clips_layout.addLayout(stored_clips_buttons_layout)
 
+        # ========== Onglet Exécutions ==========
+        runs_tab = QWidget()
+        runs_tab.setStyleSheet(self.dialog_style)
+        runs_layout = QVBoxLayout(runs_tab)
+        runs_layout.setContentsMargins(30, 20, 30, 20)
+        runs_layout.addWidget(RecentRunsView(get_action_runner(), runs_tab))
+
         tabs.addTab(config_tab, "⚙️ Configuration")
         tabs.addTab(shortcuts_dialog_tab, "⌨️ Raccourcis clavier")
         tabs.addTab(stored_clips_tab, "📋 Clips stockés")
+        tabs.addTab(runs_tab, "▶️ Exécutions")
         
         dialog.exec()
         
@@ -5331,12 +5235,12 @@ class ClipNotesWindow(QMainWindow):
         # Créer et afficher la fenêtre des raccourcis
         shortcuts_window = KeyboardShortcutsManager(self, self.current_popup, self.nb_icons_menu)
         
-        # Centrer la fenêtre sur l'écran
-        screen = QApplication.primaryScreen()
+        # Centrer la fenêtre sur l'écran du curseur
+        screen = screen_at(x, y)
         if screen:
             screen_geometry = screen.availableGeometry()
-            window_x = (screen_geometry.width() - shortcuts_window.width()) // 2
-            window_y = (screen_geometry.height() - shortcuts_window.height()) // 2
+            window_x = screen_geometry.x() + (screen_geometry.width() - shortcuts_window.width()) // 2
+            window_y = screen_geometry.y() + (screen_geometry.height() - shortcuts_window.height()) // 2
             shortcuts_window.move(window_x, window_y)
         else:
             shortcuts_window.move(x - shortcuts_window.width() // 2, y - shortcuts_window.height() // 2)
@@ -5377,7 +5281,7 @@ class ClipNotesWindow(QMainWindow):
                 
                 # Format: [(fonction, [args], {}), value, action]
                 if action == "copy":
-                    self.actions_map_sub[name] = [(paperclip_copy, [value], {}), value, action]
+                    self.actions_map_sub[name] = [(paperclip_copy, [value], copy_kwargs(html_to_save)), value, action]
                 elif action == "term":
                     self.actions_map_sub[name] = [(execute_terminal, [value], {}), value, action]
                 elif action == "exec":
@@ -5447,11 +5351,7 @@ class ClipNotesWindow(QMainWindow):
         # Charger les clips existants pour trouver le prochain numéro
         existing_aliases = set()
         try:
-            if os.path.exists(self.clip_notes_file_json):
-                with open(self.clip_notes_file_json, 'r', encoding='utf-8') as f:
-                    clips = json.load(f)
-                    for clip in clips:
-                        existing_aliases.add(clip.get('alias', ''))
+            existing_aliases = set(get_clip_store(self.clip_notes_file_json).index.by_alias)
         except Exception as e:
             print(f"Erreur lecture clips: {e}")
         
@@ -5468,7 +5368,7 @@ class ClipNotesWindow(QMainWindow):
         action = "copy"  # Par défaut, action "copy"
         
         # Ajouter le clip
-        self.actions_map_sub[alias] = [(paperclip_copy, [value], {}), value, action]
+        self.actions_map_sub[alias] = [(paperclip_copy, [value], copy_kwargs(html_to_save)), value, action]
         append_to_actions_file_json(self.clip_notes_file_json, alias, value, action, html_to_save)
         
         # Rafraîchir le menu
@@ -5561,11 +5461,11 @@ class ClipNotesWindow(QMainWindow):
                 else:
                     # Seulement pour le menu radial : ajouter à actions_map_sub
                     if action == "copy":
-                        self.actions_map_sub[new_name] = [(paperclip_copy, [new_value], {}), new_value, action]
+                        self.actions_map_sub[new_name] = [(paperclip_copy, [new_value], copy_kwargs(new_html_to_save)), new_value, action]
                     elif action == "term":
                         self.actions_map_sub[new_name] = [(execute_terminal, [new_value], {}), new_value, action]
                     elif action == "exec":
-                        self.actions_map_sub[new_name] = [(execute_command, [new_value], {}), new_value, action]
+                        self.actions_map_sub[new_name] = [(execute_command, [new_value], exec_kwargs(get_clip_record(self.clip_notes_file_json, old_name))), new_value, action]
                     
                     # Sauvegarder dans le menu radial avec le HTML si présent
                     replace_or_append_json(self.clip_notes_file_json, new_name, new_value, action, new_html_to_save)
@@ -5583,17 +5483,16 @@ class ClipNotesWindow(QMainWindow):
                     # Rouvrir immédiatement la fenêtre de stockage
                     self.show_stored_clips_dialog(x, y)
                 elif context == "from_tab":
-                    # Rafraîchir l'onglet des clips stockés
+                    # Ne mettre à jour que la ligne du clip modifié dans l'onglet
                     if tab_parent_dialog:
-                        self.refresh_stored_clips_tab(tab_parent_dialog, x, y)
+                        self.update_stored_clip_row(old_name, new_name, tab_parent_dialog, x, y)
             else:
                 print("Les deux champs doivent être remplis")
 
         def get_on_close_callback():
             if context == "from_storage":
                 return lambda: self.show_stored_clips_dialog(x, y)
-            elif context == "from_tab" and tab_parent_dialog:
-                return lambda: self.refresh_stored_clips_tab(tab_parent_dialog, x, y)
+            # Depuis l'onglet : une modification annulée ne change rien à rafraîchir
             return None
         
         self.create_clip_dialog(
@@ -5647,9 +5546,11 @@ class ClipNotesWindow(QMainWindow):
         all_clips_buttons = []
         all_clips_by_link = []
         
+        records = {item.get('alias'): item for item in json_data}
         for name, (action_data, value, action) in sorted_clips:
-            tooltip = value.replace(r'\n', '\n')
-            _, clip_html = get_clip_data_from_data(json_data, name)
+            # Aperçus tronqués calculés à l'enregistrement (contenu complet à défaut)
+            tooltip, clip_html = clip_tooltip_from_record(records.get(name, {}))
+            tooltip = tooltip or value.replace(r'\n', '\n')
             all_clips_buttons.append((name, self.make_handler_sub(name, value, x, y), tooltip, action, clip_html))
             
             func, children, meta = action_data
@@ -5694,7 +5595,7 @@ class ClipNotesWindow(QMainWindow):
                 clips_by_link.append(1)
         clips_by_link.extend(page_clips_by_link)
 
-        self.current_popup = RadialMenu(x, y, self.buttons_sub, parent=self.tracker, sub=True, tracker=self.tracker, app_instance=self, neon_color=self.neon_color, action_zone_colors=self.action_zone_colors, nb_icons_menu=self.nb_icons_menu, show_central_icon=self.show_central_icon, menu_background_color=self.menu_background_color, zone_basic_opacity=self.zone_basic_opacity, zone_hover_opacity=self.zone_hover_opacity, clips_by_link=clips_by_link, shadow_offset=self.shadow_offset, shadow_color=self.shadow_color, shadow_enabled=self.shadow_enabled, shadow_angle=self.shadow_angle)
+        self.current_popup = RadialMenu(x, y, self.buttons_sub, parent=self.tracker, sub=True, tracker=self.tracker, app_instance=self, neon_color=self.neon_color, action_zone_colors=self.action_zone_colors, nb_icons_menu=self.nb_icons_menu, show_central_icon=self.show_central_icon, menu_background_color=self.menu_background_color, zone_basic_opacity=self.zone_basic_opacity, zone_hover_opacity=self.zone_hover_opacity, clips_by_link=clips_by_link, shadow_offset=self.shadow_offset, shadow_color=self.shadow_color, shadow_enabled=self.shadow_enabled, shadow_angle=self.shadow_angle, menu_engine=self.menu_engine)
         self.current_popup.show()
         self.current_popup.animate_open()
         
@@ -5703,11 +5604,14 @@ class ClipNotesWindow(QMainWindow):
         
         # Activer le néon bleu clignotant dès l'ouverture
         self.current_popup.toggle_neon(self.central_neon)
-        self.current_popup.timer.start(self.neon_speed)
+        if self.central_neon:
+            self.current_popup.timer.start(self.neon_speed)
         
         # ===== Créer le sélecteur de pages si nécessaire =====
         if self.total_pages > 1:
             self.create_page_selector(x, y)
+        # Préparer les icônes des pages voisines pendant que le menu s'ouvre
+        self.prerender_adjacent_pages()
 
     def create_page_selector(self, x, y):
         """Crée le sélecteur de pages au-dessus du menu radial"""
@@ -5747,42 +5651,67 @@ class ClipNotesWindow(QMainWindow):
         """)
         
         # Créer les boutons de page
+        self.page_selector_buttons = []
         for page_num in range(self.total_pages):
             btn = QPushButton(str(page_num + 1))
             btn.setFixedSize(28, 28)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            r, g, b = self.menu_background_color
             # Style différent pour la page actuelle
-            if page_num == self.current_page:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: rgba({r}, {g}, {b}, 200);
-                        border: none;
-                        border-radius: 14px;
-                        color: white;
-                        font-size: 12px;
-                        font-weight: bold;
-                    }}
-                """)
-            else:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: rgba({r}, {g}, {b}, 30);
-                        border: none;
-                        border-radius: 14px;
-                        color: rgba(255, 255, 255, 150);
-                        font-size: 12px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: rgba({r}, {g}, {b}, 80);
-                        color: white;
-                    }}
-                """)
+            btn.setStyleSheet(self.page_button_style(page_num == self.current_page))
+            btn.setProperty("is_current", page_num == self.current_page)
             
             # Connecter le clic
             btn.clicked.connect(lambda checked, p=page_num: self.go_to_page(p))
             layout.addWidget(btn)
+            self.page_selector_buttons.append(btn)
+        
+        self.position_page_selector(x, y)
+        
+        # Opacité initiale basse
+        self.page_selector.setWindowOpacity(0.4)
         
+        # Événements pour changer l'opacité au hover
+        def on_enter(event):
+            self.page_selector.setWindowOpacity(1.0)
+        
+        def on_leave(event):
+            self.page_selector.setWindowOpacity(0.4)
+        
+        self.page_selector.enterEvent = on_enter
+        self.page_selector.leaveEvent = on_leave
+        
+        self.page_selector.show()
+
+    def page_button_style(self, is_current):
+        """Feuille de style d'un numéro de page (page actuelle ou non)"""
+        r, g, b = self.menu_background_color
+        if is_current:
+            return f"""
+                QPushButton {{
+                    background-color: rgba({r}, {g}, {b}, 200);
+                    border: none;
+                    border-radius: 14px;
+                    color: white;
+                    font-size: 12px;
+                    font-weight: bold;
+                }}
+            """
+        return f"""
+                QPushButton {{
+                    background-color: rgba({r}, {g}, {b}, 30);
+                    border: none;
+                    border-radius: 14px;
+                    color: rgba(255, 255, 255, 150);
+                    font-size: 12px;
+                }}
+                QPushButton:hover {{
+                    background-color: rgba({r}, {g}, {b}, 80);
+                    color: white;
+                }}
+            """
+
+    def position_page_selector(self, x, y):
+        """Place le sélecteur de pages au-dessus du menu radial"""
         # Calculer la position (en dessous du menu radial et des tooltips)
         selector_width = self.total_pages * 32 + 16  # 28 par bouton + spacing + margins
         selector_height = 36
@@ -5799,30 +5728,37 @@ class ClipNotesWindow(QMainWindow):
             # Au dessus
             menu_geometry = self.current_popup.geometry()
             menu_top = menu_geometry.y()
-            selector_x = x - selector_width // 2
+            # Centre réel du menu (déplacé s'il touchait le bord de l'écran)
+            selector_x = menu_geometry.center().x() - selector_width // 2
             selector_y = menu_top - selector_height + 6  # 12px de marge
 
         else:
             selector_x = x - selector_width // 2
             selector_y = y + 200
         
-        self.page_selector.move(int(selector_x), int(selector_y))
+        # Rester sur l'écran actif
+        center_x, center_y = clamp_center_to_screen(
+            selector_x + selector_width // 2, selector_y + selector_height // 2,
+            selector_width // 2, selector_height // 2
+        )
+        self.page_selector.move(int(center_x - selector_width // 2), int(center_y - selector_height // 2))
         self.page_selector.adjustSize()
-        
-        # Opacité initiale basse
-        self.page_selector.setWindowOpacity(0.4)
-        
-        # Événements pour changer l'opacité au hover
-        def on_enter(event):
-            self.page_selector.setWindowOpacity(1.0)
-        
-        def on_leave(event):
-            self.page_selector.setWindowOpacity(0.4)
-        
-        self.page_selector.enterEvent = on_enter
-        self.page_selector.leaveEvent = on_leave
-        
-        self.page_selector.show()
+
+    def update_page_selector(self, x, y):
+        """Met à jour le sélecteur existant (page actuelle, position) sans le recréer"""
+        if not self.page_selector or len(self.page_selector_buttons) != self.total_pages:
+            self.create_page_selector(x, y)
+            return
+        try:
+            for page_num, btn in enumerate(self.page_selector_buttons):
+                is_current = page_num == self.current_page
+                # Seuls l'ancien et le nouveau numéro de page changent de style
+                if btn.property("is_current") != is_current:
+                    btn.setStyleSheet(self.page_button_style(is_current))
+                    btn.setProperty("is_current", is_current)
+            self.position_page_selector(x, y)
+        except RuntimeError:
+            self.create_page_selector(x, y)
 
     def go_to_page(self, page_number):
         """Navigue vers une page spécifique avec animation flip"""
@@ -5898,60 +5834,42 @@ class ClipNotesWindow(QMainWindow):
         self.flip_animation.start()
 
     def _complete_page_change(self, page_number, x, y):
-        """Termine le changement de page après l'animation"""
+        """
+        Termine le changement de page après l'animation.
+        Le menu, ses boutons, son listener clavier et le sélecteur de pages sont
+        réutilisés : seul le contenu de la page est remplacé.
+        """
         # Mettre à jour la page actuelle
         self.current_page = page_number
         
-        # Fermer l'ancien sélecteur
-        if hasattr(self, 'page_selector') and self.page_selector:
-            try:
-                self.page_selector.close()
-                self.page_selector.deleteLater()
-            except RuntimeError:
-                pass
-            self.page_selector = None
+        if not self.current_popup:
+            # Pas de menu à réutiliser : le construire
+            self.close_page_selector()
+            self._show_current_page(x, y)
+            return
         
-        # Fermer l'ancien menu proprement (sans animation, sans callbacks)
-        if self.current_popup:
-            try:
-                # Désactiver le néon
-                self.current_popup.neon_enabled = False
-                self.current_popup.timer.stop()
-                
-                # Fermer le sous-menu hover s'il existe
-                if hasattr(self.current_popup, 'hover_submenu') and self.current_popup.hover_submenu:
-                    try:
-                        self.current_popup.hover_submenu.close()
-                    except RuntimeError:
-                        pass
-                    self.current_popup.hover_submenu = None
-                
-                # Fermer le tooltip
-                if hasattr(self.current_popup, 'tooltip_window'):
-                    try:
-                        self.current_popup.tooltip_window.hide()
-                    except RuntimeError:
-                        pass
-                
-                # Désinstaller le listener clavier
-                if hasattr(self.current_popup, 'keyboard_listener'):
-                    try:
-                        QApplication.instance().removeEventFilter(self.current_popup.keyboard_listener)
-                    except RuntimeError:
-                        pass
-                
-                # Fermer sans déclencher on_close_finished
-                self.current_popup.hide()
-                self.current_popup.deleteLater()
-            except RuntimeError:
-                pass
+        clips_by_link = self.build_page_buttons(x, y)
+        try:
+            # Remplace les boutons (recyclés), ferme le sous-menu hover et le tooltip,
+            # puis rejoue l'animation d'ouverture
+            self.current_popup.show_page(self.buttons_sub, clips_by_link)
+        except RuntimeError:
+            # Le menu a été détruit pendant l'animation
             self.current_popup = None
+            self.close_page_selector()
+            self._show_current_page(x, y)
+            return
+        
+        # Mettre à jour le sélecteur de pages
+        if self.total_pages > 1:
+            self.update_page_selector(x, y)
         
-        # Reconstruire le menu avec la nouvelle page (sans recharger les données)
-        self._show_current_page(x, y)
+        # Fin du changement de page
+        self.is_changing_page = False
+        self.prerender_adjacent_pages()
 
-    def _show_current_page(self, x, y):
-        """Affiche la page actuelle du menu (utilise les données déjà chargées)"""
+    def build_page_buttons(self, x, y):
+        """Reconstruit buttons_sub pour la page actuelle et retourne son clips_by_link"""
         special_buttons = self.special_buttons_by_number[self.nb_icons_menu]
         
         # Reconstruire buttons_sub
@@ -5980,6 +5898,41 @@ class ClipNotesWindow(QMainWindow):
             if name in self.actions_map_sub:
                 clips_by_link.append(1)
         clips_by_link.extend(page_clips_by_link)
+        return clips_by_link
+
+    def prerender_adjacent_pages(self):
+        """
+        Prépare en tâche de fond les icônes des pages voisines (cache de pixmaps),
+        par petits lots entre deux événements : le prochain changement de page
+        n'a plus rien à rendre.
+        """
+        labels = []
+        for page in (self.current_page + 1, self.current_page - 1):
+            if 0 <= page < self.total_pages:
+                start_idx = page * self.clips_per_page
+                labels.extend(clip[0] for clip in self.all_clips_data[start_idx:start_idx + self.clips_per_page])
+        # La file précédente est remplacée : pas de chaînes qui s'accumulent en feuilletant vite
+        self.prerender_queue = labels
+        if labels:
+            self.prerender_timer.start()
+        else:
+            self.prerender_timer.stop()
+
+    def _prerender_next_icons(self):
+        for _ in range(8):
+            if not self.prerender_queue:
+                break
+            label = self.prerender_queue.pop(0)
+            try:
+                button_pixmap(label)
+            except Exception as e:
+                print(f"[Erreur] Prérendu de l'icône « {label} » impossible : {e}")
+        if not self.prerender_queue:
+            self.prerender_timer.stop()
+
+    def _show_current_page(self, x, y):
+        """Affiche la page actuelle du menu (utilise les données déjà chargées)"""
+        clips_by_link = self.build_page_buttons(x, y)
         
         # Créer le nouveau menu
         self.current_popup = RadialMenu(
@@ -5991,7 +5944,7 @@ class ClipNotesWindow(QMainWindow):
             zone_basic_opacity=self.zone_basic_opacity, zone_hover_opacity=self.zone_hover_opacity,
             clips_by_link=clips_by_link, shadow_offset=self.shadow_offset,
             shadow_color=self.shadow_color, shadow_enabled=self.shadow_enabled,
-            shadow_angle=self.shadow_angle
+            shadow_angle=self.shadow_angle, menu_engine=self.menu_engine
         )
         
         self.current_popup.show()
@@ -6002,7 +5955,8 @@ class ClipNotesWindow(QMainWindow):
         
         # Activer le néon
         self.current_popup.toggle_neon(self.central_neon)
-        self.current_popup.timer.start(self.neon_speed)
+        if self.central_neon:
+            self.current_popup.timer.start(self.neon_speed)
         
         # Recréer le sélecteur de pages
         if self.total_pages > 1:
@@ -6010,6 +5964,7 @@ class ClipNotesWindow(QMainWindow):
         
         # Fin du changement de page
         self.is_changing_page = False
+        self.prerender_adjacent_pages()
 
     def close_page_selector(self):
         """Ferme le sélecteur de pages"""
@@ -6081,7 +6036,113 @@ def get_running_pid():
         return None
 
 
+# ====== DAEMON RÉSIDENT (SOCKET UNIX) ======
+
+class ClipNotesServer(QObject):
+    """
+    Serveur local du daemon : reçoit les commandes du client léger
+    (clipnotes_client.py) et les exécute sur l'instance résidente.
+    """
+
+    def __init__(self, main_app, socket_path):
+        super().__init__()
+        self.main_app = main_app
+        self.socket_path = socket_path
+        self.server = QLocalServer(self)
+        self.server.newConnection.connect(self.on_new_connection)
+
+    def listen(self):
+        """Écoute sur le socket. Retourne False si un autre daemon répond déjà."""
+        if send_command("ping", timeout=0.3) is not None:
+            return False
+        # Socket orphelin d'un daemon mort : le supprimer avant d'écouter
+        QLocalServer.removeServer(self.socket_path)
+        if not self.server.listen(self.socket_path):
+            print(f"[Erreur] Impossible d'écouter sur {self.socket_path} : {self.server.errorString()}")
+            return False
+        return True
+
+    def close(self):
+        self.server.close()
+        QLocalServer.removeServer(self.socket_path)
+
+    def on_new_connection(self):
+        while self.server.hasPendingConnections():
+            connection = self.server.nextPendingConnection()
+            connection.readyRead.connect(lambda c=connection: self.on_ready_read(c))
+            connection.disconnected.connect(connection.deleteLater)
+
+    def on_ready_read(self, connection):
+        if not connection.canReadLine():
+            return
+        command = bytes(connection.readLine()).decode("utf-8").strip()
+        if command == "pos":
+            # Position corrigée calculée à la demande (pas de fichier réécrit en continu)
+            tracker = self.main_app.tracker
+            if tracker:
+                tracker.update_pos()
+                connection.write(f"{tracker.last_x},{tracker.last_y}\n".encode("utf-8"))
+            else:
+                connection.write(b"0,0\n")
+        else:
+            connection.write(b"ok\n" if command in COMMANDS else b"unknown\n")
+        connection.flush()
+        connection.disconnectFromServer()
+
+        # Exécuter après avoir répondu : le client n'attend pas le rendu du menu
+        if command == "show":
+            QTimer.singleShot(0, self.main_app.show_at_cursor)
+        elif command == "hide":
+            QTimer.singleShot(0, self.main_app.hide_menu)
+        elif command == "quit":
+            QTimer.singleShot(0, QApplication.instance().quit)
+
+
+def run_daemon(show_now=False):
+    """Lance ClipNotes en mode résident : Qt, tracker, config et clips restent chargés."""
+    qt_app = QApplication(sys.argv)
+    qt_app.setQuitOnLastWindowClosed(False)
+    # Le daemon survit à la fermeture du menu : il reste propriétaire du presse-papier
+    use_native_clipboard()
+
+    tracker = CursorTracker()
+    main_app = ClipNotesWindow()
+    main_app.tracker = tracker
+    main_app.resident = True
+    # Clips exec "tracked" suivis (sorties, durée, code de retour) ; les autres restent détachés
+    runner = start_action_runner(main_app.exec_max_concurrent, main_app.exec_timeout)
+    qt_app.aboutToQuit.connect(runner.shutdown)
+
+    server = ClipNotesServer(main_app, get_socket_path())
+    if not server.listen():
+        print("[Info] Un daemon ClipNotes est déjà en cours")
+        if show_now:
+            send_command("show")
+        return 0
+
+    def cleanup_handler(signum, frame):
+        qt_app.quit()
+
+    signal.signal(signal.SIGINT, cleanup_handler)
+    signal.signal(signal.SIGTERM, cleanup_handler)
+    # Laisser Python traiter les signaux pendant la boucle Qt
+    signal_timer = QTimer()
+    signal_timer.timeout.connect(lambda: None)
+    signal_timer.start(500)
+
+    if show_now:
+        QTimer.singleShot(0, main_app.show_at_cursor)
+
+    try:
+        return qt_app.exec()
+    finally:
+        server.close()
+
+
 if __name__ == "__main__":
+    if "--daemon" in sys.argv:
+        sys.exit(run_daemon(show_now="--show" in sys.argv))
+
     # Variable globale pour l'app Qt (nécessaire pour le handler de signal)
     qt_app = None
     
@@ -6139,6 +6200,7 @@ if __name__ == "__main__":
     elapsed = 0.0
     while (tracker.last_x == 0 and tracker.last_y == 0) and elapsed < max_wait:
         QApplication.processEvents()
+        tracker.update_pos()
         time.sleep(0.05)
         elapsed += 0.05
     
@@ -0,0 +1,281 @@
+"""
+ActionRunner - Exécution suivie des clips "exec" marqués "tracked".
+
+Un clip exec lance le plus souvent une application qui reste ouverte : il est
+lancé détaché (nouvelle session, sorties vers /dev/null), sans suivi, et survit
+au daemon (voir utils.execute_command). Seules les tâches courtes marquées
+"tracked": true dans clip_notes.json passent par ce runner.
+
+Dans le daemon, chaque tâche suivie est lancée par un QProcess : pid, début et
+fin, code de retour et derniers octets de stdout/stderr (tampon circulaire, lu
+au fil de l'eau) sont gardés dans un historique borné. Les fins de processus
+arrivent par la boucle d'événements Qt, sans thread par processus.
+
+Au-delà de max_concurrent tâches en cours, les suivantes attendent leur tour.
+Une tâche qui dépasse timeout secondes (0 = sans limite) reçoit SIGTERM, puis
+SIGKILL si elle ne s'arrête pas. L'état de la dernière exécution d'un clip
+s'affiche dans le tooltip du menu radial ; l'onglet « Exécutions » de la
+configuration liste l'historique (ui/RecentRunsView.py).
+"""
+
+import time
+from collections import deque
+from PyQt6.QtCore import QObject, QProcess, QTimer, pyqtSignal
+
+OUTPUT_LIMIT = 16 * 1024     # Octets gardés par flux (les plus récents)
+HISTORY_SIZE = 50            # Exécutions gardées dans l'historique
+DEFAULT_MAX_CONCURRENT = 4
+DEFAULT_TIMEOUT = 60         # Secondes, 0 = sans limite (tâches courtes)
+KILL_DELAY_MS = 2000         # Délai entre SIGTERM et SIGKILL
+
+STATUS_LABELS = {
+    "pending": ("⏳", "En attente"),
+    "running": ("▶", "En cours"),
+    "finished": ("✓", "Terminé"),
+    "failed": ("✗", "Échec"),
+    "timeout": ("⏱", "Délai dépassé"),
+    "killed": ("■", "Arrêté"),
+}
+
+
+def format_duration(seconds):
+    if seconds < 1:
+        return f"{int(seconds * 1000)} ms"
+    if seconds < 60:
+        return f"{seconds:.1f} s"
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes} min {seconds:02d} s"
+
+
+class OutputBuffer:
+    """Tampon circulaire d'un flux : garde les limit derniers octets"""
+
+    def __init__(self, limit=OUTPUT_LIMIT):
+        self.limit = limit
+        self.data = bytearray()
+        self.dropped = 0
+
+    def append(self, chunk):
+        self.data += chunk
+        excess = len(self.data) - self.limit
+        if excess > 0:
+            del self.data[:excess]
+            self.dropped += excess
+
+    def text(self):
+        text = self.data.decode("utf-8", errors="replace")
+        return f"[… {self.dropped} octets plus anciens omis]\n{text}" if self.dropped else text
+
+    def last_line(self):
+        lines = [line for line in self.text().splitlines() if line.strip()]
+        return lines[-1].strip() if lines else ""
+
+
+class ActionRun:
+    """Une exécution : commande, processus, horodatage, code de retour, sorties"""
+
+    def __init__(self, run_id, command):
+        self.id = run_id
+        self.command = command
+        self.status = "pending"
+        self.pid = None
+        self.queued_at = time.time()
+        self.started_at = None
+        self.ended_at = None
+        self.exit_code = None
+        self.error = None
+        self.stdout = OutputBuffer()
+        self.stderr = OutputBuffer()
+        self.process = None
+
+    @property
+    def duration(self):
+        if self.started_at is None:
+            return None
+        return (self.ended_at or time.time()) - self.started_at
+
+    def status_line(self):
+        """État en une ligne (tooltip du menu radial)"""
+        icon, label = STATUS_LABELS[self.status]
+        if self.status == "pending":
+            return f"{icon} {label}"
+        if self.status == "running":
+            return f"{icon} {label} depuis {format_duration(self.duration)} (pid {self.pid})"
+        ago = format_duration(time.time() - self.ended_at) if self.ended_at else "?"
+        if self.status == "finished":
+            return f"{icon} {label} en {format_duration(self.duration)}, il y a {ago}"
+        if self.status == "failed":
+            detail = self.error or f"code {self.exit_code}"
+            last_error = self.stderr.last_line()
+            line = f"{icon} {label} ({detail}) il y a {ago}"
+            return f"{line}\n{last_error[:120]}" if last_error else line
+        return f"{icon} {label} après {format_duration(self.duration or 0)}, il y a {ago}"
+
+
+class ActionRunner(QObject):
+    """
+    Lance et suit les commandes exec.
+
+    Signals:
+        run_changed(ActionRun): une exécution a changé d'état (ajout, début, fin)
+    """
+
+    run_changed = pyqtSignal(object)
+
+    def __init__(self, max_concurrent=DEFAULT_MAX_CONCURRENT, timeout=DEFAULT_TIMEOUT, parent=None):
+        super().__init__(parent)
+        self.history = deque(maxlen=HISTORY_SIZE)
+        self.pending = deque()
+        self.running = {}  # id -> ActionRun
+        self._next_id = 1
+        self.configure(max_concurrent, timeout)
+
+    def configure(self, max_concurrent, timeout):
+        self.max_concurrent = max(int(max_concurrent or DEFAULT_MAX_CONCURRENT), 1)
+        self.timeout = max(float(timeout or 0), 0)
+        self._start_pending()
+
+    def run(self, command):
+        """Ajoute une commande à la file et la lance dès qu'une place se libère"""
+        run = ActionRun(self._next_id, command)
+        self._next_id += 1
+        self.history.append(run)
+        self.pending.append(run)
+        self.run_changed.emit(run)
+        self._start_pending()
+        if run.status == "pending":
+            print(f"[Info] {len(self.running)} tâches suivies en cours, en attente : {command}")
+        return run
+
+    def last_run(self, command):
+        """Dernière exécution de command, ou None"""
+        for run in reversed(self.history):
+            if run.command == command:
+                return run
+        return None
+
+    def stop(self, run):
+        """Arrête une exécution (retirée de la file si elle n'a pas commencé)"""
+        if run.status == "pending":
+            self.pending.remove(run)
+            run.status = "killed"
+            run.ended_at = time.time()
+            self.run_changed.emit(run)
+        elif run.status == "running":
+            run.status = "killed"
+            self._terminate(run)
+
+    def clear_history(self):
+        """Oublie les exécutions terminées"""
+        active = [run for run in self.history if run.status in ("pending", "running")]
+        self.history.clear()
+        self.history.extend(active)
+
+    def shutdown(self):
+        """
+        Arrêt du daemon : vide la file et termine les tâches suivies encore en
+        cours (un QProcess détruit tuerait son processus de toute façon). Les
+        applications lancées détachées ne sont pas concernées.
+        """
+        self.pending.clear()
+        for run in list(self.running.values()):
+            run.status = "killed"
+            process = run.process
+            process.terminate()
+            if not process.waitForFinished(KILL_DELAY_MS):
+                process.kill()
+                process.waitForFinished(KILL_DELAY_MS)
+
+    def _start_pending(self):
+        while self.pending and len(self.running) < self.max_concurrent:
+            self._start(self.pending.popleft())
+
+    def _start(self, run):
+        process = QProcess(self)
+        process.setProgram("/bin/sh")
+        process.setArguments(["-c", run.command])
+        process.setStandardInputFile(QProcess.nullDevice())
+        process.readyReadStandardOutput.connect(lambda: run.stdout.append(bytes(process.readAllStandardOutput())))
+        process.readyReadStandardError.connect(lambda: run.stderr.append(bytes(process.readAllStandardError())))
+        process.started.connect(lambda: self._on_started(run))
+        process.finished.connect(lambda exit_code, exit_status: self._on_finished(run, exit_code, exit_status))
+        process.errorOccurred.connect(lambda error: self._on_error(run, error))
+        run.process = process
+        run.status = "running"
+        run.started_at = time.time()
+        self.running[run.id] = run
+        if self.timeout:
+            # Minuteur porté par le processus : détruit avec lui
+            timer = QTimer(process)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda: self._on_timeout(run))
+            timer.start(int(self.timeout * 1000))
+        process.start()
+
+    def _on_started(self, run):
+        run.pid = run.process.processId()
+        self.run_changed.emit(run)
+
+    def _on_timeout(self, run):
+        if run.status == "running":
+            run.status = "timeout"
+            print(f"[Info] Délai dépassé ({self.timeout:g} s), arrêt de : {run.command}")
+            self._terminate(run)
+
+    def _terminate(self, run):
+        process = run.process
+        process.terminate()
+        QTimer.singleShot(KILL_DELAY_MS, lambda: self._kill_if_running(run, process))
+
+    def _kill_if_running(self, run, process):
+        if run.process is process and process.state() != QProcess.ProcessState.NotRunning:
+            process.kill()
+
+    def _on_finished(self, run, exit_code, exit_status):
+        process = run.process
+        run.stdout.append(bytes(process.readAllStandardOutput()))
+        run.stderr.append(bytes(process.readAllStandardError()))
+        run.exit_code = exit_code
+        if run.status == "running":
+            if exit_status == QProcess.ExitStatus.NormalExit and exit_code == 0:
+                run.status = "finished"
+            else:
+                run.status = "failed"
+                if exit_status != QProcess.ExitStatus.NormalExit:
+                    run.error = "processus interrompu"
+                print(f"[Erreur] exec « {run.command} » : {run.error or f'code {exit_code}'}")
+        self._release(run)
+
+    def _on_error(self, run, error):
+        # Les autres erreurs (plantage, lecture) sont suivies de finished
+        if error == QProcess.ProcessError.FailedToStart:
+            run.status = "failed"
+            run.error = run.process.errorString()
+            print(f"[Erreur] exec « {run.command} » : {run.error}")
+            self._release(run)
+
+    def _release(self, run):
+        run.ended_at = time.time()
+        self.running.pop(run.id, None)
+        run.process.deleteLater()
+        run.process = None
+        self.run_changed.emit(run)
+        self._start_pending()
+
+
+_runner = None
+
+
+def start_action_runner(max_concurrent=DEFAULT_MAX_CONCURRENT, timeout=DEFAULT_TIMEOUT):
+    """Active le suivi des commandes exec (processus résident)"""
+    global _runner
+    if _runner is None:
+        _runner = ActionRunner(max_concurrent, timeout)
+    else:
+        _runner.configure(max_concurrent, timeout)
+    return _runner
+
+
+def get_action_runner():
+    """Runner du daemon, ou None hors daemon"""
+    return _runner
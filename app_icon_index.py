@@ -0,0 +1,264 @@
+"""
+AppIconIndex - Index des icônes d'applications installées (nom -> meilleure icône PNG).
+
+Remplace les parcours `find` lancés à chaque frappe dans le dialogue de création
+de clip : l'index est construit une fois dans un thread à partir des fichiers
+.desktop (Exec/Icon) et des dossiers de thèmes d'icônes, puis mis en cache sur
+disque. Le cache est reconstruit en arrière-plan quand un des dossiers parcourus
+a changé (mtime). Les dossiers .desktop sont revérifiés pendant l'exécution, au
+plus une fois toutes les RECHECK_INTERVAL secondes lors d'une recherche : une
+application installée après le démarrage du daemon est trouvée.
+"""
+
+import os, json, glob, bisect, difflib, threading, tempfile, time
+
+INDEX_VERSION = 1
+RECHECK_INTERVAL = 30  # Secondes entre deux vérifications des dossiers .desktop
+
+_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icon_cache", f"app_icons_v{INDEX_VERSION}.json")
+
+_HOME = os.path.expanduser("~")
+
+DESKTOP_DIRS = [
+    "/usr/share/applications",
+    "/usr/local/share/applications",
+    os.path.join(_HOME, ".local/share/applications"),
+    "/var/lib/flatpak/exports/share/applications",
+    os.path.join(_HOME, ".local/share/flatpak/exports/share/applications"),
+    "/var/lib/snapd/desktop/applications",
+]
+
+ICON_THEME_DIRS = [
+    "/usr/share/icons",
+    "/usr/local/share/icons",
+    os.path.join(_HOME, ".local/share/icons"),
+    os.path.join(_HOME, ".icons"),
+    "/var/lib/flatpak/exports/share/icons",
+    os.path.join(_HOME, ".local/share/flatpak/exports/share/icons"),
+]
+
+PIXMAPS_DIR = "/usr/share/pixmaps"
+SNAP_GUI_GLOB = "/snap/*/current/meta/gui"
+
+
+def _icon_size(dir_path):
+    """Taille d'icône déduite du chemin (.../256x256/apps -> 256, pixmaps -> 1)"""
+    for part in reversed(dir_path.split(os.sep)):
+        size = part.split("@")[0].split("x")[0]
+        if "x" in part and size.isdigit():
+            return int(size)
+    return 1
+
+
+def _parse_desktop_file(path):
+    """Retourne (nom de l'exécutable, valeur Icon=) de la section [Desktop Entry]"""
+    exec_name = icon = None
+    in_entry = False
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith("["):
+                    in_entry = line == "[Desktop Entry]"
+                elif in_entry and line.startswith("Exec=") and exec_name is None:
+                    words = line[5:].split()
+                    # Ignorer les préfixes courants (env VAR=..., flatpak run ...)
+                    while words and (words[0] == "env" or "=" in words[0]):
+                        words.pop(0)
+                    if words:
+                        exec_name = os.path.basename(words[0])
+                elif in_entry and line.startswith("Icon=") and icon is None:
+                    icon = line[5:].strip()
+    except OSError:
+        pass
+    return exec_name, icon
+
+
+def build_index():
+    """
+    Parcourt thèmes d'icônes et fichiers .desktop.
+    Retourne (index {nom en minuscules: chemin}, {dossier: mtime} pour l'invalidation).
+    """
+    dir_mtimes = {}
+    # nom d'icône -> (taille, chemin) ; on garde la plus grande
+    best = {}
+
+    def consider(name, size, path):
+        key = name.lower()
+        if key not in best or size > best[key][0]:
+            best[key] = (size, path)
+
+    def scan_png_dir(dir_path, size):
+        try:
+            dir_mtimes[dir_path] = os.path.getmtime(dir_path)
+            for entry in os.scandir(dir_path):
+                if entry.name.lower().endswith(".png"):
+                    consider(entry.name[:-4], size, entry.path)
+        except OSError:
+            pass
+
+    for root in ICON_THEME_DIRS:
+        if not os.path.isdir(root):
+            continue
+        dir_mtimes[root] = os.path.getmtime(root)
+        for dir_path, dirnames, filenames in os.walk(root):
+            if any(name.lower().endswith(".png") for name in filenames):
+                scan_png_dir(dir_path, _icon_size(dir_path))
+            elif dir_path.count(os.sep) - root.count(os.sep) <= 1:
+                # Dossiers de thème/taille : surveiller l'ajout d'un nouveau thème ou d'une taille
+                dir_mtimes[dir_path] = os.path.getmtime(dir_path)
+
+    scan_png_dir(PIXMAPS_DIR, 1)
+
+    # Snaps : /snap/<nom>/current/meta/gui/*.png -> indexé sous le nom du snap
+    for gui_dir in glob.glob(SNAP_GUI_GLOB):
+        snap_name = gui_dir.split(os.sep)[2]
+        pngs = sorted(glob.glob(os.path.join(gui_dir, "*.png")))
+        if pngs:
+            consider(snap_name, 2, pngs[0])
+    if os.path.isdir("/snap"):
+        dir_mtimes["/snap"] = os.path.getmtime("/snap")
+
+    index = {name: path for name, (size, path) in best.items()}
+
+    # Fichiers .desktop : nom de l'exécutable et du fichier -> icône déclarée
+    for desktop_dir in DESKTOP_DIRS:
+        if not os.path.isdir(desktop_dir):
+            continue
+        dir_mtimes[desktop_dir] = os.path.getmtime(desktop_dir)
+        for path in glob.glob(os.path.join(desktop_dir, "*.desktop")):
+            exec_name, icon = _parse_desktop_file(path)
+            if not icon:
+                continue
+            if os.path.isabs(icon):
+                icon_path = icon if icon.lower().endswith(".png") and os.path.exists(icon) else None
+            else:
+                icon_path = index.get(icon.lower())
+            if not icon_path:
+                continue
+            desktop_name = os.path.basename(path)[:-len(".desktop")]
+            for name in (exec_name, desktop_name, desktop_name.split(".")[-1]):
+                if name and name.lower() not in index:
+                    index[name.lower()] = icon_path
+
+    return index, dir_mtimes
+
+
+class AppIconIndex:
+    def __init__(self, cache_path=_CACHE_PATH):
+        self.cache_path = cache_path
+        self.index = None
+        self._names = []
+        self._dir_mtimes = {}  # {dossier: mtime} de l'index courant
+        self._checked_at = 0.0
+        self._building = False
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Charge le cache disque et lance une reconstruction en arrière-plan si nécessaire"""
+        dir_mtimes = self._load_cache()
+        self._checked_at = time.monotonic()
+        if self.index is None or self._is_stale(dir_mtimes):
+            self._start_build()
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            self._set_index(cache["index"], cache["dirs"])
+            return cache["dirs"]
+        except (OSError, ValueError, KeyError):
+            return {}
+
+    def _is_stale(self, dir_mtimes):
+        for dir_path, mtime in dir_mtimes.items():
+            try:
+                if os.path.getmtime(dir_path) != mtime:
+                    return True
+            except OSError:
+                return True
+        # Un dossier racine apparu depuis (ex: premier flatpak installé)
+        roots = DESKTOP_DIRS + ICON_THEME_DIRS + [PIXMAPS_DIR]
+        return any(os.path.isdir(d) and d not in dir_mtimes for d in roots)
+
+    def _desktop_dirs_changed(self):
+        """True si un dossier .desktop a changé (ou est apparu/disparu) depuis l'index"""
+        for desktop_dir in DESKTOP_DIRS:
+            try:
+                mtime = os.path.getmtime(desktop_dir)
+            except OSError:
+                mtime = None
+            if mtime != self._dir_mtimes.get(desktop_dir):
+                return True
+        return False
+
+    def _set_index(self, index, dir_mtimes):
+        with self._lock:
+            self.index = index
+            self._names = sorted(index)
+            self._dir_mtimes = dir_mtimes
+
+    def _start_build(self):
+        with self._lock:
+            if self._building:
+                return
+            self._building = True
+        threading.Thread(target=self._build, daemon=True).start()
+
+    def _build(self):
+        try:
+            index, dir_mtimes = build_index()
+            self._set_index(index, dir_mtimes)
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=".app_icons_", suffix=".tmp", dir=os.path.dirname(self.cache_path))
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"index": index, "dirs": dir_mtimes}, f)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            print(f"[Erreur] Construction de l'index d'icônes impossible : {e}")
+        finally:
+            self._building = False
+
+    def find(self, app_name):
+        """
+        Meilleure icône PNG pour une application (ou None).
+        Ordre : nom exact, préfixe, sous-chaîne, puis correspondance approchée.
+        """
+        now = time.monotonic()
+        if now - self._checked_at >= RECHECK_INTERVAL:
+            self._checked_at = now
+            # Reconstruction en arrière-plan : cette recherche utilise encore l'index actuel
+            if not self._building and self._desktop_dirs_changed():
+                self._start_build()
+        with self._lock:
+            index, names = self.index, self._names
+        if not index or not app_name:
+            return None
+        key = app_name.lower()
+        path = index.get(key)
+        if path:
+            return path
+        # Préfixe : plage contiguë dans la liste triée
+        start = bisect.bisect_left(names, key)
+        end = start
+        while end < len(names) and names[end].startswith(key):
+            end += 1
+        candidates = names[start:end] or [name for name in names if key in name]
+        if candidates:
+            # Le nom le plus court est le plus proche (firefox plutôt que firefox-developer-edition)
+            return index[min(candidates, key=len)]
+        same_initial = [name for name in names if name[:1] == key[:1]]
+        close = difflib.get_close_matches(key, same_initial, n=1, cutoff=0.85)
+        return index[close[0]] if close else None
+
+
+_app_icon_index = None
+
+
+def get_app_icon_index():
+    """Index unique du processus, chargé/construit au premier appel"""
+    global _app_icon_index
+    if _app_icon_index is None:
+        _app_icon_index = AppIconIndex()
+        _app_icon_index.start()
+    return _app_icon_index
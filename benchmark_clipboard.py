@@ -0,0 +1,67 @@
+"""
+Micro-benchmark de la copie d'un clip (utils.paperclip_copy).
+
+Compare la copie native (QClipboard + QMimeData, texte seul puis texte + HTML),
+utilisée par le daemon, et le repli pyperclip (processus xclip/wl-copy à chaque
+copie). Vérifie aussi que le presse-papier relu contient bien le texte et le HTML.
+
+    python3 benchmark_clipboard.py [itérations]
+
+Avec QT_QPA_PLATFORM=offscreen, le presse-papier Qt reste interne au processus :
+à lancer dans une session graphique pour mesurer le vrai coût.
+"""
+
+import sys, time
+
+from PyQt6.QtWidgets import QApplication
+
+import utils
+
+TEXT = "git log --oneline --graph --decorate\\ngit status"
+HTML = "<p><b>git log</b> --oneline --graph --decorate</p><p><i>git status</i></p>"
+
+
+def timed(func, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e3
+
+
+def check(app):
+    """Le presse-papier relu correspond à la dernière copie native"""
+    utils.use_native_clipboard(True)
+    utils.paperclip_copy(TEXT, HTML)
+    app.processEvents()
+    mime_data = QApplication.clipboard().mimeData()
+    ok = mime_data.text() == TEXT.replace(r'\n', '\n') and mime_data.hasHtml() and "git status" in mime_data.html()
+    print(f"  text/plain + text/html relus : {'ok' if ok else 'ÉCART'}")
+    return ok
+
+
+def main(argv):
+    app = QApplication(argv)
+    iterations = int(argv[1]) if len(argv) > 1 else 50
+
+    print("Contrôle :")
+    ok = check(app)
+
+    print(f"Latence d'une copie ({iterations} itérations) :")
+    utils.use_native_clipboard(True)
+    native_text = timed(lambda: utils.paperclip_copy(TEXT), iterations)
+    native_html = timed(lambda: utils.paperclip_copy(TEXT, HTML), iterations)
+    print(f"  QClipboard (texte)        : {native_text:8.3f} ms")
+    print(f"  QClipboard (texte + HTML) : {native_html:8.3f} ms")
+
+    utils.use_native_clipboard(False)
+    try:
+        fallback = timed(lambda: utils.paperclip_copy(TEXT), iterations)
+        print(f"  pyperclip (texte)         : {fallback:8.3f} ms")
+    except Exception as e:
+        print(f"  pyperclip indisponible : {e}")
+    app.quit()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
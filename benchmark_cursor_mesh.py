@@ -0,0 +1,172 @@
+"""
+Micro-benchmark et contrôle de la correction du curseur (cursor_correction.py).
+
+Vérifie la table sur des maillages synthétiques (constant, plans, aléatoire)
+contre l'interpolation directe, puis compare le coût d'une correction :
+ancien calcul du tracker (4 bilerp sur la grille 3×3), interpolation directe
+des maillages, lecture dans la table. Donne aussi le temps de construction de
+la table (NumPy si installé, sinon Python pur), et contrôle l'ajustement de
+calibration (calibration_fit.py) sur des décalages synthétiques.
+
+    python3 benchmark_cursor_mesh.py [largeur hauteur]
+"""
+
+import sys, time, random
+
+import cursor_correction
+from cursor_correction import CursorCorrection, mesh_value, load_mesh
+from calibration_fit import fit_correction, format_residuals
+
+ITERATIONS = 100000
+
+# grid_def de CursorTracker (décalage, marge) par nœud de la grille 3×3
+GRID_DEF = [
+    [(150, 150, -45, -50), (0, 150, 0, -50), (-200, 150, 45, -50)],
+    [(150, 150, -45, -50), (0, 150, 0, -50), (-200, 150, 45, -50)],
+    [(150, 40, -45, -50), (0, 40, 0, -50), (-200, 40, 45, -50)],
+]
+
+
+def lerp(a, b, t):
+    return a + (b - a) * t
+
+
+def bilerp(tl, tr, bl, br, tx, ty):
+    return lerp(lerp(tl, tr, tx), lerp(bl, br, tx), ty)
+
+
+def old_correct(width, height, raw_x, raw_y):
+    """Ancien calcul de CursorTracker.update_pos"""
+    cell_w = width / 2
+    cell_h = height / 2
+    cx = min(int(raw_x / cell_w), 1)
+    cy = min(int(raw_y / cell_h), 1)
+    tx = (raw_x - cx * cell_w) / cell_w
+    ty = (raw_y - cy * cell_h) / cell_h
+    tl, tr = GRID_DEF[cy][cx], GRID_DEF[cy][cx + 1]
+    bl, br = GRID_DEF[cy + 1][cx], GRID_DEF[cy + 1][cx + 1]
+    x_offset = bilerp(tl[0], tr[0], bl[0], br[0], tx, ty)
+    y_offset = bilerp(tl[1], tr[1], bl[1], br[1], tx, ty)
+    x_margin = bilerp(tl[2], tr[2], bl[2], br[2], tx, ty)
+    y_margin = bilerp(tl[3], tr[3], bl[3], br[3], tx, ty)
+    return int(raw_x + x_offset + x_margin), int(raw_y + y_offset + y_margin)
+
+
+def grid_mesh():
+    x_mesh = [[node[0] + node[2] for node in row] for row in GRID_DEF]
+    y_mesh = [[node[1] + node[3] for node in row] for row in GRID_DEF]
+    return x_mesh, y_mesh
+
+
+def max_error(correction, width, height, points):
+    """Écart maximal (px) entre la table et l'interpolation directe"""
+    worst = 0.0
+    for x, y in points:
+        cx, cy = correction.correct(x, y)
+        # La table lit le point de grille le plus proche : comparer à cet endroit
+        gx = min((x + correction.stride // 2) // correction.stride * correction.stride, width)
+        gy = min((y + correction.stride // 2) // correction.stride * correction.stride, height)
+        ex = x + sum(mesh_value(m[0], width, height, gx, gy) for m in correction.meshes)
+        ey = y + sum(mesh_value(m[1], width, height, gx, gy) for m in correction.meshes)
+        worst = max(worst, abs(cx - ex), abs(cy - ey))
+    return worst
+
+
+def check(width, height, points):
+    rng = random.Random(1)
+    synthetic = {
+        "constant": ([[7] * 4 for _ in range(4)], [[-3] * 4 for _ in range(4)]),
+        "plans": ([[c * 10 for c in range(5)] for r in range(3)], [[r * 10 for c in range(5)] for r in range(3)]),
+        "aléatoire 10×10": tuple([[rng.randint(-50, 50) for c in range(10)] for r in range(10)] for _ in range(2)),
+        "grille 3×3": grid_mesh(),
+    }
+    ok = True
+    for name, mesh in synthetic.items():
+        for stride in (1, 4):
+            correction = CursorCorrection(width, height, [mesh], stride=stride)
+            error = max_error(correction, width, height, points)
+            # Arrondi de la table : au plus 0,5 px
+            status = "ok" if error <= 0.5 else "ÉCART"
+            ok = ok and error <= 0.5
+            print(f"  {name:<18} pas {stride} : écart max {error:.2f} px  {status}")
+    # Même résultat que l'ancien tracker (à l'arrondi près)
+    correction = CursorCorrection(width, height, [grid_mesh()], stride=1)
+    worst = max(max(abs(a - b) for a, b in zip(correction.correct(x, y), old_correct(width, height, x, y))) for x, y in points)
+    print(f"  {'ancien tracker':<18} pas 1 : écart max {worst} px  {'ok' if worst <= 1 else 'ÉCART'}")
+    return ok and worst <= 1
+
+
+def synthetic_offsets(x, y, width, height):
+    """Décalage lisse (polynôme de degré 2) à retrouver par l'ajustement"""
+    u, v = x / width, y / height
+    return 30 + 20 * u - 15 * v + 10 * u * v, -12 + 8 * u * u - 5 * v
+
+
+def check_fit(width, height):
+    rng = random.Random(2)
+    grid = 6
+    ok = True
+    for noise in (0.0, 2.0):
+        samples = []
+        for row in range(grid):
+            for col in range(grid):
+                raw_x, raw_y = col / (grid - 1) * width, row / (grid - 1) * height
+                dx, dy = synthetic_offsets(raw_x, raw_y, width, height)
+                samples.append((raw_x, raw_y, raw_x + dx + rng.gauss(0, noise), raw_y + dy + rng.gauss(0, noise)))
+        start = time.perf_counter()
+        fit = fit_correction(samples, width, height)
+        fit_ms = (time.perf_counter() - start) * 1e3
+        # Écart au champ exact, hors des points d'ajustement
+        worst = 0.0
+        for _ in range(500):
+            x, y = rng.uniform(0, width), rng.uniform(0, height)
+            expected = synthetic_offsets(x, y, width, height)
+            got = fit.evaluate(x, y)
+            worst = max(worst, abs(got[0] - expected[0]), abs(got[1] - expected[1]))
+        limit = 0.01 if noise == 0 else 3.0
+        ok = ok and worst <= limit
+        print(f"  bruit {noise:.0f} px, grille {grid}×{grid} : degré {fit.degree}, {fit_ms:.2f} ms, "
+              f"écart max au champ {worst:.3f} px  {'ok' if worst <= limit else 'ÉCART'}")
+        print("    " + format_residuals(fit.residuals(samples)).replace("\n", "\n    "))
+    return ok
+
+
+def timed(func, points):
+    start = time.perf_counter()
+    for x, y in points:
+        func(x, y)
+    return (time.perf_counter() - start) / len(points) * 1e9
+
+
+def main(argv):
+    width, height = (int(argv[1]), int(argv[2])) if len(argv) > 2 else (1920, 1080)
+    rng = random.Random(0)
+    points = [(rng.randrange(width + 1), rng.randrange(height + 1)) for _ in range(ITERATIONS)]
+    meshes = [grid_mesh()]
+    fine_mesh = load_mesh()
+    if fine_mesh is not None:
+        meshes.append(fine_mesh)
+
+    print(f"Écran {width}×{height}, NumPy : {'oui' if cursor_correction.np is not None else 'non'}")
+    print("Contrôle sur maillages synthétiques :")
+    ok = check(width, height, points[:2000])
+    print("Ajustement de calibration (décalages synthétiques) :")
+    ok = check_fit(width, height) and ok
+
+    print("Construction de la table :")
+    for stride in (1, 2, 4, 8):
+        start = time.perf_counter()
+        correction = CursorCorrection(width, height, meshes, stride=stride)
+        build_ms = (time.perf_counter() - start) * 1e3
+        print(f"  pas {stride} : {build_ms:8.1f} ms  ({correction.rows}×{correction.cols} points)")
+
+    correction = CursorCorrection(width, height, meshes)
+    print(f"Correction d'une position ({len(meshes)} maillage(s)) :")
+    print(f"  ancien (4 bilerp, grille seule) : {timed(lambda x, y: old_correct(width, height, x, y), points):8.0f} ns")
+    print(f"  interpolation directe           : {timed(lambda x, y: [sum(mesh_value(m[i], width, height, x, y) for m in meshes) for i in (0, 1)], points):8.0f} ns")
+    print(f"  table (pas {correction.stride})                    : {timed(correction.correct, points):8.0f} ns")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,73 @@
+"""
+Micro-benchmark du rendu des icônes (emoji / texte / image) en 32, 48 et 64 px.
+
+Compare l'ancienne conversion PIL -> PNG -> QImage et la conversion directe
+depuis le buffer RGBA (pil_to_qpixmap), puis le coût d'une relecture depuis
+l'atlas disque et d'un accès au cache LRU.
+
+    QT_QPA_PLATFORM=offscreen python3 benchmark_pixmaps.py [image.png]
+"""
+
+import io, sys, time
+
+from PyQt6.QtGui import QImage, QPixmap
+from PyQt6.QtWidgets import QApplication
+
+import utils
+
+SIZES = (32, 48, 64)
+ITERATIONS = 200
+
+
+def png_round_trip(img):
+    """Ancienne conversion (avant pil_to_qpixmap)"""
+    data = io.BytesIO()
+    img.save(data, format='PNG')
+    return QPixmap.fromImage(QImage.fromData(data.getvalue(), "PNG"))
+
+
+def timed(func):
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func()
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def render_pil(kind, label, size):
+    """Image PIL telle que produite par les fonctions de rendu de utils.py"""
+    return {"emoji": utils._render_emoji_image,
+            "text": utils._render_text_image,
+            "image": utils._render_image}[kind](label, size)
+
+
+def atlas_hit(img):
+    """Relecture depuis l'atlas disque : QImage sur les pixels RGBA bruts"""
+    pixels = img.tobytes("raw", "RGBA")
+    return lambda: QPixmap.fromImage(QImage(pixels, img.width, img.height, img.width * 4, QImage.Format.Format_RGBA8888))
+
+
+def main(argv):
+    app = QApplication(argv)
+    cases = [("emoji", "📋"), ("text", "git")]
+    if len(argv) > 1:
+        cases.append(("image", argv[1]))
+
+    print(f"{'icône':<8}{'px':>4}{'PNG (µs)':>12}{'direct (µs)':>14}{'rendu+direct':>14}{'atlas (µs)':>12}{'cache (µs)':>12}")
+    for kind, label in cases:
+        public = {"emoji": utils.emoji_pixmap, "text": utils.text_pixmap, "image": utils.image_pixmap}[kind]
+        for size in SIZES:
+            img = render_pil(kind, label, size)
+            png = timed(lambda: png_round_trip(img))
+            direct = timed(lambda: utils.pil_to_qpixmap(img))
+            full = timed(lambda: utils.pil_to_qpixmap(render_pil(kind, label, size)))
+            atlas = timed(atlas_hit(img))
+            utils.clear_pixmap_cache()
+            public(label, size)
+            cached = timed(lambda: public(label, size))
+            print(f"{kind:<8}{size:>4}{png:>12.1f}{direct:>14.1f}{full:>14.1f}{atlas:>12.1f}{cached:>12.1f}")
+    app.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,275 @@
+"""
+CalibrationFit - Ajustement d'un champ de correction du curseur.
+
+À partir des clics de calibration (position brute rapportée par QCursor.pos() et
+position réelle du clic), ajuste par moindres carrés un polynôme de degré ≤ 3 en
+(x, y) pour chaque axe : un champ de correction lisse, peu sensible à
+l'imprécision d'un clic isolé. NumPy résout tout le système d'un coup s'il est
+installé ; sinon, équations normales en Python pur (quelques dizaines de points,
+instantané aussi).
+
+Le résultat est écrit dans un profil versionné cursor_calibration_<écran>.json :
+coefficients, maillage échantillonné (même format que cursor_mesh.json), erreurs
+résiduelles par zone de l'écran et clics d'origine. Le tracker le charge au
+démarrage à la place de sa grille par défaut (voir screen_profiles.py).
+
+Aucune dépendance à Qt : tout se vérifie sans écran (benchmark_cursor_mesh.py
+ajuste des décalages synthétiques).
+"""
+
+import os, json, math, tempfile
+from datetime import datetime
+from cursor_correction import is_valid_mesh, safe_screen_name
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PROFILE_VERSION = 1
+PROFILE_MESH_SIZE = 16  # Nœuds par côté du maillage écrit dans le profil
+MAX_DEGREE = 3
+
+_PROFILE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Zones du rapport d'erreurs (3×3)
+REGION_ROWS = ("haut", "milieu", "bas")
+REGION_COLS = ("gauche", "centre", "droite")
+
+
+def profile_path(screen_name):
+    return os.path.join(_PROFILE_DIR, f"cursor_calibration_{safe_screen_name(screen_name) or 'default'}.json")
+
+
+def poly_terms(degree):
+    """Exposants (i, j) des monômes u^i v^j de degré total ≤ degree"""
+    return [(i, total - i) for total in range(degree + 1) for i in range(total + 1)]
+
+
+def choose_degree(sample_count):
+    """Degré le plus élevé (≤ MAX_DEGREE) que le nombre de points permet d'ajuster"""
+    degree = 0
+    while degree < MAX_DEGREE and len(poly_terms(degree + 1)) <= sample_count:
+        degree += 1
+    return degree
+
+
+def _solve(matrix, vector):
+    """Résout matrix · x = vector (élimination de Gauss, pivot partiel). None si singulier."""
+    n = len(vector)
+    rows = [list(matrix[i]) + [vector[i]] for i in range(n)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(rows[r][col]))
+        if abs(rows[pivot][col]) < 1e-12:
+            return None
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        for r in range(col + 1, n):
+            factor = rows[r][col] / rows[col][col]
+            if factor:
+                for c in range(col, n + 1):
+                    rows[r][c] -= factor * rows[col][c]
+    solution = [0.0] * n
+    for r in range(n - 1, -1, -1):
+        solution[r] = (rows[r][n] - sum(rows[r][c] * solution[c] for c in range(r + 1, n))) / rows[r][r]
+    return solution
+
+
+class CorrectionFit:
+    """
+    Champ de correction ajusté sur un écran width×height.
+
+    correction(x, y) = Σ c_ij · u^i · v^j, avec u = x / width, v = y / height
+    (coordonnées brutes, relatives à l'écran).
+    """
+
+    def __init__(self, width, height, degree, x_coeffs, y_coeffs):
+        self.width = width
+        self.height = height
+        self.degree = degree
+        self.terms = poly_terms(degree)
+        self.x_coeffs = list(x_coeffs)
+        self.y_coeffs = list(y_coeffs)
+
+    def evaluate(self, x, y):
+        """Correction (dx, dy) à ajouter à la position brute (x, y)"""
+        u, v = x / self.width, y / self.height
+        powers = [u ** i * v ** j for i, j in self.terms]
+        return (sum(c * p for c, p in zip(self.x_coeffs, powers)),
+                sum(c * p for c, p in zip(self.y_coeffs, powers)))
+
+    def mesh(self, size=PROFILE_MESH_SIZE):
+        """Maillage size×size (x_mesh, y_mesh) du champ, arrondi au dixième de pixel"""
+        if np is not None:
+            u = np.linspace(0.0, 1.0, size)
+            v = np.linspace(0.0, 1.0, size)[:, None]
+            meshes = []
+            for coeffs in (self.x_coeffs, self.y_coeffs):
+                field = sum(c * u ** i * v ** j for c, (i, j) in zip(coeffs, self.terms))
+                meshes.append(np.round(field, 1).tolist())
+            return meshes[0], meshes[1]
+        x_mesh, y_mesh = [], []
+        for r in range(size):
+            x_row, y_row = [], []
+            for c in range(size):
+                dx, dy = self.evaluate(c / (size - 1) * self.width, r / (size - 1) * self.height)
+                x_row.append(round(dx, 1))
+                y_row.append(round(dy, 1))
+            x_mesh.append(x_row)
+            y_mesh.append(y_row)
+        return x_mesh, y_mesh
+
+    def residuals(self, samples):
+        """
+        Erreurs restantes après correction, globales et par zone (3×3) de l'écran.
+
+        Returns:
+            dict: {"global": stats, "zones": {"haut gauche": stats, ...}} où
+            stats = {"points", "rms", "max"} (en pixels)
+        """
+        zones = {}
+        errors = []
+        for raw_x, raw_y, target_x, target_y in samples:
+            dx, dy = self.evaluate(raw_x, raw_y)
+            error = math.hypot(raw_x + dx - target_x, raw_y + dy - target_y)
+            errors.append(error)
+            row = min(max(int(raw_y / self.height * 3), 0), 2)
+            col = min(max(int(raw_x / self.width * 3), 0), 2)
+            zones.setdefault(f"{REGION_ROWS[row]} {REGION_COLS[col]}", []).append(error)
+
+        def stats(values):
+            return {
+                "points": len(values),
+                "rms": round(math.sqrt(sum(e * e for e in values) / len(values)), 2) if values else 0.0,
+                "max": round(max(values), 2) if values else 0.0,
+            }
+        ordered = {}
+        for row in REGION_ROWS:
+            for col in REGION_COLS:
+                name = f"{row} {col}"
+                if name in zones:
+                    ordered[name] = stats(zones[name])
+        return {"global": stats(errors), "zones": ordered}
+
+
+def fit_correction(samples, width, height, degree=None):
+    """
+    Ajuste le champ de correction sur des clics de calibration.
+
+    Args:
+        samples: [(raw_x, raw_y, target_x, target_y)] relatifs à l'écran : position
+            brute du curseur et position réelle visée
+        width, height: dimensions de l'écran
+        degree: degré du polynôme (par défaut le plus élevé permis par les points)
+
+    Returns:
+        CorrectionFit, ou None sans aucun point
+    """
+    samples = list(samples)
+    if not samples:
+        return None
+    if degree is None:
+        degree = choose_degree(len(samples))
+    degree = min(degree, choose_degree(len(samples)))
+
+    while degree >= 0:
+        terms = poly_terms(degree)
+        coeffs = _fit_numpy(samples, width, height, terms) if np is not None else _fit_python(samples, width, height, terms)
+        if coeffs is not None:
+            return CorrectionFit(width, height, degree, coeffs[0], coeffs[1])
+        # Points alignés : le système est dégénéré, degré inférieur
+        degree -= 1
+    return None
+
+
+def _fit_numpy(samples, width, height, terms):
+    data = np.asarray(samples, dtype=float)
+    u = data[:, 0] / width
+    v = data[:, 1] / height
+    design = np.stack([u ** i * v ** j for i, j in terms], axis=1)
+    targets = data[:, 2:4] - data[:, 0:2]  # (dx, dy) par point
+    coeffs, _, rank, _ = np.linalg.lstsq(design, targets, rcond=None)
+    if rank < len(terms):
+        return None
+    return coeffs[:, 0].tolist(), coeffs[:, 1].tolist()
+
+
+def _fit_python(samples, width, height, terms):
+    n = len(terms)
+    normal = [[0.0] * n for _ in range(n)]
+    rhs_x = [0.0] * n
+    rhs_y = [0.0] * n
+    for raw_x, raw_y, target_x, target_y in samples:
+        u, v = raw_x / width, raw_y / height
+        row = [u ** i * v ** j for i, j in terms]
+        dx, dy = target_x - raw_x, target_y - raw_y
+        for a in range(n):
+            rhs_x[a] += row[a] * dx
+            rhs_y[a] += row[a] * dy
+            for b in range(n):
+                normal[a][b] += row[a] * row[b]
+    x_coeffs = _solve(normal, rhs_x)
+    y_coeffs = _solve(normal, rhs_y)
+    if x_coeffs is None or y_coeffs is None:
+        return None
+    return x_coeffs, y_coeffs
+
+
+def format_residuals(residuals):
+    """Rapport lisible des erreurs résiduelles"""
+    lines = [f"Erreur après correction : {residuals['global']['rms']:.1f} px RMS, {residuals['global']['max']:.1f} px max"]
+    for name, stats in residuals["zones"].items():
+        lines.append(f"  {name:<16} {stats['rms']:5.1f} px RMS  {stats['max']:5.1f} px max  ({stats['points']} pts)")
+    return "\n".join(lines)
+
+
+def save_profile(fit, samples, screen_name, device_pixel_ratio=1.0, path=None):
+    """Écrit le profil versionné de l'écran (écriture atomique). Retourne son chemin."""
+    path = path or profile_path(screen_name)
+    x_mesh, y_mesh = fit.mesh()
+    profile = {
+        "version": PROFILE_VERSION,
+        "created_at": datetime.now().isoformat(),
+        "screen": screen_name,
+        "width": fit.width,
+        "height": fit.height,
+        "device_pixel_ratio": device_pixel_ratio,
+        "degree": fit.degree,
+        "x_coeffs": fit.x_coeffs,
+        "y_coeffs": fit.y_coeffs,
+        "x_mesh": x_mesh,
+        "y_mesh": y_mesh,
+        "residuals": fit.residuals(samples),
+        "samples": [list(sample) for sample in samples],
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".cursor_calibration_", suffix=".json", dir=directory)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(profile, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_profile(path, width, height):
+    """
+    Maillage (x_mesh, y_mesh) d'un profil de calibration, ou None s'il est absent,
+    d'une autre version ou calibré pour une autre résolution.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            profile = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"[Erreur] Profil de calibration illisible ({path}) : {e}")
+        return None
+    if profile.get("version") != PROFILE_VERSION:
+        print(f"[Info] Profil de calibration ignoré ({path}) : version {profile.get('version')} (attendue {PROFILE_VERSION})")
+        return None
+    if (profile.get("width"), profile.get("height")) != (width, height):
+        print(f"[Info] Profil de calibration ignoré ({path}) : calibré pour {profile.get('width')}×{profile.get('height')}, écran {width}×{height}")
+        return None
+    x_mesh, y_mesh = profile.get("x_mesh"), profile.get("y_mesh")
+    if not (is_valid_mesh(x_mesh) and is_valid_mesh(y_mesh)):
+        print(f"[Erreur] Profil de calibration invalide ({path})")
+        return None
+    return x_mesh, y_mesh
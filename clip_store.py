@@ -0,0 +1,260 @@
+"""
+ClipStore - Données des clips en mémoire avec écriture différée sur disque.
+
+Le fichier JSON n'est lu qu'une fois : les fonctions de utils.py travaillent sur
+la liste en mémoire puis appellent save(), qui programme une écriture groupée
+dans un thread (fichier temporaire + os.replace, donc jamais de JSON tronqué).
+Plusieurs modifications rapprochées ne produisent qu'une seule écriture.
+"""
+
+import os, json, threading, tempfile, atexit
+
+# Délai de regroupement des écritures (secondes)
+FLUSH_DELAY = 0.3
+
+# Clé des clips partiels de load_active() dont le corps HTML n'est pas encore lu :
+# fonction sans argument qui le lit (jamais présente dans load(), jamais écrite)
+LAZY_HTML_KEY = "_lazy_html"
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+class ClipIndex:
+    """
+    Index des clips de premier niveau : alias -> clip, id -> clip,
+    alias de groupe -> enfants, alias d'enfant -> alias du groupe parent.
+    Les enregistrements indexés sont ceux de la liste du ClipStore (mêmes objets).
+    """
+
+    def __init__(self, data=()):
+        self.by_alias = {}
+        self.by_id = {}
+        self.group_children = {}
+        self.parent_of = {}
+        for item in data:
+            self.add(item)
+
+    def add(self, item):
+        alias = item.get('alias')
+        self.by_alias[alias] = item
+        if item.get('id') is not None:
+            self.by_id[item.get('id')] = item
+        if item.get('type') == 'group':
+            children = item.setdefault('children', [])
+            self.group_children[alias] = children
+            for child in children:
+                self.parent_of[child.get('alias')] = alias
+
+    def remove(self, alias):
+        item = self.by_alias.pop(alias, None)
+        if item is None:
+            return None
+        if self.by_id.get(item.get('id')) is item:
+            del self.by_id[item.get('id')]
+        for child in self.group_children.pop(alias, []):
+            if self.parent_of.get(child.get('alias')) == alias:
+                del self.parent_of[child.get('alias')]
+        return item
+
+    def rename(self, old_alias, new_alias):
+        """À appeler après avoir changé item['alias']"""
+        item = self.by_alias.pop(old_alias, None)
+        if item is None:
+            return
+        self.by_alias[new_alias] = item
+        if old_alias in self.group_children:
+            self.group_children[new_alias] = self.group_children.pop(old_alias)
+            for child in self.group_children[new_alias]:
+                self.parent_of[child.get('alias')] = new_alias
+
+    def add_child(self, group_alias, child):
+        """À appeler après avoir ajouté child à la liste children du groupe"""
+        self.parent_of[child.get('alias')] = group_alias
+
+    def remove_child(self, group_alias, child_alias):
+        """À appeler après avoir retiré un enfant de la liste children du groupe"""
+        if self.parent_of.get(child_alias) == group_alias:
+            del self.parent_of[child_alias]
+
+    def rename_child(self, group_alias, old_alias, new_alias):
+        """À appeler après avoir changé l'alias d'un enfant de groupe"""
+        if self.parent_of.get(old_alias) == group_alias:
+            del self.parent_of[old_alias]
+        self.parent_of[new_alias] = group_alias
+
+
+class ClipStore:
+    """Possède la liste des clips d'un fichier JSON et la persiste en arrière-plan"""
+
+    def __init__(self, json_path):
+        self.json_path = json_path
+        # Fichier réellement lu/écrit (le .json ici, la base pour SqliteClipStore)
+        self.storage_path = json_path
+        # RLock : les mutateurs de utils.py le tiennent pendant toute leur modification
+        self.lock = threading.RLock()
+        self.data = None
+        self.dirty = False
+        self.generation = 0
+        self._mtime = None
+        self._timer = None
+        self._index = None
+        # Sérialise les écritures (thread d'écriture différée et close())
+        self._write_lock = threading.Lock()
+
+    def _file_mtime(self):
+        try:
+            return os.path.getmtime(self.storage_path)
+        except OSError:
+            return None
+
+    def _read(self):
+        """Lit toutes les données depuis le disque (le fichier existe)"""
+        with open(self.storage_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        return json.loads(content) if content.strip() else []
+
+    def _snapshot(self):
+        """Capture ce qu'il faut écrire (appelé sous self.lock)"""
+        return json.dumps(self.data, indent=4, ensure_ascii=False)
+
+    def _write(self, content):
+        """Écrit la capture sur disque, hors verrou (fichier temporaire + os.replace)"""
+        directory = os.path.dirname(self.storage_path) or "."
+        fd, tmp_path = tempfile.mkstemp(prefix=".clip_notes_", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, self.storage_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def exists(self):
+        """True si des données sont en mémoire ou si le fichier existe"""
+        with self.lock:
+            if self.data is not None and self.dirty:
+                return True
+        return os.path.exists(self.storage_path)
+
+    def load(self):
+        """
+        Retourne la liste des clips (référence vivante, à modifier sous self.lock).
+        Relit le fichier s'il a été modifié par un autre programme.
+        Lève json.JSONDecodeError si le fichier est invalide.
+        """
+        with self.lock:
+            if self.data is not None and (self.dirty or self._file_mtime() == self._mtime):
+                return self.data
+            mtime = self._file_mtime()
+            self.data = self._read() if mtime is not None else []
+            self._mtime = mtime
+            self._index = None
+            return self.data
+
+    def load_active(self):
+        """
+        Clips actifs (non stockés), pour construire le menu.
+        Les enregistrements ne sont qu'à lire : les modifications passent par load().
+        """
+        return [item for item in self.load() if not item.get('stored', False)]
+
+    @property
+    def index(self):
+        """ClipIndex à jour des données (reconstruit seulement après une modification structurelle)"""
+        with self.lock:
+            data = self.load()
+            if self._index is None:
+                self._index = ClipIndex(data)
+            return self._index
+
+    def save(self, data=None, reindex=True):
+        """
+        Remplace les données (si fournies) et programme une écriture différée.
+        reindex=False quand l'appelant a déjà mis l'index à jour lui-même
+        (ce que font les mutateurs de utils.py : ajout, suppression, déplacement,
+        renommage, groupes).
+        """
+        with self.lock:
+            if reindex:
+                self._index = None
+            if data is not None and data is not self.data:
+                # Modifier en place pour que les références existantes restent valides
+                if self.data is None:
+                    self.data = data
+                else:
+                    self.data[:] = data
+            self.dirty = True
+            self.generation += 1
+            if self._timer is None:
+                self._timer = threading.Timer(FLUSH_DELAY, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """Écrit les données sur disque si nécessaire (atomique)"""
+        with self._write_lock:
+            with self.lock:
+                self._timer = None
+                if not self.dirty or self.data is None:
+                    return
+                snapshot = self._snapshot()
+                generation = self.generation
+
+            try:
+                self._write(snapshot)
+            except Exception as e:
+                print(f"[Erreur] Écriture de {self.storage_path} impossible : {e}")
+                return
+
+            with self.lock:
+                self._mtime = self._file_mtime()
+                # Une modification arrivée pendant l'écriture reste à écrire
+                if self.generation == generation:
+                    self.dirty = False
+
+    def close(self):
+        """Annule l'écriture programmée et écrit immédiatement"""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self.flush()
+
+
+def get_clip_store(file_path):
+    """
+    Retourne le ClipStore (unique) associé au fichier JSON.
+    Si une base SQLite migrée existe à côté (clip_notes.sqlite3), elle est utilisée à la place.
+    """
+    json_path = os.path.abspath(file_path.replace('.txt', '.json'))
+    with _stores_lock:
+        store = _stores.get(json_path)
+        if store is None:
+            db_path = sqlite_path_for(json_path)
+            if os.path.exists(db_path):
+                from clip_store_sqlite import SqliteClipStore
+                store = SqliteClipStore(json_path, db_path)
+            else:
+                store = ClipStore(json_path)
+            _stores[json_path] = store
+        return store
+
+
+def sqlite_path_for(json_path):
+    """Chemin de la base SQLite optionnelle associée à un fichier de clips JSON"""
+    return os.path.splitext(json_path)[0] + ".sqlite3"
+
+
+def flush_all_stores():
+    """Écrit immédiatement toutes les modifications en attente"""
+    with _stores_lock:
+        stores = list(_stores.values())
+    for store in stores:
+        store.close()
+
+
+atexit.register(flush_all_stores)
@@ -0,0 +1,350 @@
+"""
+SqliteClipStore - Backend SQLite optionnel du ClipStore.
+
+Même interface que ClipStore (load/save/index/flush) : les fonctions de utils.py
+ne changent pas. Au lieu de réécrire tout le JSON, chaque écriture différée
+n'applique que les lignes modifiées, dans une seule transaction (base en WAL).
+Les corps HTML (souvent volumineux) sont dans une table séparée.
+
+Au démarrage, load_active() ne lit que les clips actifs : les clips stockés ne
+sont chargés qu'au premier load() (onglet des clips stockés, modification), et
+les corps HTML dont l'aperçu suffit au tooltip ne sont lus qu'à la copie.
+
+Activation : migrer une fois le JSON existant, la base clip_notes.sqlite3 créée
+à côté est ensuite utilisée automatiquement.
+
+    python3 clip_store_sqlite.py migrate clip_notes.json
+    python3 clip_store_sqlite.py export clip_notes.json   # retour au JSON
+"""
+
+import os, sys, json, sqlite3, functools
+from collections import Counter
+
+from clip_store import ClipStore, sqlite_path_for, LAZY_HTML_KEY
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS clips (
+    alias TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    id INTEGER,
+    created_at TEXT,
+    type TEXT,
+    action TEXT,
+    string TEXT,
+    stored INTEGER,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS clips_active ON clips(stored, position);
+CREATE TABLE IF NOT EXISTS group_children (
+    group_alias TEXT NOT NULL,
+    alias TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    id INTEGER,
+    created_at TEXT,
+    type TEXT,
+    action TEXT,
+    string TEXT,
+    stored INTEGER,
+    extra TEXT,
+    PRIMARY KEY (group_alias, alias)
+);
+CREATE TABLE IF NOT EXISTS html_bodies (
+    owner TEXT NOT NULL,
+    alias TEXT NOT NULL,
+    key TEXT NOT NULL,
+    body TEXT NOT NULL,
+    PRIMARY KEY (owner, alias, key)
+);
+"""
+
+# Colonnes communes aux tables clips et group_children (après la position)
+COLUMNS = ("id", "created_at", "type", "action", "string", "stored")
+HTML_KEYS = ("html_string", "html")
+
+
+def connect(db_path):
+    conn = sqlite3.connect(db_path, timeout=5)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _record_to_row(item, position):
+    """Découpe un clip en (ligne, {clé html: corps})"""
+    values = [position]
+    for column in COLUMNS:
+        value = item.get(column)
+        if column == "stored" and value is not None:
+            value = int(bool(value))
+        values.append(value)
+    extra = {k: v for k, v in item.items()
+             if k not in COLUMNS and k not in HTML_KEYS and k not in ("alias", "children")}
+    # Les valeurs explicitement nulles sont conservées dans extra
+    extra.update({k: None for k in COLUMNS if k in item and item[k] is None})
+    values.append(json.dumps(extra, ensure_ascii=False) if extra else None)
+    html = {k: item[k] for k in HTML_KEYS if isinstance(item.get(k), str)}
+    return tuple(values), html
+
+
+def _row_to_record(alias, row):
+    """Reconstruit un clip depuis une ligne (position, colonnes..., extra)"""
+    item = {}
+    for column, value in zip(COLUMNS, row[1:-1]):
+        if value is not None:
+            item[column] = bool(value) if column == "stored" else value
+    item["alias"] = alias
+    if row[-1]:
+        item.update(json.loads(row[-1]))
+    return item
+
+
+def _rows_from_data(data):
+    """Lignes attendues en base pour une liste de clips"""
+    clips, children, html = {}, {}, {}
+    for position, item in enumerate(data):
+        alias = item.get("alias")
+        clips[alias], bodies = _record_to_row(item, position)
+        for key, body in bodies.items():
+            html[("", alias, key)] = body
+        for child_position, child in enumerate(item.get("children", []) if item.get("type") == "group" else []):
+            child_alias = child.get("alias")
+            children[(alias, child_alias)], bodies = _record_to_row(child, child_position)
+            for key, body in bodies.items():
+                html[(alias, child_alias, key)] = body
+    return clips, children, html
+
+
+def _diff(old, new):
+    """(clés à supprimer, {clé: valeur} à écrire)"""
+    removed = [key for key in old if key not in new]
+    changed = {key: value for key, value in new.items() if old.get(key) != value}
+    return removed, changed
+
+
+def _key(key):
+    return key if isinstance(key, tuple) else (key,)
+
+
+def write_rows(conn, old, new):
+    """Applique la différence entre deux états (clips, children, html) en une transaction"""
+    (old_clips, old_children, old_html), (clips, children, html) = old, new
+    placeholders = ", ".join("?" * (len(COLUMNS) + 2))
+    with conn:
+        removed, changed = _diff(old_clips, clips)
+        conn.executemany("DELETE FROM clips WHERE alias = ?", [_key(k) for k in removed])
+        conn.executemany(f"INSERT OR REPLACE INTO clips VALUES (?, {placeholders})",
+                         [(k,) + row for k, row in changed.items()])
+
+        removed, changed = _diff(old_children, children)
+        conn.executemany("DELETE FROM group_children WHERE group_alias = ? AND alias = ?", removed)
+        conn.executemany(f"INSERT OR REPLACE INTO group_children VALUES (?, ?, {placeholders})",
+                         [k + row for k, row in changed.items()])
+
+        removed, changed = _diff(old_html, html)
+        conn.executemany("DELETE FROM html_bodies WHERE owner = ? AND alias = ? AND key = ?", removed)
+        conn.executemany("INSERT OR REPLACE INTO html_bodies VALUES (?, ?, ?, ?)",
+                         [k + (body,) for k, body in changed.items()])
+
+
+def read_rows(conn):
+    """Lit la base : (liste des clips, état des lignes pour les prochains diffs)"""
+    html = {(owner, alias, key): body
+            for owner, alias, key, body in conn.execute("SELECT owner, alias, key, body FROM html_bodies")}
+
+    children_rows = {}
+    children_by_group = {}
+    for row in conn.execute("SELECT * FROM group_children ORDER BY group_alias, position"):
+        group_alias, alias, values = row[0], row[1], tuple(row[2:])
+        children_rows[(group_alias, alias)] = values
+        child = _row_to_record(alias, values)
+        for key in HTML_KEYS:
+            if (group_alias, alias, key) in html:
+                child[key] = html[(group_alias, alias, key)]
+        children_by_group.setdefault(group_alias, []).append(child)
+
+    data = []
+    clip_rows = {}
+    for row in conn.execute("SELECT * FROM clips ORDER BY position"):
+        alias, values = row[0], tuple(row[1:])
+        clip_rows[alias] = values
+        item = _row_to_record(alias, values)
+        for key in HTML_KEYS:
+            if ("", alias, key) in html:
+                item[key] = html[("", alias, key)]
+        if item.get("type") == "group":
+            item["children"] = children_by_group.get(alias, [])
+        data.append(item)
+
+    return data, (clip_rows, children_rows, html)
+
+
+ACTIVE = "(stored IS NULL OR stored = 0)"
+
+
+def read_html_body(db_path, owner, alias, key):
+    """Corps HTML d'un clip (owner : alias du groupe parent, '' au premier niveau), ou None"""
+    conn = connect(db_path)
+    try:
+        row = conn.execute("SELECT body FROM html_bodies WHERE owner = ? AND alias = ? AND key = ?",
+                           (owner, alias, key)).fetchone()
+    finally:
+        conn.close()
+    return row[0] if row else None
+
+
+def _attach_html(conn, db_path, item, owner, alias, html_keys):
+    """
+    Ajoute ses corps HTML à un clip partiel. Avec un aperçu (html_preview), le
+    tooltip n'a pas besoin du corps : il n'est lu qu'à la demande.
+    """
+    for key in HTML_KEYS:
+        if (owner, alias, key) not in html_keys:
+            continue
+        if "html_preview" in item:
+            item[LAZY_HTML_KEY] = functools.partial(read_html_body, db_path, owner, alias, key)
+        else:
+            item[key] = conn.execute("SELECT body FROM html_bodies WHERE owner = ? AND alias = ? AND key = ?",
+                                     (owner, alias, key)).fetchone()[0]
+
+
+def read_active_rows(conn, db_path):
+    """Clips actifs seulement (menu) : sans les clips stockés, corps HTML différés si possible"""
+    # Clés seulement : les corps (en fin de ligne) ne sont pas lus
+    html_keys = set(conn.execute("SELECT owner, alias, key FROM html_bodies"))
+
+    children_by_group = {}
+    for row in conn.execute(f"SELECT * FROM group_children WHERE group_alias IN "
+                            f"(SELECT alias FROM clips WHERE type = 'group' AND {ACTIVE}) "
+                            f"ORDER BY group_alias, position"):
+        group_alias, alias = row[0], row[1]
+        child = _row_to_record(alias, tuple(row[2:]))
+        _attach_html(conn, db_path, child, group_alias, alias, html_keys)
+        children_by_group.setdefault(group_alias, []).append(child)
+
+    data = []
+    for row in conn.execute(f"SELECT * FROM clips WHERE {ACTIVE} ORDER BY position"):
+        alias = row[0]
+        item = _row_to_record(alias, tuple(row[1:]))
+        _attach_html(conn, db_path, item, "", alias, html_keys)
+        if item.get("type") == "group":
+            item["children"] = children_by_group.get(alias, [])
+        data.append(item)
+    return data
+
+
+class SqliteClipStore(ClipStore):
+    """ClipStore persistant dans une base SQLite (écritures incrémentales)"""
+
+    def __init__(self, json_path, db_path):
+        super().__init__(json_path)
+        self.storage_path = db_path
+        # État des lignes en base, pour n'écrire que les différences
+        self._persisted = ({}, {}, {})
+        # Clips actifs lus sans le reste (tant que load() n'a pas été appelé)
+        self._active = None
+        self._active_mtime = None
+
+    def _file_mtime(self):
+        # En WAL, les écritures touchent d'abord le fichier -wal
+        mtimes = []
+        for path in (self.storage_path, self.storage_path + "-wal"):
+            try:
+                mtimes.append(os.path.getmtime(path))
+            except OSError:
+                pass
+        return max(mtimes) if mtimes else None
+
+    def _read(self):
+        conn = connect(self.storage_path)
+        try:
+            data, self._persisted = read_rows(conn)
+        finally:
+            conn.close()
+        self._active = None
+        return data
+
+    def load_active(self):
+        """
+        Clips actifs. Tant que tout n'est pas chargé, seuls eux sont lus (copies
+        à ne pas modifier), avec leurs corps HTML différés quand c'est possible.
+        """
+        with self.lock:
+            if self.data is not None and (self.dirty or self._file_mtime() == self._mtime):
+                return super().load_active()
+            mtime = self._file_mtime()
+            if mtime is None:
+                return []
+            if self._active is None or self._active_mtime != mtime:
+                conn = connect(self.storage_path)
+                try:
+                    self._active = read_active_rows(conn, self.storage_path)
+                finally:
+                    conn.close()
+                self._active_mtime = mtime
+            return self._active
+
+    def _snapshot(self):
+        return _rows_from_data(self.data)
+
+    def _write(self, rows):
+        conn = connect(self.storage_path)
+        try:
+            write_rows(conn, self._persisted, rows)
+        finally:
+            conn.close()
+        self._persisted = rows
+
+
+def migrate_json_to_sqlite(json_path, db_path=None):
+    """
+    Crée la base SQLite à partir du fichier JSON (id, created_at, stored, groupes, HTML).
+    Le fichier JSON n'est pas modifié. Retourne True si succès.
+    """
+    db_path = db_path or sqlite_path_for(json_path)
+    if os.path.exists(db_path):
+        print(f"[Erreur] La base {db_path} existe déjà")
+        return False
+    try:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"[Erreur] Lecture de {json_path} impossible : {e}")
+        return False
+
+    counts = Counter(item.get("alias") for item in data)
+    duplicates = {alias for alias, count in counts.items() if count > 1}
+    if duplicates:
+        print(f"[Erreur] Alias en double, migration annulée : {', '.join(map(str, duplicates))}")
+        return False
+
+    conn = connect(db_path)
+    try:
+        write_rows(conn, ({}, {}, {}), _rows_from_data(data))
+    finally:
+        conn.close()
+    print(f"[Info] {len(data)} clips migrés vers {db_path}")
+    return True
+
+
+def export_sqlite_to_json(json_path, db_path=None):
+    """Réécrit le fichier JSON depuis la base (pour revenir au backend JSON)"""
+    db_path = db_path or sqlite_path_for(json_path)
+    conn = connect(db_path)
+    try:
+        data, _ = read_rows(conn)
+    finally:
+        conn.close()
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=4, ensure_ascii=False)
+    print(f"[Info] {len(data)} clips exportés vers {json_path}")
+    return True
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3 or sys.argv[1] not in ("migrate", "export"):
+        print("Usage : python3 clip_store_sqlite.py migrate|export clip_notes.json")
+        sys.exit(2)
+    command, path = sys.argv[1], os.path.abspath(sys.argv[2])
+    ok = migrate_json_to_sqlite(path) if command == "migrate" else export_sqlite_to_json(path)
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,86 @@
+"""
+Client léger pour le daemon ClipNotes.
+
+Le raccourci clavier lance ce script au lieu de démarrer une nouvelle instance
+de ClipNotesWindow : il envoie simplement une commande ("show", "hide", "quit",
+"ping") au daemon résident via un socket Unix. Si aucun daemon ne répond, il le
+démarre puis renvoie la commande. "pos" affiche la position corrigée du curseur
+("x,y") connue du daemon, pour les scripts qui en ont besoin.
+
+N'importe que la bibliothèque standard pour rester quasi instantané.
+"""
+
+import os, sys, socket, subprocess, time
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SOCKET_NAME = "clipnotes.sock"
+COMMANDS = ("show", "hide", "quit", "ping", "pos")
+
+
+def get_socket_path():
+    """Chemin du socket du daemon (sous $XDG_RUNTIME_DIR si disponible)"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, SOCKET_NAME)
+    return os.path.join("/tmp", f"clipnotes-{os.getuid()}.sock")
+
+
+def send_command(command, timeout=1.0):
+    """
+    Envoie une commande au daemon et retourne sa réponse.
+    Retourne None si aucun daemon n'écoute.
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(get_socket_path())
+            sock.sendall((command + "\n").encode("utf-8"))
+            return sock.recv(64).decode("utf-8").strip()
+    except (OSError, socket.timeout):
+        return None
+
+
+def start_daemon(show=True):
+    """Démarre le daemon en arrière-plan, détaché du terminal"""
+    args = [sys.executable, os.path.join(_SCRIPT_DIR, "ClipNotesWindow.py"), "--daemon"]
+    if show:
+        args.append("--show")
+    subprocess.Popen(
+        args,
+        cwd=_SCRIPT_DIR,
+        stdin=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+
+def main(argv):
+    command = argv[1] if len(argv) > 1 else "show"
+    if command not in COMMANDS:
+        print(f"[Erreur] Commande inconnue : {command} (attendu : {', '.join(COMMANDS)})")
+        return 2
+
+    response = send_command(command)
+    if response is not None:
+        if command == "pos":
+            print(response)
+        return 0
+
+    # Pas de daemon : inutile d'en démarrer un pour le fermer ou le cacher
+    if command in ("hide", "quit", "ping", "pos"):
+        print("[Info] Aucun daemon ClipNotes en cours")
+        return 1
+
+    # Démarrage à froid : le daemon affiche lui-même le menu une fois prêt
+    start_daemon()
+    deadline = time.monotonic() + 5.0
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        if send_command("ping") is not None:
+            return 0
+    print("[Erreur] Le daemon ClipNotes n'a pas démarré")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
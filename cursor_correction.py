@@ -0,0 +1,166 @@
+"""
+CursorCorrection - Correction de la position du curseur par maillage.
+
+Un maillage est une grille N×M de corrections (en pixels) réparties uniformément
+sur l'écran : le nœud (ligne 0, colonne 0) est le coin haut-gauche, le nœud
+(N-1, M-1) le coin bas-droite. Entre les nœuds, la correction est interpolée
+(bilinéaire).
+
+Plutôt que d'interpoler à chaque mouvement, la correction de tous les points de
+l'écran (un point tous les `stride` pixels) est calculée une fois dans une table :
+corriger une position revient ensuite à lire une case. Plusieurs maillages
+(ex: la grille 3×3 du tracker + cursor_mesh.json) sont additionnés dans la même
+table. NumPy est utilisé pour la construire s'il est installé.
+"""
+
+import os, re, json
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MESH_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cursor_mesh.json")
+# Sans NumPy, un pas plus large garde la construction de la table sous ~30 ms
+# (écart d'au plus ~1,5 px avec la grille du tracker)
+DEFAULT_STRIDE = 4 if np is not None else 8
+
+
+def load_mesh(path=MESH_FILE):
+    """
+    Charge un maillage {"x_mesh": [[...]], "y_mesh": [[...]]}.
+    Retourne (x_mesh, y_mesh), ou None si le fichier est absent ou invalide.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        x_mesh, y_mesh = data["x_mesh"], data["y_mesh"]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"[Erreur] Maillage illisible ({path}) : {e}")
+        return None
+    if not (is_valid_mesh(x_mesh) and is_valid_mesh(y_mesh)):
+        print(f"[Erreur] Maillage invalide ({path}) : grilles rectangulaires d'au moins 2×2 attendues")
+        return None
+    return x_mesh, y_mesh
+
+
+def safe_screen_name(screen_name):
+    """Nom d'écran utilisable dans un nom de fichier"""
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", screen_name or "")
+
+
+def is_valid_mesh(mesh):
+    try:
+        return (len(mesh) >= 2 and len(mesh[0]) >= 2
+                and all(len(row) == len(mesh[0]) for row in mesh)
+                and all(isinstance(v, (int, float)) for row in mesh for v in row))
+    except TypeError:
+        return False
+
+
+def mesh_value(mesh, width, height, x, y):
+    """Correction interpolée d'un maillage en (x, y) : calcul direct, sans table"""
+    n_rows, n_cols = len(mesh), len(mesh[0])
+    gx = min(max(x, 0), width) * (n_cols - 1) / width
+    gy = min(max(y, 0), height) * (n_rows - 1) / height
+    cx = min(int(gx), n_cols - 2)
+    cy = min(int(gy), n_rows - 2)
+    tx = gx - cx
+    ty = gy - cy
+    top = mesh[cy][cx] + (mesh[cy][cx + 1] - mesh[cy][cx]) * tx
+    bottom = mesh[cy + 1][cx] + (mesh[cy + 1][cx + 1] - mesh[cy + 1][cx]) * tx
+    return top + (bottom - top) * ty
+
+
+class CursorCorrection:
+    """
+    Table de correction d'un écran width×height.
+
+    Args:
+        meshes: liste de (x_mesh, y_mesh), additionnés
+        stride: pas de la table en pixels (1 = un point par pixel)
+    """
+
+    def __init__(self, width, height, meshes, stride=DEFAULT_STRIDE):
+        self.width = max(int(width), 1)
+        self.height = max(int(height), 1)
+        self.stride = max(int(stride), 1)
+        self._half = self.stride // 2
+        self.meshes = [(x_mesh, y_mesh) for x_mesh, y_mesh in meshes]
+        # Points de la table : 0, stride, 2*stride, ... jusqu'au bord inclus
+        self.cols = (self.width + self.stride - 1) // self.stride + 1
+        self.rows = (self.height + self.stride - 1) // self.stride + 1
+        if np is not None:
+            self._dx, self._dy = self._build_numpy()
+        else:
+            self._dx, self._dy = self._build_python()
+
+    def correct(self, raw_x, raw_y):
+        """Position corrigée (x, y) : une lecture dans la table (point le plus proche)"""
+        col = min(max((int(raw_x) + self._half) // self.stride, 0), self.cols - 1)
+        row = min(max((int(raw_y) + self._half) // self.stride, 0), self.rows - 1)
+        i = row * self.cols + col
+        return int(raw_x) + self._dx[i], int(raw_y) + self._dy[i]
+
+    def _axis(self, count, size):
+        """Coordonnées des points de la table sur un axe (la dernière bornée au bord)"""
+        return [min(i * self.stride, size) for i in range(count)]
+
+    def _build_numpy(self):
+        xs = np.minimum(np.arange(self.cols) * self.stride, self.width)
+        ys = np.minimum(np.arange(self.rows) * self.stride, self.height)
+        tables = []
+        for axis in (0, 1):
+            total = np.zeros((self.rows, self.cols))
+            for mesh_pair in self.meshes:
+                mesh = np.asarray(mesh_pair[axis], dtype=float)
+                n_rows, n_cols = mesh.shape
+                gx = xs * (n_cols - 1) / self.width
+                gy = ys * (n_rows - 1) / self.height
+                cx = np.minimum(gx.astype(int), n_cols - 2)
+                cy = np.minimum(gy.astype(int), n_rows - 2)
+                tx = gx - cx
+                ty = (gy - cy)[:, None]
+                top = mesh[cy][:, cx] * (1 - tx) + mesh[cy][:, cx + 1] * tx
+                bottom = mesh[cy + 1][:, cx] * (1 - tx) + mesh[cy + 1][:, cx + 1] * tx
+                total += top * (1 - ty) + bottom * ty
+            table = array("i")
+            table.frombytes(np.rint(total).astype(np.int32).tobytes())
+            tables.append(table)
+        return tables[0], tables[1]
+
+    def _build_python(self):
+        # Interpolation séparable : chaque ligne de la table interpole d'abord le
+        # maillage verticalement (une valeur par colonne de nœuds), puis chaque
+        # point n'est plus qu'un lerp entre deux nœuds voisins
+        xs = self._axis(self.cols, self.width)
+        ys = self._axis(self.rows, self.height)
+        tables = []
+        for axis in (0, 1):
+            table = array("i")
+            meshes = []
+            for mesh_pair in self.meshes:
+                mesh = mesh_pair[axis]
+                n_rows, n_cols = len(mesh), len(mesh[0])
+                left, right, weights = [], [], []
+                for x in xs:
+                    gx = x * (n_cols - 1) / self.width
+                    cx = min(int(gx), n_cols - 2)
+                    left.append(cx)
+                    right.append(cx + 1)
+                    weights.append(gx - cx)
+                meshes.append((mesh, n_rows, left, right, weights))
+            for y in ys:
+                row = [0.0] * self.cols
+                for mesh, n_rows, left, right, weights in meshes:
+                    gy = y * (n_rows - 1) / self.height
+                    cy = min(int(gy), n_rows - 2)
+                    ty = gy - cy
+                    line = [a + (b - a) * ty for a, b in zip(mesh[cy], mesh[cy + 1])]
+                    row = [v + line[l] + (line[r] - line[l]) * t for v, l, r, t in zip(row, left, right, weights)]
+                table.extend(map(round, row))
+            tables.append(table)
+        return tables[0], tables[1]
@@ -0,0 +1,202 @@
+"""
+EmojiCatalog - Emojis du sélecteur : liste, index de recherche et planches d'icônes.
+
+emojis.txt n'est relu que s'il a changé. Chaque emoji est indexé par les mots de
+son nom Unicode (unicodedata) : la recherche au clavier est une recherche de
+préfixes dans une liste triée, sans parcourir les noms.
+
+Les icônes sont rendues par planches ("sprite sheets") de SHEET_SIZE emojis,
+enregistrées en PNG dans icon_cache/. Une planche est rendue une seule fois, dans
+un thread, puis relue telle quelle aux ouvertures suivantes du sélecteur.
+La clé des planches inclut la signature de emojis.txt et de la police : elles
+sont reconstruites si l'un des deux change.
+"""
+
+import os, glob, bisect, threading, tempfile, unicodedata
+from PIL import Image, ImageFont
+from icon_atlas import make_key, file_signature
+from utils import EMOJI_FONT_PATH, _render_emoji_image
+
+SHEET_VERSION = 1
+SHEET_COLUMNS = 32
+SHEET_SIZE = SHEET_COLUMNS * SHEET_COLUMNS  # Emojis par planche
+CELL_SIZE = 32
+MAX_RECENT_EMOJIS = 24
+
+_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icon_cache")
+
+# Caractères sans nom utile (liaison ZWJ, sélecteurs de variante)
+_IGNORED_CHARS = {"\u200d", "\ufe0e", "\ufe0f"}
+
+
+def emoji_name(emoji):
+    """Nom Unicode (en minuscules) d'un emoji, séquences comprises"""
+    names = []
+    for char in emoji:
+        if char in _IGNORED_CHARS:
+            continue
+        name = unicodedata.name(char, "")
+        if name:
+            names.append(name.lower())
+    return " ".join(names)
+
+
+def push_recent_emoji(recent, emoji, limit=MAX_RECENT_EMOJIS):
+    """Liste des emojis récents avec emoji en tête (sans doublon)"""
+    return ([emoji] + [e for e in recent if e != emoji])[:limit]
+
+
+class EmojiCatalog:
+    def __init__(self, path, cache_dir=_CACHE_DIR):
+        self.path = path
+        self.cache_dir = cache_dir
+        self.emojis = []
+        self.names = []
+        self.positions = {}     # emoji -> index
+        self._words = []        # mots des noms, triés
+        self._word_index = {}   # mot -> set d'indices
+        self._mtime = None
+        self._sheet_key = None
+        self._lock = threading.Lock()
+        self._queue = []        # planches à rendre (la plus prioritaire en tête)
+        self._callbacks = {}    # planche -> [on_done]
+        self._worker = None
+
+    def reload(self):
+        """(Re)lit emojis.txt s'il a changé. Retourne False si le fichier est introuvable."""
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            print(f"Fichier introuvable : {self.path}")
+            return False
+        if mtime == self._mtime:
+            return True
+        with open(self.path, "r", encoding="utf-8") as f:
+            emojis = [line.strip() for line in f if line.strip()]
+        names = [emoji_name(emoji) for emoji in emojis]
+        word_index = {}
+        for i, name in enumerate(names):
+            for word in name.split():
+                word_index.setdefault(word, set()).add(i)
+        with self._lock:
+            self.emojis = emojis
+            self.names = names
+            self.positions = {emoji: i for i, emoji in enumerate(emojis)}
+            self._word_index = word_index
+            self._words = sorted(word_index)
+            self._mtime = mtime
+            self._sheet_key = make_key(SHEET_VERSION, file_signature(self.path), file_signature(EMOJI_FONT_PATH), CELL_SIZE)[:16]
+            self._queue = []
+        self._remove_old_sheets()
+        return True
+
+    # === Recherche ===
+    def search(self, query):
+        """
+        Indices des emojis correspondant à la requête : chaque mot de la requête doit
+        être le début d'un mot du nom (ex: "smil cat"). Un emoji tapé tel quel est trouvé aussi.
+        """
+        words = query.lower().split()
+        if not words:
+            return list(range(len(self.emojis)))
+        result = None
+        for word in words:
+            matches = set()
+            start = bisect.bisect_left(self._words, word)
+            for name_word in self._words[start:]:
+                if not name_word.startswith(word):
+                    break
+                matches |= self._word_index[name_word]
+            if word in self.positions:
+                matches.add(self.positions[word])
+            result = matches if result is None else result & matches
+            if not result:
+                return []
+        return sorted(result)
+
+    # === Planches d'icônes ===
+    def sheet_of(self, index):
+        """(planche, x, y) de l'icône d'un emoji"""
+        sheet, pos = divmod(index, SHEET_SIZE)
+        return sheet, (pos % SHEET_COLUMNS) * CELL_SIZE, (pos // SHEET_COLUMNS) * CELL_SIZE
+
+    def sheet_path(self, sheet):
+        return os.path.join(self.cache_dir, f"emoji_sheet_{self._sheet_key}_{sheet}.png")
+
+    def _remove_old_sheets(self):
+        for path in glob.glob(os.path.join(self.cache_dir, "emoji_sheet_*.png")):
+            if not os.path.basename(path).startswith(f"emoji_sheet_{self._sheet_key}_"):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def request_sheet(self, sheet, on_done):
+        """
+        Demande le rendu d'une planche absente du disque. on_done(planche) est appelé
+        depuis le thread de rendu une fois le PNG écrit. La dernière demande passe en premier.
+        """
+        with self._lock:
+            self._callbacks.setdefault(sheet, []).append(on_done)
+            if sheet in self._queue:
+                self._queue.remove(sheet)
+            self._queue.insert(0, sheet)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._render_queue, daemon=True)
+                self._worker.start()
+
+    def _render_queue(self):
+        # Police propre au thread : la police partagée de utils sert au thread principal
+        try:
+            font = ImageFont.truetype(EMOJI_FONT_PATH, int(CELL_SIZE / 1.5))
+        except OSError:
+            font = ImageFont.load_default()
+        while True:
+            with self._lock:
+                if not self._queue:
+                    self._worker = None
+                    return
+                sheet = self._queue.pop(0)
+                path = self.sheet_path(sheet)
+                emojis = self.emojis[sheet * SHEET_SIZE:(sheet + 1) * SHEET_SIZE]
+            if not os.path.exists(path):
+                try:
+                    self._render_sheet(emojis, path, font)
+                except Exception as e:
+                    print(f"[Erreur] Rendu de la planche d'emojis {sheet} impossible : {e}")
+            with self._lock:
+                callbacks = self._callbacks.pop(sheet, [])
+            for on_done in callbacks:
+                try:
+                    on_done(sheet)
+                except RuntimeError:
+                    # Le sélecteur a été fermé entre-temps
+                    pass
+
+    def _render_sheet(self, emojis, path, font):
+        rows = (len(emojis) + SHEET_COLUMNS - 1) // SHEET_COLUMNS
+        sheet_img = Image.new("RGBA", (SHEET_COLUMNS * CELL_SIZE, max(rows, 1) * CELL_SIZE), (0, 0, 0, 0))
+        for pos, emoji in enumerate(emojis):
+            try:
+                img = _render_emoji_image(emoji, CELL_SIZE, font=font)
+            except Exception:
+                continue
+            sheet_img.paste(img, ((pos % SHEET_COLUMNS) * CELL_SIZE, (pos // SHEET_COLUMNS) * CELL_SIZE))
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".emoji_sheet_", suffix=".png", dir=self.cache_dir)
+        with os.fdopen(fd, "wb") as f:
+            sheet_img.save(f, format="PNG")
+        os.replace(tmp_path, path)
+
+
+_emoji_catalog = None
+
+
+def get_emoji_catalog(path):
+    """Catalogue unique du processus ; emojis.txt n'est relu que s'il a changé"""
+    global _emoji_catalog
+    if _emoji_catalog is None or _emoji_catalog.path != path:
+        _emoji_catalog = EmojiCatalog(path)
+    if not _emoji_catalog.reload():
+        return None
+    return _emoji_catalog
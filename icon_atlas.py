@@ -0,0 +1,210 @@
+"""
+IconAtlas - Cache disque persistant des icônes rendues (emoji, texte, miniatures).
+
+Les pixels RGBA de chaque icône sont ajoutés à un fichier binaire unique
+(icon_cache/atlas_v<N>.bin) lu par mmap au démarrage ; un index JSON associe
+à chaque clé (hash du contenu : type, label, taille, police ou fichier source)
+sa position dans l'atlas. Au démarrage à froid, le premier affichage du menu
+n'a donc plus besoin de PIL.
+
+Invalidation :
+- changement de police ou de fichier source : la clé change (signature incluse) ;
+- changement de format : incrémenter ATLAS_VERSION (les anciens fichiers sont supprimés) ;
+- atlas trop gros (entrées obsolètes accumulées) : il est vidé au chargement, ou
+  à l'écriture qui dépasserait ATLAS_MAX_BYTES.
+"""
+
+import os, json, mmap, fcntl, hashlib, threading, tempfile, atexit
+
+ATLAS_VERSION = 1
+ATLAS_MAX_BYTES = 32 * 1024 * 1024
+FLUSH_DELAY = 1.0
+
+_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icon_cache")
+
+
+def file_signature(path):
+    """Signature d'un fichier (police, image source) : change quand le fichier change"""
+    try:
+        st = os.stat(path)
+        return f"{os.path.abspath(path)}:{st.st_size}:{st.st_mtime_ns}"
+    except OSError:
+        return f"{path}:absent"
+
+
+def make_key(*parts):
+    return hashlib.sha1("\x1f".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+
+
+class IconAtlas:
+    def __init__(self, cache_dir=_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.bin_path = os.path.join(cache_dir, f"atlas_v{ATLAS_VERSION}.bin")
+        self.index_path = os.path.join(cache_dir, f"atlas_v{ATLAS_VERSION}.json")
+        self.lock_path = os.path.join(cache_dir, f"atlas_v{ATLAS_VERSION}.lock")
+        self.lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self.index = {}      # clé -> [offset, largeur, hauteur]
+        self.pending = {}    # clé -> (largeur, hauteur, pixels) pas encore écrits
+        self._map = None
+        self._timer = None
+        self._load()
+
+    def _load(self):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._remove_old_versions()
+            if os.path.getsize(self.bin_path) > ATLAS_MAX_BYTES:
+                self.clear()
+                return
+            # Verrou partagé : index et fichier lus pendant qu'aucun processus n'écrit
+            with open(self.lock_path, 'w') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_SH)
+                try:
+                    self.index = self._read_index()
+                    self._map = self._open_map()
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+        except (OSError, ValueError):
+            # Pas encore d'atlas (ou atlas illisible) : repartir de zéro
+            self.index = {}
+            self._map = None
+
+    def _remove_old_versions(self):
+        current = {os.path.basename(path) for path in (self.bin_path, self.index_path, self.lock_path)}
+        for name in os.listdir(self.cache_dir):
+            if name.startswith("atlas_v") and name not in current:
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _open_map(self):
+        with open(self.bin_path, 'rb') as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def get(self, key):
+        """Retourne (largeur, hauteur, pixels RGBA) ou None"""
+        with self.lock:
+            if key in self.pending:
+                return self.pending[key]
+            entry = self.index.get(key)
+            if entry is None or self._map is None:
+                return None
+            offset, width, height = entry
+            end = offset + width * height * 4
+            if end > len(self._map):
+                return None
+            return width, height, self._map[offset:end]
+
+    def put(self, key, width, height, pixels):
+        """Mémorise une icône ; elle est écrite sur disque peu après (écritures groupées)"""
+        with self.lock:
+            if key in self.index or key in self.pending:
+                return
+            self.pending[key] = (width, height, bytes(pixels))
+            if self._timer is None:
+                self._timer = threading.Timer(FLUSH_DELAY, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """
+        Ajoute les icônes en attente à l'atlas puis réécrit l'index (atomique).
+
+        Le daemon et une instance ponctuelle peuvent écrire le même atlas : l'ajout
+        et la réécriture de l'index se font sous un verrou fcntl, à partir de l'index
+        présent sur disque (les entrées écrites par l'autre processus sont gardées).
+        Les icônes écrites sont ensuite relues par mmap : rien ne reste en mémoire.
+        """
+        with self._write_lock:
+            with self.lock:
+                self._timer = None
+                if not self.pending:
+                    return
+                # Restent servies depuis pending jusqu'à la fin de l'écriture
+                pending = dict(self.pending)
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                with open(self.lock_path, 'w') as lock_file:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                    try:
+                        index = self._append(pending)
+                        # Projeté sous le verrou : l'index et le fichier sont de la même génération
+                        # (un autre processus peut remplacer l'atlas plein dès le verrou relâché)
+                        new_map = self._open_map()
+                    finally:
+                        fcntl.flock(lock_file, fcntl.LOCK_UN)
+            except (OSError, ValueError) as e:
+                print(f"[Erreur] Écriture de l'atlas d'icônes impossible : {e}")
+                return
+            with self.lock:
+                if self._map is not None:
+                    self._map.close()
+                self._map = new_map
+                self.index = index
+                for key in pending:
+                    self.pending.pop(key, None)
+
+    def _append(self, pending):
+        """Écrit les pixels puis l'index (verrou fcntl tenu). Retourne l'index à jour."""
+        index = self._read_index()
+        try:
+            size = os.path.getsize(self.bin_path)
+        except OSError:
+            size = 0
+        new_bytes = sum(len(pixels) for _, _, pixels in pending.values())
+        if size + new_bytes > ATLAS_MAX_BYTES:
+            # Atlas plein (entrées obsolètes accumulées) : repartir d'un fichier neuf.
+            # Remplacé et non tronqué : le mmap d'un autre processus reste valide
+            fd, tmp_path = tempfile.mkstemp(prefix=".atlas_", suffix=".bin", dir=self.cache_dir)
+            os.close(fd)
+            os.replace(tmp_path, self.bin_path)
+            index = {}
+        # Les pixels sont écrits avant l'index : l'index ne référence jamais de données absentes
+        with open(self.bin_path, 'ab') as f:
+            offset = f.tell()
+            for key, (width, height, pixels) in pending.items():
+                if key in index:
+                    continue  # Déjà écrite par un autre processus
+                f.write(pixels)
+                index[key] = [offset, width, height]
+                offset += len(pixels)
+        fd, tmp_path = tempfile.mkstemp(prefix=".atlas_", suffix=".tmp", dir=self.cache_dir)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, self.index_path)
+        return index
+
+    def clear(self):
+        """Vide l'atlas (mémoire et disque)"""
+        with self.lock:
+            self.index = {}
+            self.pending = {}
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            for path in (self.bin_path, self.index_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+_atlas = None
+
+
+def get_icon_atlas():
+    """Atlas unique du processus (créé au premier usage)"""
+    global _atlas
+    if _atlas is None:
+        _atlas = IconAtlas()
+        atexit.register(_atlas.flush)
+    return _atlas
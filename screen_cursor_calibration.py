@@ -1,13 +1,16 @@
 """
 Système de calibration pour CursorTracker
-Affiche des cibles sur une grille et calcule automatiquement les corrections nécessaires
+Affiche des cibles sur une grille et calcule automatiquement les corrections nécessaires :
+chaque clic donne la position brute du curseur (QCursor.pos()) et la position réelle,
+calibration_fit ajuste un champ de correction lisse et l'enregistre dans le profil
+de l'écran (cursor_calibration_<écran>.json), chargé par le tracker au démarrage.
 """
 
 from PyQt6.QtWidgets import QWidget, QApplication, QLabel, QPushButton, QVBoxLayout, QHBoxLayout
 from PyQt6.QtCore import Qt, QTimer, QPoint
 from PyQt6.QtGui import QPainter, QColor, QPen, QFont, QCursor
-import json
 import sys
+from calibration_fit import fit_correction, format_residuals, save_profile
 
 
 class CalibrationTarget(QWidget):
@@ -24,6 +27,9 @@ class CalibrationTarget(QWidget):
         self.clicked = False
         self.click_x = 0
         self.click_y = 0
+        # Position rapportée par QCursor.pos() au moment du clic (celle que corrige le tracker)
+        self.raw_x = 0
+        self.raw_y = 0
         
         # Fenêtre transparente qui couvre tout l'écran
         self.setWindowFlags(
@@ -35,6 +41,7 @@ class CalibrationTarget(QWidget):
         
         screen = QApplication.primaryScreen()
         geometry = screen.geometry()
+        self.screen_origin = geometry.topLeft()
         self.setGeometry(geometry)
         
         self.setMouseTracking(True)
@@ -82,6 +89,9 @@ class CalibrationTarget(QWidget):
             # Enregistrer la position du clic
             self.click_x = event.pos().x()
             self.click_y = event.pos().y()
+            raw = QCursor.pos() - self.screen_origin
+            self.raw_x = raw.x()
+            self.raw_y = raw.y()
             self.clicked = True
             self.close()
     
@@ -109,12 +119,15 @@ class CalibrationWindow(QWidget):
         
         screen = QApplication.primaryScreen()
         geometry = screen.geometry()
+        self.screen_name = screen.name()
+        self.device_pixel_ratio = screen.devicePixelRatio()
         self.screen_width = geometry.width()
         self.screen_height = geometry.height()
         
         # Résultats de calibration
         self.calibration_data = []
         self.current_point = 0
+        self.fit = None
         
         # Interface
         self.setup_ui()
@@ -196,6 +209,7 @@ class CalibrationWindow(QWidget):
     def start_calibration(self):
         self.calibration_data = []
         self.current_point = 0
+        self.fit = None
         self.start_btn.setEnabled(False)
         self.save_btn.setEnabled(False)
         
@@ -249,6 +263,8 @@ class CalibrationWindow(QWidget):
                     'screen_y': screen_y,
                     'click_x': target.click_x,
                     'click_y': target.click_y,
+                    'raw_x': target.raw_x,
+                    'raw_y': target.raw_y,
                     'correction_x': delta_x,
                     'correction_y': delta_y
                 })
@@ -282,6 +298,12 @@ class CalibrationWindow(QWidget):
         max_error_x = max(abs(d['correction_x']) for d in self.calibration_data)
         max_error_y = max(abs(d['correction_y']) for d in self.calibration_data)
         
+        # Ajuster le champ de correction (position brute -> position réelle du clic)
+        self.fit = fit_correction(self.calibration_samples(), self.screen_width, self.screen_height)
+        residuals = format_residuals(self.fit.residuals(self.calibration_samples()))
+        print(f"Champ de correction ajusté (degré {self.fit.degree})")
+        print(residuals)
+        
         results = (
             f"📊 Résultats:\n"
             f"• Points enregistrés: {recorded_points}/{total_points}\n"
@@ -290,7 +312,8 @@ class CalibrationWindow(QWidget):
             f"• Erreur moyenne Y: {avg_error_y:.1f} pixels\n"
             f"• Erreur max X: {max_error_x:.1f} pixels\n"
             f"• Erreur max Y: {max_error_y:.1f} pixels\n\n"
-            f"Cliquez sur 'Sauvegarder' pour générer le code."
+            f"{residuals}\n\n"
+            f"Cliquez sur 'Sauvegarder' pour enregistrer le profil de l'écran."
         )
         self.results_label.setText(results)
     
@@ -300,39 +323,26 @@ class CalibrationWindow(QWidget):
         for btn in self.grid_buttons:
             btn.setEnabled(True)
     
+    def calibration_samples(self):
+        """[(brut x, brut y, réel x, réel y)] des points enregistrés"""
+        return [(d['raw_x'], d['raw_y'], d['click_x'], d['click_y']) for d in self.calibration_data]
+    
     def save_calibration(self):
-        if not self.calibration_data:
+        if not self.calibration_data or self.fit is None:
             return
         
-        # Générer le code Python pour la grille de correction
-        code = "# Grille de correction générée automatiquement\n"
-        code += f"# Grille {self.grid_width}×{self.grid_height}\n"
-        code += "self.correction_grid = [\n"
-        
-        for data in self.calibration_data:
-            code += f"    ({data['grid_x']:.2f}, {data['grid_y']:.2f}, "
-            code += f"{data['correction_x']:.0f}, {data['correction_y']:.0f}),\n"
-        
-        code += "]\n"
-        
-        # Sauvegarder dans un fichier
-        with open('/home/claude/calibration_grid.py', 'w', encoding='utf-8') as f:
-            f.write(code)
-        
-        # Sauvegarder aussi en JSON pour analyse
-        with open('/home/claude/calibration_data.json', 'w', encoding='utf-8') as f:
-            json.dump(self.calibration_data, f, indent=2)
+        try:
+            path = save_profile(self.fit, self.calibration_samples(), self.screen_name, self.device_pixel_ratio)
+        except OSError as e:
+            print(f"[Erreur] Impossible d'enregistrer le profil de calibration : {e}")
+            self.results_label.setText(self.results_label.text() + f"\n\n❌ Enregistrement impossible : {e}")
+            return
         
         self.results_label.setText(
             self.results_label.text() + 
-            "\n\n✅ Sauvegardé dans:\n• calibration_grid.py (code à copier)\n• calibration_data.json (données brutes)"
+            f"\n\n✅ Profil enregistré :\n• {path}\nIl sera chargé au prochain démarrage du tracker."
         )
-        
-        print("\n" + "="*60)
-        print("CODE GÉNÉRÉ - Copiez ceci dans votre CursorTracker:")
-        print("="*60)
-        print(code)
-        print("="*60)
+        print(f"[Info] Profil de calibration enregistré : {path}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,137 @@
+"""
+ScreenProfiles - Profils de correction du curseur par écran.
+
+Chaque écran a son profil (nom, géométrie, devicePixelRatio) avec sa propre
+table de correction, normalisée à ses dimensions : la grille du tracker s'applique
+à chaque écran, et non plus au seul écran principal. Les profils sont gardés en
+cache et reconstruits seulement quand QGuiApplication signale un changement
+d'écran (ajout, retrait, géométrie, échelle).
+
+Un maillage propre à un écran peut être placé dans cursor_mesh_<nom>.json ;
+à défaut, cursor_mesh.json s'applique à tous les écrans. Un profil de calibration
+(cursor_calibration_<nom>.json, voir calibration_fit.py) remplace les deux : il
+décrit la correction complète mesurée sur cet écran.
+"""
+
+import os
+from PyQt6.QtCore import QObject, QPoint, QRect
+from PyQt6.QtGui import QGuiApplication, QCursor
+from cursor_correction import CursorCorrection, load_mesh, safe_screen_name, MESH_FILE
+from calibration_fit import load_profile, profile_path
+
+
+def screen_key(screen):
+    """Clé d'un profil : nom, géométrie et échelle de l'écran"""
+    geometry = screen.geometry()
+    return (screen.name(), geometry.x(), geometry.y(), geometry.width(), geometry.height(), screen.devicePixelRatio())
+
+
+def screen_mesh_file(screen_name):
+    """Maillage propre à un écran s'il existe, sinon le maillage commun"""
+    safe_name = safe_screen_name(screen_name)
+    path = os.path.join(os.path.dirname(MESH_FILE), f"cursor_mesh_{safe_name}.json")
+    return path if safe_name and os.path.exists(path) else MESH_FILE
+
+
+def screen_at(x=None, y=None):
+    """Écran contenant (x, y), ou celui du curseur ; l'écran principal à défaut"""
+    point = QPoint(int(x), int(y)) if x is not None and y is not None else QCursor.pos()
+    return QGuiApplication.screenAt(point) or QGuiApplication.primaryScreen()
+
+
+def clamp_center_to_screen(x, y, half_width, half_height=None):
+    """
+    Recentre (x, y) pour qu'un élément de demi-taille donnée reste dans la zone
+    disponible de l'écran où il s'ouvre.
+    """
+    if half_height is None:
+        half_height = half_width
+    screen = screen_at(x, y)
+    if screen is None:
+        return x, y
+    area = screen.availableGeometry()
+    if area.width() >= 2 * half_width:
+        x = min(max(x, area.left() + half_width), area.right() + 1 - half_width)
+    if area.height() >= 2 * half_height:
+        y = min(max(y, area.top() + half_height), area.bottom() + 1 - half_height)
+    return x, y
+
+
+class ScreenProfile:
+    """Correction du curseur sur un écran : table normalisée à sa géométrie"""
+
+    def __init__(self, screen, meshes):
+        self.name = screen.name()
+        self.geometry = QRect(screen.geometry())
+        self.device_pixel_ratio = screen.devicePixelRatio()
+        self.correction = CursorCorrection(self.geometry.width(), self.geometry.height(), meshes)
+
+    def correct(self, raw_x, raw_y):
+        """Position corrigée (coordonnées globales) d'une position globale sur cet écran"""
+        left, top = self.geometry.x(), self.geometry.y()
+        x, y = self.correction.correct(raw_x - left, raw_y - top)
+        return x + left, y + top
+
+
+class ScreenProfiles(QObject):
+    """
+    Profils de tous les écrans, indexés par screen_key.
+
+    Args:
+        base_meshes: maillages communs à tous les écrans (ex: la grille du tracker),
+            complétés par le maillage fin de chaque écran
+    """
+
+    def __init__(self, base_meshes, parent=None):
+        super().__init__(parent)
+        self.base_meshes = list(base_meshes)
+        self._profiles = {}   # screen_key -> ScreenProfile
+        self._by_screen = {}  # QScreen -> ScreenProfile (résolution O(1) depuis l'écran)
+        app = QGuiApplication.instance()
+        app.screenAdded.connect(self._on_screen_added)
+        app.screenRemoved.connect(self.invalidate)
+        app.primaryScreenChanged.connect(self.invalidate)
+        for screen in app.screens():
+            self._watch(screen)
+
+    def _watch(self, screen):
+        screen.geometryChanged.connect(self.invalidate)
+        screen.logicalDotsPerInchChanged.connect(self.invalidate)
+        screen.physicalDotsPerInchChanged.connect(self.invalidate)
+
+    def _on_screen_added(self, screen):
+        self._watch(screen)
+        self.invalidate()
+
+    def invalidate(self, *args):
+        """Oublie les profils : ils seront reconstruits à la prochaine demande"""
+        self._profiles.clear()
+        self._by_screen.clear()
+
+    def profile_for(self, screen):
+        profile = self._by_screen.get(screen)
+        if profile is None:
+            key = screen_key(screen)
+            profile = self._profiles.get(key)
+            if profile is None:
+                profile = ScreenProfile(screen, self.meshes_for(screen))
+                self._profiles[key] = profile
+            self._by_screen[screen] = profile
+        return profile
+
+    def meshes_for(self, screen):
+        """Profil de calibration de l'écran, sinon maillages communs + maillage fin"""
+        geometry = screen.geometry()
+        calibration = load_profile(profile_path(screen.name()), geometry.width(), geometry.height())
+        if calibration is not None:
+            return [calibration]
+        meshes = list(self.base_meshes)
+        fine_mesh = load_mesh(screen_mesh_file(screen.name()))
+        if fine_mesh is not None:
+            meshes.append(fine_mesh)
+        return meshes
+
+    def profile_at(self, x, y):
+        """Profil de l'écran contenant la position globale (x, y)"""
+        screen = screen_at(x, y)
+        return self.profile_for(screen) if screen is not None else None
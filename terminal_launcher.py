@@ -0,0 +1,166 @@
+"""
+TerminalLauncher - Exécution des clips "term".
+
+Le terminal est détecté une seule fois (shutil.which sur la liste TERMINALS) et
+mémorisé dans terminal_cache.json : les clics suivants lancent directement le bon
+émulateur, sans essayer les autres un par un. Le choix peut être imposé dans
+config.json ("terminal": "konsole").
+
+Mode tmux ("terminal_mode": "tmux") : au lieu d'ouvrir un nouvel émulateur à
+chaque clip, la commande est tapée dans une session tmux persistante
+("tmux_session", "clipnotes" par défaut). Un émulateur n'est ouvert, attaché à la
+session, que si aucun client n'y est connecté : quelques millisecondes par clip au
+lieu du démarrage d'un terminal.
+"""
+
+import os, json, shutil, subprocess, tempfile
+
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "terminal_cache.json")
+
+# Terminaux essayés dans l'ordre, avec l'option qui précède la commande à lancer
+TERMINALS = [
+    ("gnome-terminal", ["--"]),
+    ("konsole", ["-e"]),
+    ("xfce4-terminal", ["-x"]),
+    ("alacritty", ["-e"]),
+    ("kitty", []),
+    ("xterm", ["-e"]),
+    ("x-terminal-emulator", ["-e"]),
+]
+TERMINAL_MODES = ("window", "tmux")
+DEFAULT_TMUX_SESSION = "clipnotes"
+
+_settings = {"terminal": "auto", "mode": "window", "tmux_session": DEFAULT_TMUX_SESSION}
+_detected = None  # (nom, chemin) du terminal retenu pour ce processus
+
+
+def configure_terminal(terminal="auto", mode="window", tmux_session=DEFAULT_TMUX_SESSION):
+    """Applique les réglages de config.json (terminal imposé, mode, session tmux)"""
+    global _detected
+    terminal = terminal or "auto"
+    if terminal != _settings["terminal"]:
+        _detected = None
+    _settings["terminal"] = terminal
+    _settings["mode"] = mode if mode in TERMINAL_MODES else "window"
+    _settings["tmux_session"] = tmux_session or DEFAULT_TMUX_SESSION
+
+
+def _terminal_prefix(name):
+    """Option de lancement d'un terminal (« -e » pour un terminal inconnu)"""
+    for known, prefix in TERMINALS:
+        if known == name:
+            return prefix
+    return ["-e"]
+
+
+def _load_cache():
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        name, path = cached["terminal"], cached["path"]
+    except Exception:
+        return None
+    # Toujours installé au même endroit ?
+    if os.access(path, os.X_OK):
+        return name, path
+    return None
+
+
+def _save_cache(name, path):
+    try:
+        fd, tmp_path = tempfile.mkstemp(prefix=".terminal_", suffix=".tmp", dir=os.path.dirname(CACHE_FILE))
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"terminal": name, "path": path}, f)
+        os.replace(tmp_path, CACHE_FILE)
+    except Exception as e:
+        print(f"[Erreur] Impossible d'écrire {CACHE_FILE}: {e}")
+
+
+def detect_terminal(refresh=False):
+    """
+    Terminal à utiliser : (nom, chemin), ou None si aucun n'est installé.
+    Le terminal imposé dans la configuration passe avant la détection.
+    """
+    global _detected
+    if _detected is not None and not refresh:
+        return _detected
+
+    override = _settings["terminal"]
+    if override != "auto":
+        path = shutil.which(override)
+        if path:
+            _detected = (os.path.basename(override), path)
+            return _detected
+        print(f"[Erreur] Terminal « {override} » introuvable, détection automatique")
+
+    cached = None if refresh else _load_cache()
+    if cached is None:
+        for name, _ in TERMINALS:
+            path = shutil.which(name)
+            if path:
+                cached = (name, path)
+                _save_cache(name, path)
+                print(f"[Info] Terminal détecté : {name} ({path})")
+                break
+    _detected = cached
+    return _detected
+
+
+def open_in_terminal(command):
+    """Ouvre un nouvel émulateur qui exécute command puis garde un shell ouvert"""
+    terminal = detect_terminal()
+    if terminal is None:
+        return False
+    name, path = terminal
+    argv = [path] + _terminal_prefix(name) + ["bash", "-c", command + "; exec bash"]
+    try:
+        subprocess.Popen(argv, start_new_session=True)
+        return True
+    except OSError as e:
+        print(f"[Erreur] Lancement de {name} impossible: {e}")
+        # Le terminal mémorisé a disparu : redétecter au prochain clip
+        detect_terminal(refresh=True)
+        return False
+
+
+def _tmux(*args):
+    return subprocess.run(["tmux", *args], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+
+
+def send_to_tmux(command, session=None):
+    """
+    Tape command dans la session tmux (créée si besoin) et l'exécute.
+    Ouvre un émulateur attaché à la session si personne ne la regarde.
+    """
+    session = session or _settings["tmux_session"]
+    if shutil.which("tmux") is None:
+        return False
+    try:
+        if _tmux("has-session", "-t", f"={session}").returncode != 0:
+            if _tmux("new-session", "-d", "-s", session).returncode != 0:
+                return False
+        # Volet actif de la fenêtre courante de la session
+        target = f"={session}:"
+        for line in command.split("\n"):
+            if _tmux("send-keys", "-t", target, "-l", "--", line).returncode != 0:
+                return False
+            _tmux("send-keys", "-t", target, "Enter")
+        if not _tmux("list-clients", "-t", f"={session}").stdout.strip():
+            open_in_terminal(f"exec tmux attach-session -t '={session}'")
+        return True
+    except OSError as e:
+        print(f"[Erreur] tmux: {e}")
+        return False
+
+
+def run_in_terminal(command):
+    """Exécute un clip "term" selon le mode configuré (tmux ou nouvel émulateur)"""
+    if _settings["mode"] == "tmux":
+        if send_to_tmux(command):
+            return
+        print("[Info] tmux indisponible, ouverture d'un terminal")
+    if open_in_terminal(command):
+        return
+    # Si aucun terminal n'est trouvé
+    print("Aucun terminal trouvé. Exécution dans le shell actuel...")
+    subprocess.run(command, shell=True)
@@ -0,0 +1,110 @@
+"""
+Ajustement de calibration (calibration_fit.py) sur des décalages synthétiques,
+et chargement des profils versionnés.
+"""
+
+import json
+import random
+
+import pytest
+
+import calibration_fit
+from calibration_fit import fit_correction, save_profile, load_profile, choose_degree, PROFILE_VERSION
+from cursor_correction import CursorCorrection
+
+# (nom, largeur, hauteur) : un profil par écran
+SCREENS = [("eDP-1", 1920, 1080), ("HDMI-1", 2560, 1440), ("DP-2", 1280, 1024)]
+
+
+def offsets(x, y, width, height):
+    """Décalage lisse (degré 2) à retrouver"""
+    u, v = x / width, y / height
+    return 30 + 20 * u - 15 * v + 10 * u * v, -12 + 8 * u * u - 5 * v
+
+
+def grid_samples(width, height, noise=0.0, grid=6, seed=0):
+    rng = random.Random(seed)
+    samples = []
+    for row in range(grid):
+        for col in range(grid):
+            raw_x, raw_y = col / (grid - 1) * width, row / (grid - 1) * height
+            dx, dy = offsets(raw_x, raw_y, width, height)
+            samples.append((raw_x, raw_y, raw_x + dx + rng.gauss(0, noise), raw_y + dy + rng.gauss(0, noise)))
+    return samples
+
+
+@pytest.mark.parametrize("name,width,height", SCREENS)
+def test_fit_recovers_exact_offsets(name, width, height):
+    fit = fit_correction(grid_samples(width, height), width, height)
+    assert fit.degree == 3
+    rng = random.Random(name)
+    for _ in range(200):
+        x, y = rng.uniform(0, width), rng.uniform(0, height)
+        expected = offsets(x, y, width, height)
+        got = fit.evaluate(x, y)
+        assert got[0] == pytest.approx(expected[0], abs=0.01)
+        assert got[1] == pytest.approx(expected[1], abs=0.01)
+    residuals = fit.residuals(grid_samples(width, height))
+    assert residuals["global"]["max"] <= 0.01
+    assert len(residuals["zones"]) == 9
+
+
+@pytest.mark.parametrize("name,width,height", SCREENS)
+def test_fit_with_noisy_clicks_stays_within_bounds(name, width, height):
+    samples = grid_samples(width, height, noise=2.0, seed=len(name))
+    fit = fit_correction(samples, width, height)
+    residuals = fit.residuals(samples)
+    # Bruit de 2 px par axe : RMS résiduel de l'ordre de 2·√2 px au plus
+    assert residuals["global"]["rms"] <= 3.5
+    assert all(zone["rms"] <= 5.0 for zone in residuals["zones"].values())
+
+
+def test_degree_follows_sample_count():
+    assert choose_degree(1) == 0
+    assert choose_degree(3) == 1
+    assert choose_degree(6) == 2
+    assert choose_degree(36) == 3
+    # Points alignés : système dégénéré, degré réduit
+    samples = [(x, 500, x + 5, 503) for x in range(0, 1000, 100)]
+    fit = fit_correction(samples, 1000, 1000)
+    assert fit.evaluate(250, 500) == pytest.approx((5, 3), abs=0.01)
+
+
+def test_fit_without_samples():
+    assert fit_correction([], 1920, 1080) is None
+
+
+def test_profile_round_trip(tmp_path):
+    width, height = 1920, 1080
+    samples = grid_samples(width, height)
+    fit = fit_correction(samples, width, height)
+    path = save_profile(fit, samples, "eDP-1", path=str(tmp_path / "profile.json"))
+    x_mesh, y_mesh = load_profile(path, width, height)
+    assert len(x_mesh) == calibration_fit.PROFILE_MESH_SIZE
+    correction = CursorCorrection(width, height, [(x_mesh, y_mesh)], stride=1)
+    dx, dy = offsets(960, 540, width, height)
+    cx, cy = correction.correct(960, 540)
+    assert abs(cx - (960 + dx)) <= 1 and abs(cy - (540 + dy)) <= 1
+
+
+def test_wrong_version_falls_back_to_uncorrected(tmp_path):
+    width, height = 1920, 1080
+    samples = grid_samples(width, height)
+    path = save_profile(fit_correction(samples, width, height), samples, "eDP-1", path=str(tmp_path / "profile.json"))
+    with open(path, encoding="utf-8") as f:
+        profile = json.load(f)
+    profile["version"] = PROFILE_VERSION + 1
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(profile, f)
+
+    assert load_profile(path, width, height) is None
+    # Sans profil ni maillage : aucune correction
+    correction = CursorCorrection(width, height, [])
+    assert correction.correct(960, 540) == (960, 540)
+
+
+def test_other_resolution_is_ignored(tmp_path):
+    samples = grid_samples(1920, 1080)
+    path = save_profile(fit_correction(samples, 1920, 1080), samples, "eDP-1", path=str(tmp_path / "profile.json"))
+    assert load_profile(path, 2560, 1440) is None
+    assert load_profile(str(tmp_path / "absent.json"), 1920, 1080) is None
@@ -0,0 +1,66 @@
+"""
+Backend SQLite (clip_store_sqlite.py) : lecture des seuls clips actifs au
+démarrage, corps HTML différés, et écritures qui ne perdent rien de ce qui
+n'a pas été lu.
+"""
+
+import json
+
+from clip_store import LAZY_HTML_KEY
+from clip_store_sqlite import SqliteClipStore, migrate_json_to_sqlite, connect, read_rows
+
+DATA = [
+    {"alias": "court", "type": "clip", "action": "copy", "string": "a", "html_string": "<b>a</b>"},
+    {"alias": "long", "type": "clip", "action": "copy", "string": "b" * 3000,
+     "html_string": "<p>" + "b" * 3000 + "</p>", "preview": "b …", "html_preview": "<p>b …</p>"},
+    {"alias": "rangé", "type": "clip", "action": "copy", "string": "c", "html_string": "<i>c</i>", "stored": True},
+    {"alias": "groupe", "type": "group", "action": "copy", "children": [
+        {"alias": "enfant", "action": "copy", "string": "d", "html": "<u>d</u>", "html_preview": "<u>…</u>"},
+    ]},
+]
+
+
+def make_store(tmp_path):
+    json_path = tmp_path / "clip_notes.json"
+    json_path.write_text(json.dumps(DATA), encoding="utf-8")
+    db_path = str(tmp_path / "clip_notes.sqlite3")
+    assert migrate_json_to_sqlite(str(json_path), db_path)
+    return SqliteClipStore(str(json_path), db_path), db_path
+
+
+def test_load_active_skips_stored_clips_and_defers_html(tmp_path):
+    store, _ = make_store(tmp_path)
+    active = {item["alias"]: item for item in store.load_active()}
+
+    assert set(active) == {"court", "long", "groupe"}
+    # Rien n'a été chargé en entier
+    assert store.data is None
+    assert active["court"]["html_string"] == "<b>a</b>"
+    assert "html_string" not in active["long"]
+    assert active["long"][LAZY_HTML_KEY]() == DATA[1]["html_string"]
+    child = active["groupe"]["children"][0]
+    assert "html" not in child
+    assert child[LAZY_HTML_KEY]() == "<u>d</u>"
+
+
+def test_full_load_after_active_keeps_everything(tmp_path):
+    store, db_path = make_store(tmp_path)
+    store.load_active()
+
+    data = store.load()
+    assert [item["alias"] for item in data] == ["court", "long", "rangé", "groupe"]
+    assert not any(LAZY_HTML_KEY in item for item in data)
+    data[0]["string"] = "modifié"
+    store.save()
+    store.close()
+
+    conn = connect(db_path)
+    try:
+        saved, (_, _, html) = read_rows(conn)
+    finally:
+        conn.close()
+    assert saved[0]["string"] == "modifié"
+    assert saved[2]["stored"] is True
+    assert len(html) == 4
+    # Une fois tout chargé, load_active() filtre les données en mémoire
+    assert [item["alias"] for item in store.load_active()] == ["court", "long", "groupe"]
@@ -0,0 +1,51 @@
+"""
+Copie d'un clip via le presse-papier Qt (utils.paperclip_copy).
+
+Nécessite PyQt6 (plateforme offscreen) ; ignoré sinon.
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("PyQt6")
+pytest.importorskip("PIL")
+pytest.importorskip("pyperclip")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+import utils
+
+
+@pytest.fixture(scope="module")
+def app():
+    qt_app = QApplication.instance() or QApplication([])
+    utils.use_native_clipboard(True)
+    yield qt_app
+    utils.use_native_clipboard(False)
+
+
+def test_group_child_html_prefers_group_field():
+    child = {"string": "a", "html": "<b>a</b>", "html_string": "<i>ancien</i>"}
+    assert utils.group_child_html(child) == "<b>a</b>"
+    assert utils.group_child_html({"string": "a", "html_string": "<i>a</i>"}) == "<i>a</i>"
+    assert utils.group_child_html({"string": "a"}) is None
+
+
+def test_copy_group_child_with_html(app):
+    child = {"alias": "c", "string": "ligne 1\\nligne 2", "action": "copy", "html": "<p><b>ligne 1</b></p><p>ligne 2</p>"}
+    utils.paperclip_copy(child["string"], utils.group_child_html(child))
+    app.processEvents()
+    mime_data = QApplication.clipboard().mimeData()
+    assert mime_data.text() == "ligne 1\nligne 2"
+    assert mime_data.hasHtml()
+    assert "<b>ligne 1</b>" in mime_data.html()
+
+
+def test_copy_plain_clip_has_no_html(app):
+    utils.paperclip_copy("texte seul")
+    app.processEvents()
+    mime_data = QApplication.clipboard().mimeData()
+    assert mime_data.text() == "texte seul"
+    assert not mime_data.hasHtml()
@@ -0,0 +1,98 @@
+"""
+Correction du curseur par maillage (cursor_correction.py) sur des maillages
+synthétiques : interpolation et bornage aux bords de l'écran.
+"""
+
+import random
+
+import pytest
+
+from cursor_correction import CursorCorrection, mesh_value, is_valid_mesh, load_mesh
+
+WIDTH, HEIGHT = 800, 600
+
+
+def constant(value, rows=4, cols=4):
+    return [[value] * cols for _ in range(rows)]
+
+
+def plane_x():
+    """Correction en x qui croît de 0 à 40 px de gauche à droite"""
+    return [[c * 10 for c in range(5)] for _ in range(3)]
+
+
+def plane_y():
+    """Correction en y qui croît de 0 à 20 px de haut en bas"""
+    return [[r * 10 for _ in range(5)] for r in range(3)]
+
+
+def test_mesh_value_at_nodes_and_between():
+    mesh = [[0, 10], [20, 30]]
+    assert mesh_value(mesh, WIDTH, HEIGHT, 0, 0) == 0
+    assert mesh_value(mesh, WIDTH, HEIGHT, WIDTH, 0) == 10
+    assert mesh_value(mesh, WIDTH, HEIGHT, 0, HEIGHT) == 20
+    assert mesh_value(mesh, WIDTH, HEIGHT, WIDTH, HEIGHT) == 30
+    assert mesh_value(mesh, WIDTH, HEIGHT, WIDTH / 2, HEIGHT / 2) == pytest.approx(15)
+
+
+def test_mesh_value_clamps_outside_screen():
+    mesh = [[0, 10], [20, 30]]
+    assert mesh_value(mesh, WIDTH, HEIGHT, -50, -50) == 0
+    assert mesh_value(mesh, WIDTH, HEIGHT, WIDTH + 50, HEIGHT + 50) == 30
+
+
+@pytest.mark.parametrize("stride", [1, 4, 8])
+def test_constant_mesh(stride):
+    correction = CursorCorrection(WIDTH, HEIGHT, [(constant(7), constant(-3))], stride=stride)
+    for x, y in [(0, 0), (123, 456), (WIDTH, HEIGHT)]:
+        assert correction.correct(x, y) == (x + 7, y - 3)
+
+
+def test_plane_mesh_is_exact_at_stride_1():
+    correction = CursorCorrection(WIDTH, HEIGHT, [(plane_x(), plane_y())], stride=1)
+    for x, y in [(0, 0), (200, 150), (400, 300), (WIDTH, HEIGHT)]:
+        assert correction.correct(x, y) == (x + round(x / WIDTH * 40), y + round(y / HEIGHT * 20))
+
+
+def test_meshes_are_added():
+    correction = CursorCorrection(WIDTH, HEIGHT, [(constant(5), constant(1)), (constant(2), constant(-4))], stride=4)
+    assert correction.correct(100, 100) == (107, 97)
+
+
+@pytest.mark.parametrize("stride", [1, 4])
+def test_random_mesh_matches_direct_interpolation(stride):
+    rng = random.Random(1)
+    mesh = tuple([[rng.randint(-50, 50) for _ in range(10)] for _ in range(10)] for _ in range(2))
+    correction = CursorCorrection(WIDTH, HEIGHT, [mesh], stride=stride)
+    for _ in range(500):
+        x, y = rng.randrange(WIDTH + 1), rng.randrange(HEIGHT + 1)
+        # La table lit le point de grille le plus proche
+        gx = min((x + stride // 2) // stride * stride, WIDTH)
+        gy = min((y + stride // 2) // stride * stride, HEIGHT)
+        cx, cy = correction.correct(x, y)
+        assert abs(cx - (x + mesh_value(mesh[0], WIDTH, HEIGHT, gx, gy))) <= 0.5
+        assert abs(cy - (y + mesh_value(mesh[1], WIDTH, HEIGHT, gx, gy))) <= 0.5
+
+
+def test_correct_clamps_positions_outside_screen():
+    correction = CursorCorrection(WIDTH, HEIGHT, [(plane_x(), plane_y())], stride=4)
+    # Hors écran : la correction du bord le plus proche s'applique
+    assert correction.correct(-30, -30) == (-30, -30)
+    assert correction.correct(WIDTH + 30, HEIGHT + 30) == (WIDTH + 30 + 40, HEIGHT + 30 + 20)
+
+
+def test_is_valid_mesh():
+    assert is_valid_mesh([[0, 1], [2, 3]])
+    assert not is_valid_mesh([[0, 1]])
+    assert not is_valid_mesh([[0, 1], [2]])
+    assert not is_valid_mesh([[0, "a"], [2, 3]])
+    assert not is_valid_mesh(None)
+
+
+def test_load_mesh(tmp_path):
+    path = tmp_path / "mesh.json"
+    assert load_mesh(str(path)) is None
+    path.write_text('{"x_mesh": [[1, 2], [3, 4]], "y_mesh": [[0, 0], [0, 0]]}')
+    assert load_mesh(str(path)) == ([[1, 2], [3, 4]], [[0, 0], [0, 0]])
+    path.write_text('{"x_mesh": [[1]], "y_mesh": [[0]]}')
+    assert load_mesh(str(path)) is None
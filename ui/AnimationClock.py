@@ -0,0 +1,131 @@
+import time, math
+from functools import partial
+from PyQt6.QtCore import Qt, QObject, QTimer, QCoreApplication
+from PyQt6.QtGui import QGuiApplication
+
+class AnimationClock(QObject):
+    """
+    Horloge d'animation partagée par les menus (néon, révélation des boutons spéciaux).
+
+    Un seul QTimer remplace les QTimer de chaque widget. Il est armé pour la
+    prochaine échéance des animations actives (jamais plus souvent qu'une image de
+    l'écran) : la pulsation du néon (50-80 ms) ne réveille Python qu'à son rythme,
+    et un menu ouvert sans animation ne consomme plus de CPU.
+    Les animations QVariantAnimation (ouverture/fermeture) utilisent déjà l'horloge
+    unifiée de Qt et ne passent pas par ici.
+
+    À la fermeture de l'application (aboutToQuit), l'horloge s'arrête : les widgets
+    détruits ensuite peuvent encore appeler remove() sans toucher au QTimer supprimé.
+    """
+    def __init__(self):
+        super().__init__()
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._tick)
+        self._active = []  # ClockTimer en cours
+        self._stopped = False
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def shutdown(self):
+        """Arrête l'horloge définitivement (fin de l'application)"""
+        self._active.clear()
+        self._stopped = True
+        try:
+            self._timer.stop()
+        except RuntimeError:
+            pass
+
+    def frame_interval(self):
+        """Durée d'une image (ms) selon la fréquence de l'écran principal"""
+        screen = QGuiApplication.primaryScreen()
+        rate = screen.refreshRate() if screen else 0
+        return max(1, int(1000 / (rate if rate and rate > 0 else 60)))
+
+    def add(self, clock_timer):
+        if self._stopped:
+            return
+        if clock_timer not in self._active:
+            self._active.append(clock_timer)
+        self._schedule()
+
+    def _schedule(self):
+        """Arme le QTimer sur l'échéance la plus proche (au plus une fois par image)"""
+        if self._stopped:
+            return
+        if not self._active:
+            self._timer.stop()
+            return
+        delay = min(clock_timer.deadline for clock_timer in self._active) - time.monotonic() * 1000
+        self._timer.start(max(self.frame_interval(), math.ceil(delay)))
+
+    def remove(self, clock_timer):
+        if clock_timer in self._active:
+            self._active.remove(clock_timer)
+        if not self._active and not self._stopped:
+            try:
+                self._timer.stop()
+            except RuntimeError:
+                # QTimer déjà supprimé par Qt (destruction en fin de programme)
+                self._stopped = True
+
+    def is_active(self, clock_timer):
+        return clock_timer in self._active
+
+    def _tick(self):
+        now = time.monotonic() * 1000
+        for clock_timer in list(self._active):
+            if clock_timer not in self._active or now < clock_timer.deadline:
+                continue
+            if clock_timer.single_shot:
+                self.remove(clock_timer)
+            else:
+                # Pas de rattrapage : si on est en retard, on repart de maintenant
+                clock_timer.deadline = max(clock_timer.deadline + clock_timer.interval, now)
+            try:
+                clock_timer.callback()
+            except RuntimeError:
+                # Le widget propriétaire a été détruit
+                self.remove(clock_timer)
+        self._schedule()
+
+
+_clock = None
+
+
+def animation_clock():
+    """Horloge unique de l'application (créée au premier usage)"""
+    global _clock
+    if _clock is None:
+        _clock = AnimationClock()
+    return _clock
+
+
+class ClockTimer:
+    """
+    Remplaçant de QTimer (start/stop/isActive/setSingleShot) branché sur l'horloge
+    partagée. Arrêté automatiquement à la destruction du widget propriétaire.
+    """
+    def __init__(self, owner, callback):
+        self.callback = callback
+        self.interval = 0
+        self.deadline = 0
+        self.single_shot = False
+        owner.destroyed.connect(partial(animation_clock().remove, self))
+
+    def setSingleShot(self, single_shot):
+        self.single_shot = single_shot
+
+    def start(self, interval=None):
+        if interval is not None:
+            self.interval = interval
+        self.deadline = time.monotonic() * 1000 + self.interval
+        animation_clock().add(self)
+
+    def stop(self):
+        animation_clock().remove(self)
+
+    def isActive(self):
+        return animation_clock().is_active(self)
@@ -3,13 +3,16 @@
 Outil de calibration visuelle pour Wayland.
 
 Cliquez sur les cibles rouges. L'outil mesurera le décalage
-entre la position attendue et la position rapportée par Qt.
+entre la position attendue et la position rapportée par Qt, puis
+enregistrera le champ de correction ajusté dans le profil de l'écran
+(calibration_fit), chargé par CursorTracker au démarrage.
 """
 
 import sys
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QPainter, QColor, QPen, QFont, QCursor
 from PyQt6.QtWidgets import QApplication, QWidget
+from calibration_fit import fit_correction, format_residuals, save_profile
 
 
 class CalibrationTool(QWidget):
@@ -24,6 +27,9 @@ class CalibrationTool(QWidget):
         
         screen = QApplication.primaryScreen()
         geo = screen.geometry()
+        self.screen_name = screen.name()
+        self.device_pixel_ratio = screen.devicePixelRatio()
+        self.screen_origin = geo.topLeft()
         self.screen_w = geo.width()
         self.screen_h = geo.height()
         self.setGeometry(geo)
@@ -107,6 +113,8 @@ class CalibrationTool(QWidget):
             "event": (evt_x, evt_y),
             "qcursor": (qc_x, qc_y),
             "offset_qcursor": (offset_qc_x, offset_qc_y),
+            # Position brute relative à l'écran (celle que reçoit le tracker)
+            "raw": (qc_x - self.screen_origin.x(), qc_y - self.screen_origin.y()),
             "ratio_x": evt_x / self.screen_w,
             "ratio_y": evt_y / self.screen_h,
         })
@@ -177,6 +185,18 @@ class CalibrationTool(QWidget):
             print(f"    self.y_correction_top = {-top_offset}")
             print(f"    self.y_correction_bottom = {-bottom_offset}")
         
+        # Champ de correction ajusté sur les clics (position brute -> position réelle)
+        samples = [m["raw"] + m["event"] for m in self.measurements]
+        fit = fit_correction(samples, self.screen_w, self.screen_h)
+        print(f"\nChamp de correction ajusté (degré {fit.degree}) :")
+        print(format_residuals(fit.residuals(samples)))
+        try:
+            path = save_profile(fit, samples, self.screen_name, self.device_pixel_ratio)
+            print(f"\n>>> Profil enregistré : {path}")
+            print("    Il sera chargé au prochain démarrage du tracker.")
+        except OSError as e:
+            print(f"[Erreur] Impossible d'enregistrer le profil de calibration : {e}")
+        
         print("\n" + "="*60)
         print("Appuyez sur une touche pour fermer...")
         
@@ -1,8 +1,70 @@
 import math
-from PyQt6.QtGui import QPainter, QColor, QLinearGradient
-from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QRect
+from functools import lru_cache
+from PyQt6.QtGui import QPainter, QColor, QLinearGradient, QConicalGradient, QRadialGradient, QImage
+from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QPointF, QRect
 from PyQt6.QtWidgets import QWidget
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@lru_cache(maxsize=64)
+def hue_wheel_image(radius, value_level):
+    """
+    Roue teinte/saturation pour une luminosité donnée (value_level sur 0-255),
+    calculée une fois puis partagée par tous les sélecteurs de même rayon.
+    Angle = teinte (sens horaire depuis la droite), distance au centre = saturation.
+    """
+    v = value_level / 255
+    size = radius * 2
+    if np is not None:
+        # Calcul vectorisé pixel par pixel (mêmes pixels que l'ancienne boucle)
+        y, x = np.mgrid[-radius:radius, -radius:radius].astype(np.float64)
+        dist = np.sqrt(x * x + y * y)
+        hue = (np.degrees(np.arctan2(y, x)) + 360) % 360 / 60
+        sat = np.minimum(dist / radius, 1.0)
+        sector = np.floor(hue).astype(np.int64) % 6
+        f = hue - np.floor(hue)
+        p = v * (1 - sat)
+        q = v * (1 - sat * f)
+        t = v * (1 - sat * (1 - f))
+        vv = np.full_like(sat, v)
+        r = np.choose(sector, [vv, q, p, p, t, vv])
+        g = np.choose(sector, [t, vv, vv, q, p, p])
+        b = np.choose(sector, [p, p, t, vv, vv, q])
+        alpha = np.where(dist <= radius, 255, 0)
+        rgba = np.dstack([r * 255 + 0.5, g * 255 + 0.5, b * 255 + 0.5, alpha]).astype(np.uint8)
+        data = rgba.tobytes()
+        # copy() : la QImage ne doit pas dépendre du buffer Python
+        return QImage(data, size, size, size * 4, QImage.Format.Format_RGBA8888).copy()
+
+    # Sans NumPy : composition de dégradés (teintes coniques, saturation radiale, luminosité)
+    image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    center = QPointF(radius, radius)
+    # Le dégradé conique tourne dans le sens anti-horaire à l'écran : teintes inversées
+    hues = QConicalGradient(center, 0)
+    for i in range(7):
+        hues.setColorAt(i / 6, QColor.fromHsvF(((6 - i) % 6) / 6, 1.0, 1.0))
+    painter.setBrush(hues)
+    painter.drawEllipse(center, radius, radius)
+    # Saturation : mélange linéaire vers le blanc au centre
+    saturation = QRadialGradient(center, radius)
+    saturation.setColorAt(0.0, QColor(255, 255, 255, 255))
+    saturation.setColorAt(1.0, QColor(255, 255, 255, 0))
+    painter.setBrush(saturation)
+    painter.drawEllipse(center, radius, radius)
+    # Luminosité : assombrir uniformément
+    painter.setBrush(QColor(0, 0, 0, int(round((1 - v) * 255))))
+    painter.drawEllipse(center, radius, radius)
+    painter.end()
+    return image
+
 class CircularColorPicker(QWidget):
     colorChanged = pyqtSignal(tuple)  # (r, g, b)
 
@@ -20,18 +82,9 @@ class CircularColorPicker(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        center = QPoint(self.radius, self.radius)
-
         # ===== ROUE HSV (H + S) =====
-        for x in range(-self.radius, self.radius):
-            for y in range(-self.radius, self.radius):
-                r = (x * x + y * y) ** 0.5
-                if r <= self.radius:
-                    hue = (math.degrees(math.atan2(y, x)) + 360) % 360
-                    sat = r / self.radius
-                    color = QColor.fromHsvF(hue / 360, sat, self.v)
-                    painter.setPen(color)
-                    painter.drawPoint(center + QPoint(x, y))
+        # Image en cache par niveau de luminosité : un repaint ne fait que la copier
+        painter.drawImage(0, 0, hue_wheel_image(self.radius, int(round(self.v * 255))))
 
         # ===== CURSEUR H/S =====
         hs_pos = self._hs_to_pos()
@@ -1,8 +1,8 @@
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QCursor
 from PyQt6.QtWidgets import QWidget, QApplication
-from dataclasses import dataclass
-POSITION_FILE = "/tmp/.cursor_position"
+from clipnotes_client import send_command
+from screen_profiles import ScreenProfiles
 
 # class CursorTracker(QWidget):
 #     """Tracker de curseur pour Wayland"""
@@ -240,16 +240,27 @@ POSITION_FILE = "/tmp/.cursor_position"
 
 
 
-@dataclass
-class GridCell:
-    x_offset: int
-    y_offset: int
-    x_margin: int
-    y_margin: int
+class CursorTracker(QWidget):
+    """
+    Tracker de curseur pour Wayland.
 
+    Pas de scrutation périodique : la position corrigée est calculée à la demande
+    (update_pos, juste avant d'afficher un menu ou un dialogue) ou sur les
+    mouvements de souris reçus par l'overlay. Les autres processus l'obtiennent
+    via la commande "pos" du daemon (read_cursor_position).
 
-class CursorTracker(QWidget):
-    """Tracker de curseur pour Wayland"""
+    La correction (grille grid_def + maillage fin de cursor_mesh.json s'il existe)
+    est précalculée par écran dans une table (ScreenProfiles) : une lecture par
+    position, sur le profil de l'écran où se trouve le curseur. L'overlay couvre
+    l'écran principal ; chaque autre écran a son ScreenOverlay, montré et caché
+    avec lui.
+
+    Signals:
+        position_changed(int, int): position corrigée remontée par le compositeur
+            (entrée ou mouvement du curseur sur l'overlay)
+    """
+
+    position_changed = pyqtSignal(int, int)
 
     def __init__(self):
         super().__init__()
@@ -267,13 +278,6 @@ class CursorTracker(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setMouseTracking(True)
 
-        screen = QApplication.primaryScreen()
-        geometry = screen.geometry()
-        self.setGeometry(geometry)
-
-        self.screen_width = geometry.width()
-        self.screen_height = geometry.height()
-
         self.grid_cols = 3
         self.grid_rows = 3
 
@@ -322,107 +326,121 @@ class CursorTracker(QWidget):
         #     "bot_right":    dict(x_off=self.screen_width/2,   y_off=self.screen_height/2,  x_mar=45,  y_mar=-45),
         # }
 
-        self.grid = [
-            [
-                GridCell(**self._cell("top_left")),
-                GridCell(**self._cell("top_center")),
-                GridCell(**self._cell("top_right")),
-            ],
-            [
-                GridCell(**self._cell("mid_left")),
-                GridCell(**self._cell("mid_center")),
-                GridCell(**self._cell("mid_right")),
-            ],
-            [
-                GridCell(**self._cell("bot_left")),
-                GridCell(**self._cell("bot_center")),
-                GridCell(**self._cell("bot_right")),
-            ],
+        self.screen_profiles = ScreenProfiles([self.grid_mesh()], self)
+        self.screen_overlays = []
+        app = QApplication.instance()
+        app.screenAdded.connect(self.update_screens)
+        app.screenRemoved.connect(self.update_screens)
+        app.primaryScreenChanged.connect(self.update_screens)
+        self.update_screens()
+
+    def grid_mesh(self):
+        """grid_def en maillage 3×3 (x_mesh, y_mesh) : décalage + marge de chaque nœud"""
+        rows = [
+            ("top_left", "top_center", "top_right"),
+            ("mid_left", "mid_center", "mid_right"),
+            ("bot_left", "bot_center", "bot_right"),
         ]
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_pos)
-        self.timer.start(150)
-
-    def _cell(self, key):
-        d = self.grid_def[key]
-        return dict(
-            x_offset=d["x_off"],
-            y_offset=d["y_off"],
-            x_margin=d["x_mar"],
-            y_margin=d["y_mar"],
-        )
+        x_mesh = [[self.grid_def[key]["x_off"] + self.grid_def[key]["x_mar"] for key in row] for row in rows]
+        y_mesh = [[self.grid_def[key]["y_off"] + self.grid_def[key]["y_mar"] for key in row] for row in rows]
+        return x_mesh, y_mesh
+
+    def update_screens(self, *args):
+        """Recouvre l'écran principal et crée un overlay par écran secondaire"""
+        primary = QApplication.primaryScreen()
+        if primary is None:
+            return
+        geometry = primary.geometry()
+        self.setGeometry(geometry)
+        self.screen_width = geometry.width()
+        self.screen_height = geometry.height()
 
-    def lerp(self, a, b, t):
-        return a + (b - a) * t
+        for overlay in self.screen_overlays:
+            overlay.close()
+            overlay.deleteLater()
+        self.screen_overlays = [
+            ScreenOverlay(self, screen) for screen in QApplication.screens() if screen is not primary
+        ]
+        if self.isVisible():
+            for overlay in self.screen_overlays:
+                overlay.show()
 
-    def bilerp(self, tl, tr, bl, br, tx, ty):
-        top = self.lerp(tl, tr, tx)
-        bottom = self.lerp(bl, br, tx)
-        return self.lerp(top, bottom, ty)
+    def showEvent(self, event):
+        for overlay in self.screen_overlays:
+            overlay.show()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        for overlay in self.screen_overlays:
+            overlay.hide()
+        super().hideEvent(event)
 
     def update_pos(self):
+        """Recalcule la position corrigée à partir de la position actuelle du curseur"""
         pos = QCursor.pos()
-        raw_x = pos.x()
-        raw_y = pos.y()
+        self.set_raw_pos(pos.x(), pos.y())
 
+    def set_raw_pos(self, raw_x, raw_y):
         if raw_x == 0 and raw_y == 0:
             return
 
-        cell_w = self.screen_width / (self.grid_cols - 1)
-        cell_h = self.screen_height / (self.grid_rows - 1)
-
-        cx = min(int(raw_x / cell_w), self.grid_cols - 2)
-        cy = min(int(raw_y / cell_h), self.grid_rows - 2)
+        profile = self.screen_profiles.profile_at(raw_x, raw_y)
+        if profile is not None:
+            self.last_x, self.last_y = profile.correct(raw_x, raw_y)
 
-        tx = (raw_x - cx * cell_w) / cell_w
-        ty = (raw_y - cy * cell_h) / cell_h
+    def report_pos(self, pos):
+        """Position reçue par l'overlay : toujours à jour, même sous Wayland"""
+        self.set_raw_pos(pos.x(), pos.y())
+        self.position_changed.emit(self.last_x, self.last_y)
 
-        tl = self.grid[cy][cx]
-        tr = self.grid[cy][cx + 1]
-        bl = self.grid[cy + 1][cx]
-        br = self.grid[cy + 1][cx + 1]
-
-        x_offset = self.bilerp(
-            tl.x_offset, tr.x_offset,
-            bl.x_offset, br.x_offset,
-            tx, ty
-        )
-        y_offset = self.bilerp(
-            tl.y_offset, tr.y_offset,
-            bl.y_offset, br.y_offset,
-            tx, ty
-        )
-        x_margin = self.bilerp(
-            tl.x_margin, tr.x_margin,
-            bl.x_margin, br.x_margin,
-            tx, ty
-        )
-        y_margin = self.bilerp(
-            tl.y_margin, tr.y_margin,
-            bl.y_margin, br.y_margin,
-            tx, ty
-        )
+    def enterEvent(self, event):
+        # Overlay affiché sous le curseur : première position connue sans attendre un mouvement
+        self.report_pos(event.globalPosition().toPoint())
+        super().enterEvent(event)
 
-        self.last_x = int(raw_x + x_offset + x_margin)
-        self.last_y = int(raw_y + y_offset + y_margin)
+    def mouseMoveEvent(self, event):
+        # Wayland ne remonte la position qu'aux fenêtres survolées : profiter de
+        # celles reçues par l'overlay (simple calcul, aucune écriture)
+        self.report_pos(event.globalPosition().toPoint())
 
-        try:
-            with open(POSITION_FILE, "w") as f:
-                f.write(f"{self.last_x},{self.last_y}")
-        except:
-            pass
-        
     def mousePressEvent(self, event):
         if self.on_click_callback:
             self.on_click_callback()
         else:
             self.close()
 
+class ScreenOverlay(QWidget):
+    """Overlay d'un écran secondaire : transmet mouvements et clics au tracker"""
+
+    def __init__(self, tracker, screen):
+        super().__init__()
+        self.tracker = tracker
+        self.setWindowFlags(
+            Qt.WindowType.FramelessWindowHint |
+            Qt.WindowType.WindowStaysOnBottomHint |
+            Qt.WindowType.Tool
+        )
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setMouseTracking(True)
+        self.setScreen(screen)
+        self.setGeometry(screen.geometry())
+
+    def enterEvent(self, event):
+        self.tracker.report_pos(event.globalPosition().toPoint())
+        super().enterEvent(event)
+
+    def mouseMoveEvent(self, event):
+        self.tracker.mouseMoveEvent(event)
+
+    def mousePressEvent(self, event):
+        self.tracker.mousePressEvent(event)
+
+
 def read_cursor_position():
+    """Position corrigée du curseur demandée au daemon (0, 0 si aucun daemon ne répond)"""
     try:
-        with open(POSITION_FILE, 'r') as f:
-            x, y = f.read().strip().split(',')
-            return int(x), int(y)
+        x, y = send_command("pos").split(',')
+        return int(x), int(y)
     except:
         return 0, 0
 
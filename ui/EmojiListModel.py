@@ -0,0 +1,97 @@
+import os
+from collections import OrderedDict
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QPixmap
+from utils import *
+from emoji_catalog import CELL_SIZE, SHEET_SIZE
+
+class EmojiListModel(QAbstractListModel):
+    """
+    Modèle du sélecteur d'emojis : les récents en tête, puis le catalogue (ou les
+    résultats de la recherche). Les icônes sont découpées dans les planches PNG du
+    catalogue, chargées à la première demande ; une planche absente du disque est
+    rendue en arrière-plan et ses lignes sont rafraîchies quand elle arrive.
+    """
+    EmojiRole = Qt.ItemDataRole.UserRole + 1
+    ICON_CACHE_SIZE = 1024
+
+    # Émis depuis le thread de rendu du catalogue (connexion en file d'attente)
+    sheet_ready = pyqtSignal(int)
+
+    def __init__(self, catalog, recent_emojis=None, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.recent_emojis = list(recent_emojis or [])
+        self.rows = []            # Indices du catalogue affichés
+        self.recent_count = 0     # Nombre de lignes "récents" en tête
+        self._sheets = {}         # planche -> QPixmap (None = rendu en cours)
+        self._icons = OrderedDict()  # index -> QPixmap découpé (LRU)
+        self.sheet_ready.connect(self._on_sheet_ready)
+        self.set_query("")
+
+    def set_query(self, query):
+        """Filtre le catalogue ; les récents correspondants restent en tête"""
+        matches = self.catalog.search(query)
+        recent = [self.catalog.positions[e] for e in self.recent_emojis if e in self.catalog.positions]
+        if query.strip():
+            match_set = set(matches)
+            recent = [i for i in recent if i in match_set]
+        recent_set = set(recent)
+        self.beginResetModel()
+        self.rows = recent + [i for i in matches if i not in recent_set]
+        self.recent_count = len(recent)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.rows):
+            return None
+        catalog_index = self.rows[index.row()]
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._icon(catalog_index)
+        if role == self.EmojiRole:
+            return self.catalog.emojis[catalog_index]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self.catalog.names[catalog_index]
+        return None
+
+    def _icon(self, catalog_index):
+        icon = self._icons.get(catalog_index)
+        if icon is not None:
+            self._icons.move_to_end(catalog_index)
+            return icon
+        sheet, x, y = self.catalog.sheet_of(catalog_index)
+        sheet_pixmap = self._sheet(sheet)
+        if sheet_pixmap is None:
+            # Planche en cours de rendu : la ligne sera rafraîchie à son arrivée
+            return None
+        if sheet_pixmap.isNull():
+            # Planche impossible à rendre : rendu individuel (cache de utils)
+            icon = emoji_pixmap(self.catalog.emojis[catalog_index], CELL_SIZE)
+        else:
+            icon = sheet_pixmap.copy(x, y, CELL_SIZE, CELL_SIZE)
+        self._icons[catalog_index] = icon
+        if len(self._icons) > self.ICON_CACHE_SIZE:
+            self._icons.popitem(last=False)
+        return icon
+
+    def _sheet(self, sheet):
+        if sheet in self._sheets:
+            return self._sheets[sheet]
+        path = self.catalog.sheet_path(sheet)
+        if os.path.exists(path):
+            self._sheets[sheet] = QPixmap(path)
+        else:
+            self._sheets[sheet] = None
+            self.catalog.request_sheet(sheet, self.sheet_ready.emit)
+        return self._sheets[sheet]
+
+    def _on_sheet_ready(self, sheet):
+        path = self.catalog.sheet_path(sheet)
+        # QPixmap nul si le rendu a échoué : repli sur emoji_pixmap
+        self._sheets[sheet] = QPixmap(path) if os.path.exists(path) else QPixmap()
+        rows = [row for row, i in enumerate(self.rows) if i // SHEET_SIZE == sheet]
+        if rows:
+            self.dataChanged.emit(self.index(rows[0]), self.index(rows[-1]), [Qt.ItemDataRole.DecorationRole])
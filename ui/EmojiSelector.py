@@ -1,18 +1,18 @@
-from PyQt6.QtGui import QIcon
-from PyQt6.QtWidgets import QWidget, QPushButton, QVBoxLayout, QHBoxLayout, QGridLayout, QScrollArea
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QPushButton, QLabel
+from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QListView, QAbstractItemView
 
 from utils import *
+from ui import EmojiListModel
 
 class EmojiSelector(QDialog):
-    def __init__(self, emoji_list, rows=10, cols=10, parent=None):
+    """
+    Sélecteur d'emojis : recherche au clavier (noms Unicode), récents en tête,
+    grille virtualisée (QListView en mode icônes, seules les cases visibles sont peintes).
+    """
+    def __init__(self, catalog, recent_emojis=None, parent=None):
         super().__init__(parent)
-        self.emoji_list = emoji_list
+        self.catalog = catalog
         self.selected_emoji = None
-        self.rows = rows
-        self.cols = cols
-        self.per_page = rows * cols
-        self.current_page = 0
 
         self.setWindowTitle("Sélecteur d'Emoji")
         self.resize(600, 530)
@@ -24,32 +24,37 @@ class EmojiSelector(QDialog):
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
 
-        # Zone de scroll
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-
-        self.scroll_widget = QWidget()
-        self.grid = QGridLayout(self.scroll_widget)
-
-        self.scroll_area.setWidget(self.scroll_widget)
-        self.layout.addWidget(self.scroll_area)
-
-        # Navigation
-        nav_layout = QHBoxLayout()
-        self.prev_button = QPushButton("←")
-        self.next_button = QPushButton("→")
-        self.page_label = QLabel()
-
-        self.prev_button.clicked.connect(self.prev_page)
-        self.next_button.clicked.connect(self.next_page)
-
-        nav_layout.addWidget(self.prev_button)
-        nav_layout.addStretch()
-        nav_layout.addWidget(self.page_label)
-        nav_layout.addStretch()
-        nav_layout.addWidget(self.next_button)
-
-        self.layout.addLayout(nav_layout)
+        # Recherche (la frappe filtre directement la grille)
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("🔍 Rechercher (en anglais : smile, cat, heart...)")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.textChanged.connect(self.on_search_changed)
+        self.search_input.returnPressed.connect(self.select_first)
+        self.layout.addWidget(self.search_input)
+
+        # Grille virtualisée
+        self.model = EmojiListModel(catalog, recent_emojis, self)
+        self.view = QListView()
+        self.view.setViewMode(QListView.ViewMode.IconMode)
+        self.view.setMovement(QListView.Movement.Static)
+        self.view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.view.setUniformItemSizes(True)
+        self.view.setIconSize(QSize(32, 32))
+        self.view.setGridSize(QSize(44, 44))
+        self.view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.view.setMouseTracking(True)
+        self.view.setModel(self.model)
+        self.view.clicked.connect(lambda index: self.emoji_selected(index.data(EmojiListModel.EmojiRole)))
+        self.view.activated.connect(lambda index: self.emoji_selected(index.data(EmojiListModel.EmojiRole)))
+        self.view.entered.connect(self.on_entered)
+        self.layout.addWidget(self.view)
+
+        # Nom de l'emoji survolé / nombre de résultats
+        info_layout = QHBoxLayout()
+        self.info_label = QLabel()
+        info_layout.addWidget(self.info_label)
+        self.layout.addLayout(info_layout)
 
         # Appliquer le style
         self.setStyleSheet("""
@@ -65,58 +70,39 @@ class EmojiSelector(QDialog):
                 padding: 4px;
                 color: white;
             }
-            QPushButton {
-                background-color: rgba(255, 255, 255, 30);
-                border: 1px solid rgba(255, 255, 255, 60);
+            QListView::item {
                 border-radius: 6px;
-                padding: 6px;
-                color: white;
             }
-            QPushButton:hover {
+            QListView::item:hover {
                 background-color: rgba(255, 255, 255, 60);
             }
         """)
 
-        self.update_grid()
-
-    def update_grid(self):
-        for i in reversed(range(self.grid.count())):
-            widget = self.grid.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
-
-        start = self.current_page * self.per_page
-        end = start + self.per_page
-        current_emojis = self.emoji_list[start:end]
+        self.update_info()
+        self.search_input.setFocus()
 
-        for idx, emoji in enumerate(current_emojis):
-            row = idx // self.cols
-            col = idx % self.cols
-            pixmap = emoji_pixmap(emoji, size=32)
-            icon = QIcon(pixmap)
-            btn = QPushButton()
-            btn.setIcon(icon)
-            btn.setIconSize(pixmap.rect().size())
-            btn.setFixedSize(40, 40)
-            btn.clicked.connect(lambda _, e=emoji: self.emoji_selected(e))
-            self.grid.addWidget(btn, row, col)
+    def on_search_changed(self, text):
+        self.model.set_query(text)
+        self.view.scrollToTop()
+        self.update_info()
 
-        total_pages = ((len(self.emoji_list) - 1) // self.per_page) + 1
-        self.page_label.setText(f"Page {self.current_page + 1} / {total_pages}")
-        self.prev_button.setEnabled(self.current_page > 0)
-        self.next_button.setEnabled(end < len(self.emoji_list))
+    def on_entered(self, index):
+        emoji = index.data(EmojiListModel.EmojiRole)
+        name = index.data(Qt.ItemDataRole.ToolTipRole)
+        self.info_label.setText(f"{emoji}  {name}" if name else emoji)
 
-    def prev_page(self):
-        if self.current_page > 0:
-            self.current_page -= 1
-            self.update_grid()
+    def update_info(self):
+        count = self.model.rowCount()
+        if self.model.recent_count and not self.search_input.text().strip():
+            self.info_label.setText(f"{self.model.recent_count} récents en tête · {len(self.catalog.emojis)} emojis")
+        else:
+            self.info_label.setText(f"{count} emoji{'s' if count > 1 else ''}")
 
-    def next_page(self):
-        if (self.current_page + 1) * self.per_page < len(self.emoji_list):
-            self.current_page += 1
-            self.update_grid()
+    def select_first(self):
+        if self.model.rowCount():
+            self.emoji_selected(self.model.index(0).data(EmojiListModel.EmojiRole))
 
     def emoji_selected(self, emoji):
         print(f"Emoji sélectionné : {emoji}")
         self.selected_emoji = emoji
-        self.accept()
\ No newline at end of file
+        self.accept()
@@ -14,7 +14,7 @@ from PyQt6.QtWidgets import (
     QScrollArea, QFrame, QAbstractItemView, QTabWidget, QSizePolicy
 )
 
-from utils import emoji_pixmap, image_pixmap, text_pixmap, is_emoji
+from utils import emoji_pixmap, image_pixmap, text_pixmap, is_emoji, load_all_clips_data
 
 
 class ShortcutCaptureDialog(QDialog):
@@ -910,8 +910,7 @@ class KeyboardShortcutsManager(QWidget):
         clip_file = self.app_instance.clip_notes_file_json
         if os.path.exists(clip_file):
             try:
-                with open(clip_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return load_all_clips_data(clip_file)
             except:
                 pass
         return []
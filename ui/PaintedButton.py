@@ -0,0 +1,187 @@
+from PyQt6.QtCore import Qt, QObject, QCoreApplication, QEvent, QPoint, QRect, QSize, pyqtSignal
+from PyQt6.QtGui import QColor, QIcon, QPainter, QPixmap
+
+class PaintedButton(QObject):
+    """
+    Bouton "virtuel" du menu radial, dessiné par RadialMenu.paintEvent.
+
+    Reprend la partie de l'API QPushButton utilisée par RadialMenu (clicked, géométrie,
+    icône, visibilité, filtres d'événements) sans créer de widget : le menu reste un seul
+    widget quel que soit le nombre de clips. RadialMenu fait le hit-test et lui transmet
+    les événements souris (Enter/Leave, appui, déplacement, relâchement).
+    """
+    clicked = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rect = QRect()
+        self._visible = False
+        self._icon = QIcon()
+        self._icon_size = QSize(32, 32)
+        self._pixmap = None  # Icône rendue à la taille courante (cache)
+        self._background = QColor(0, 0, 0, 0)
+        self._hover_background = QColor(255, 255, 255, 100)
+        self.hovered = False
+        self.pressed = False
+
+    # === Géométrie (coordonnées du menu parent) ===
+    def move(self, x, y=None):
+        if y is None:
+            x, y = x.x(), x.y()
+        self._repaint()
+        self._rect.moveTo(int(x), int(y))
+        self._repaint()
+
+    def setFixedSize(self, width, height=None):
+        if height is None:
+            width, height = width.width(), width.height()
+        self._repaint()
+        self._rect.setSize(QSize(int(width), int(height)))
+        self._repaint()
+
+    def pos(self):
+        return self._rect.topLeft()
+
+    def size(self):
+        return self._rect.size()
+
+    def width(self):
+        return self._rect.width()
+
+    def height(self):
+        return self._rect.height()
+
+    def geometry(self):
+        return QRect(self._rect)
+
+    def rect(self):
+        return QRect(QPoint(0, 0), self._rect.size())
+
+    def mapFromGlobal(self, global_pos):
+        return self.parent().mapFromGlobal(global_pos) - self._rect.topLeft()
+
+    def contains(self, pos):
+        """Hit-test circulaire (les boutons sont ronds)"""
+        if not self._visible or self._rect.isEmpty():
+            return False
+        center = self._rect.center()
+        dx, dy = pos.x() - center.x(), pos.y() - center.y()
+        radius = self._rect.width() / 2
+        return dx * dx + dy * dy <= radius * radius
+
+    # === Visibilité ===
+    def setVisible(self, visible):
+        if visible == self._visible:
+            return
+        self._visible = visible
+        if not visible:
+            self.hovered = False
+            self.pressed = False
+        # Comme un widget : les filtres d'événements sont prévenus de l'apparition/disparition
+        QCoreApplication.sendEvent(self, QEvent(QEvent.Type.Show if visible else QEvent.Type.Hide))
+        # Redessiner aussi la zone libérée quand le bouton disparaît
+        if self.parent() is not None and not self._rect.isEmpty():
+            self.parent().update(self._rect)
+
+    def isVisible(self):
+        return self._visible
+
+    def show(self):
+        self.setVisible(True)
+
+    def hide(self):
+        self.setVisible(False)
+
+    def underMouse(self):
+        return self.hovered
+
+    # === Apparence ===
+    def setIcon(self, icon):
+        self._icon = icon
+        self._pixmap = None
+        self._repaint()
+
+    def icon(self):
+        return self._icon
+
+    def setIconSize(self, size):
+        if size != self._icon_size:
+            self._icon_size = QSize(size)
+            self._pixmap = None
+            self._repaint()
+
+    def iconSize(self):
+        return QSize(self._icon_size)
+
+    def set_colors(self, background, hover_background):
+        """Fond normal et fond au survol (tuples RGBA, None = transparent)"""
+        self._background = QColor(*background) if background else QColor(0, 0, 0, 0)
+        self._hover_background = QColor(*hover_background) if hover_background else QColor(0, 0, 0, 0)
+        self._repaint()
+
+    def setAttribute(self, attribute, on=True):
+        # Le survol est géré par RadialMenu : rien à activer
+        pass
+
+    def setMouseTracking(self, enable):
+        pass
+
+    def _repaint(self):
+        parent = self.parent()
+        if parent is not None and self._visible and not self._rect.isEmpty():
+            parent.update(self._rect)
+
+    def paint(self, painter, offset=QPoint(0, 0)):
+        """Dessine le bouton (fond rond + icône centrée) avec le painter du menu"""
+        rect = self._rect.translated(offset)
+        background = self._hover_background if self.hovered else self._background
+        if background.alpha() > 0:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(background)
+            painter.drawEllipse(rect)
+        if self._pixmap is None and not self._icon.isNull():
+            self._pixmap = self._icon.pixmap(self._icon_size)
+        if self._pixmap is not None and not self._pixmap.isNull():
+            ratio = self._pixmap.devicePixelRatio() or 1
+            width = int(self._pixmap.width() / ratio)
+            height = int(self._pixmap.height() / ratio)
+            painter.drawPixmap(rect.x() + (rect.width() - width) // 2,
+                               rect.y() + (rect.height() - height) // 2,
+                               self._pixmap)
+
+    def grab(self):
+        """Capture du bouton (pour l'animation de fermeture)"""
+        pixmap = QPixmap(self._rect.size())
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.paint(painter, -self._rect.topLeft())
+        painter.end()
+        return pixmap
+
+    # === Événements transmis par RadialMenu ===
+    def click(self):
+        if self._visible:
+            self.clicked.emit()
+
+    def event(self, event):
+        event_type = event.type()
+        if event_type == QEvent.Type.Enter:
+            self.hovered = True
+            self._repaint()
+            return True
+        if event_type == QEvent.Type.Leave:
+            self.hovered = False
+            self._repaint()
+            return True
+        if event_type == QEvent.Type.MouseButtonPress:
+            if event.button() == Qt.MouseButton.LeftButton:
+                self.pressed = True
+            return True
+        if event_type == QEvent.Type.MouseButtonRelease:
+            was_pressed, self.pressed = self.pressed, False
+            # Comme QPushButton : clic seulement si relâché sur le bouton
+            if was_pressed and event.button() == Qt.MouseButton.LeftButton and self.contains(event.position().toPoint()):
+                self.clicked.emit()
+            return True
+        return super().event(event)
@@ -1,18 +1,60 @@
-import math
-from PyQt6.QtGui import QPainter, QColor, QIcon, QRadialGradient, QFont, QPen, QCursor, QPalette, QPainterPath
+import math, html
+from functools import lru_cache
+from PyQt6.QtGui import QPainter, QColor, QIcon, QPixmap, QRadialGradient, QFont, QPen, QCursor, QPalette, QPainterPath
 from PyQt6.QtCore import Qt, QSize, QTimer, QRect, QEasingCurve, QVariantAnimation, QEvent, QPointF, QRectF
 from PyQt6.QtWidgets import QApplication, QWidget, QPushButton, QDialog, QVBoxLayout, QHBoxLayout
 from PyQt6.QtWidgets import QLabel
 
 from utils import *
-from ui import HoverSubMenu, RadialKeyboardListener, TooltipWindow
+from screen_profiles import clamp_center_to_screen
+from ui import HoverSubMenu, RadialKeyboardListener, TooltipWindow, PaintedButton, ClockTimer, SectorTable
 try:
     from ui.StorageBar import StorageBar
 except ImportError:
     from StorageBar import StorageBar
 
+# Fonds selon le type de bouton : (fond normal, fond au survol, padding nul), RGBA ou None = transparent
+_BUTTON_STYLE_KINDS = {
+    "special": (None, (255, 255, 255, 100), False),
+    "image": (None, (255, 255, 255, 30), True),
+    "default": ((255, 255, 255, 10), (255, 255, 255, 100), False),
+}
+
+
+def _css_color(rgba):
+    return f"rgba({', '.join(map(str, rgba))})" if rgba else "transparent"
+
+
+def button_pixmap(label):
+    """Icône d'un bouton du menu selon son label : (pixmap, taille). Passe par le cache de utils."""
+    if "/" in label:
+        # C'est un chemin d'image - légèrement plus petit pour voir le hover
+        return image_pixmap(label, 48), 48
+    if is_emoji(label):
+        return emoji_pixmap(label, 32), 32
+    # C'est du texte simple
+    return text_pixmap(label, 32), 32
+
+
+@lru_cache(maxsize=None)
+def button_stylesheet(kind, radius):
+    """Feuille de style d'un bouton du menu (une chaîne par type et rayon, réutilisée par Qt)"""
+    background, hover_background, no_padding = _BUTTON_STYLE_KINDS[kind]
+    padding = "\n                padding: 0px;" if no_padding else ""
+    return f"""
+            QPushButton {{
+                background-color: {_css_color(background)};
+                border-radius: {radius}px;
+                border: none;{padding}
+            }}
+            QPushButton:hover {{
+                background-color: {_css_color(hover_background)};
+            }}
+        """
+
+
 class RadialMenu(QWidget):
-    def __init__(self, x, y, buttons, parent=None, sub=False, tracker=None, app_instance=None, neon_color=None, action_zone_colors=None, nb_icons_menu=None, show_central_icon=None, menu_background_color=None, zone_basic_opacity=None, zone_hover_opacity=None, clips_by_link=[], shadow_offset=4, shadow_color=(200, 200, 200), shadow_enabled=True, shadow_angle=135):
+    def __init__(self, x, y, buttons, parent=None, sub=False, tracker=None, app_instance=None, neon_color=None, action_zone_colors=None, nb_icons_menu=None, show_central_icon=None, menu_background_color=None, zone_basic_opacity=None, zone_hover_opacity=None, clips_by_link=[], shadow_offset=4, shadow_color=(200, 200, 200), shadow_enabled=True, shadow_angle=135, menu_engine="widgets"):
         super().__init__(parent)  # Ne jamais utiliser tracker comme parent
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint | Qt.WindowType.ToolTip)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
@@ -33,6 +75,12 @@ class RadialMenu(QWidget):
             self.radius = int(80 * (num_buttons / 7))
         
         self.buttons = []
+        # Boutons libérés par update_buttons, réutilisés au lieu d'être recréés (changement de page)
+        self.button_pool = []
+        # Moteur de rendu : "widgets" (un QPushButton par clip) ou "painted" (tout dans paintEvent)
+        self.painted_engine = menu_engine == "painted"
+        self.hovered_painted_button = None  # PaintedButton sous la souris
+        self.pressed_painted_button = None  # PaintedButton qui a reçu l'appui (reçoit la suite)
         self.clips_by_link = clips_by_link
         self.shadow_offset = shadow_offset
         self.shadow_color = shadow_color
@@ -43,6 +91,8 @@ class RadialMenu(QWidget):
         # Ajouter de l'espace pour les badges (50 pixels de chaque côté)
         self.widget_size = self.diameter + 100
         
+        # Garder le cercle entier sur l'écran où le menu s'ouvre
+        x, y = clamp_center_to_screen(x, y, self.diameter // 2)
         self.target_x = x - self.widget_size // 2
         self.target_y = y - self.widget_size // 2
         
@@ -54,8 +104,8 @@ class RadialMenu(QWidget):
         self.central_text = ""
         self.tooltips = {}
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.advance_animation)
+        # Pulsation du néon : horloge partagée, ne tourne que si le néon est actif
+        self.timer = ClockTimer(self, self.advance_animation)
 
         step = 2
         max_val = 50
@@ -71,6 +121,19 @@ class RadialMenu(QWidget):
         self.neon_color = neon_color
         self.widget_opacity = 1.0
         self.scale_factor = 0.1  # Démarrer petit pour l'animation
+        self.open_anim = None  # Animation d'ouverture (réutilisée d'une page à l'autre)
+        # Captures des boutons pendant l'animation de fermeture : [(position, pixmap)]
+        self.button_snapshots = []
+        self.snapshot_indices = None  # Indices des boutons capturés (remplacent les visibles)
+        # Cache de paintEvent : indices des boutons visibles et couches statiques
+        self._visible_indices_cache = None
+        self._static_layer_key = None
+        self._static_layer_pixmap = None
+        # Table des secteurs (hit-test angulaire) et regroupement des mouvements de souris
+        self._sector_table = None
+        self._pending_mouse_pos = None
+        self._mouse_move_timer = ClockTimer(self, self.flush_mouse_move)
+        self._mouse_move_timer.setSingleShot(True)
 
         self.current_index = 0
         self.current_grabed_clip_label = None
@@ -140,17 +203,15 @@ class RadialMenu(QWidget):
         # === ANIMATION BOUTONS SPÉCIAUX (hover sur ➕) ===
         self.special_buttons_revealed = False  # Les boutons spéciaux sont-ils complètement révélés ?
         self.special_animating = False  # Animation en cours ?
-        self.special_reveal_timer = QTimer(self)
+        self.special_reveal_timer = ClockTimer(self, self.reveal_next_special_button)
         self.special_reveal_timer.setSingleShot(True)
-        self.special_reveal_timer.timeout.connect(self.reveal_next_special_button)
         self.special_reveal_queue = []  # File d'attente des boutons à révéler
         self.plus_button_index = None  # Index du bouton ➕
         self.special_button_indices = []  # Indices des boutons spéciaux (sauf ➕)
         
         # Animation de fermeture (reverse)
-        self.special_hide_timer = QTimer(self)
+        self.special_hide_timer = ClockTimer(self, self.hide_next_special_button)
         self.special_hide_timer.setSingleShot(True)
-        self.special_hide_timer.timeout.connect(self.hide_next_special_button)
         self.special_hide_queue = []  # File d'attente des boutons à cacher
         
         # Tracking de la zone spéciale
@@ -232,25 +293,12 @@ class RadialMenu(QWidget):
                 bx = center_offset + self.radius * math.cos(angle) - self.btn_size // 2
                 by = center_offset + self.radius * math.sin(angle) - self.btn_size // 2
 
-                btn = QPushButton("", self)
-                # Activer le hover tracking pour ce bouton
-                btn.setAttribute(Qt.WidgetAttribute.WA_Hover, True)
-                # Activer le mouse tracking pour recevoir les événements MouseMove
-                btn.setMouseTracking(True)
+                btn = self._take_button()
                 
                 # Déterminer le type de label et utiliser la fonction appropriée
-                if "/" in label:
-                    # C'est un chemin d'image - légèrement plus petit pour voir le hover
-                    btn.setIcon(QIcon(image_pixmap(label, 48)))
-                    btn.setIconSize(QSize(48, 48))
-                elif is_emoji(label):
-                    # C'est un emoji
-                    btn.setIcon(QIcon(emoji_pixmap(label, 32)))
-                    btn.setIconSize(QSize(32, 32))
-                else:
-                    # C'est du texte simple
-                    btn.setIcon(QIcon(text_pixmap(label, 32)))
-                    btn.setIconSize(QSize(32, 32))
+                pixmap, icon_size = button_pixmap(label)
+                btn.setIcon(QIcon(pixmap))
+                btn.setIconSize(QSize(icon_size, icon_size))
                 
                 # Les boutons spéciaux (➕ 🔧 ➖) ont un fond transparent MAIS coloré au hover
                 special_buttons = self.special_buttons_by_numbers[self.nb_icons_menu]
@@ -260,40 +308,19 @@ class RadialMenu(QWidget):
                         self.plus_button_index = i
                     else:
                         self.special_button_indices.append(i)
-                    btn.setStyleSheet(f"""
-                        QPushButton {{
-                            background-color: transparent;
-                            border-radius: {self.btn_size // 2}px;
-                            border: none;
-                        }}
-                        QPushButton:hover {{
-                            background-color: rgba(255, 255, 255, 100);
-                        }}
-                    """)
+                    style_kind = "special"
                 elif "/" in label:
                     # Boutons avec images - pas de padding, fond transparent
-                    btn.setStyleSheet(f"""
-                        QPushButton {{
-                            background-color: transparent;
-                            border-radius: {self.btn_size // 2}px;
-                            border: none;
-                            padding: 0px;
-                        }}
-                        QPushButton:hover {{
-                            background-color: rgba(255, 255, 255, 30);
-                        }}
-                    """)
+                    style_kind = "image"
                 else:
-                    btn.setStyleSheet(f"""
-                        QPushButton {{
-                            background-color: rgba(255, 255, 255, 10);
-                            border-radius: {self.btn_size // 2}px;
-                            border: none;
-                        }}
-                        QPushButton:hover {{
-                            background-color: rgba(255, 255, 255, 100);
-                        }}
-                    """)
+                    style_kind = "default"
+                if self.painted_engine:
+                    btn.set_colors(*_BUTTON_STYLE_KINDS[style_kind][:2])
+                elif btn.property("style_kind") != style_kind:
+                    # Assignée une seule fois : les animations d'ouverture/fermeture ne touchent plus aux styles,
+                    # et un bouton réutilisé ne repasse par le moteur de style que s'il change de type
+                    btn.setStyleSheet(button_stylesheet(style_kind, self.btn_size // 2))
+                    btn.setProperty("style_kind", style_kind)
                 btn.setFixedSize(self.btn_size, self.btn_size)
                 btn.move(int(bx), int(by))
                 btn.setVisible(False)
@@ -315,16 +342,40 @@ class RadialMenu(QWidget):
                 # elif self.nb_icons_menu == 7:   
                 btn.clicked.connect(self.make_click_handler(callback, label, tooltip, action))
                 
-                # Installer l'eventFilter pour tous les boutons (pour tooltips et badges)
-                btn.installEventFilter(self)
                 if tooltip:
                     self.tooltips[btn] = (tooltip, tooltip_html)
                     btn.setProperty("tooltip_text", tooltip)
                 self.buttons.append(btn)
             
+        self._visible_indices_cache = None
         # Créer les 3 badges globaux (un par action) - seront positionnés dynamiquement
-        self.action_badges = {}
-        self._create_action_badges()
+        # (conservés d'une page à l'autre)
+        if not self.action_badges:
+            self._create_action_badges()
+
+    def _take_button(self):
+        """Bouton libre du pool, ou nouveau bouton si le pool est vide"""
+        if self.button_pool:
+            return self.button_pool.pop()
+        btn = PaintedButton(self) if self.painted_engine else QPushButton("", self)
+        # Activer le hover tracking pour ce bouton
+        btn.setAttribute(Qt.WidgetAttribute.WA_Hover, True)
+        # Activer le mouse tracking pour recevoir les événements MouseMove
+        btn.setMouseTracking(True)
+        # Installer l'eventFilter pour tous les boutons (pour tooltips et badges)
+        btn.installEventFilter(self)
+        return btn
+
+    def _release_buttons(self):
+        """Cache les boutons courants et les remet dans le pool (ni destruction ni réallocation)"""
+        for btn in self.buttons:
+            btn.setVisible(False)
+            try:
+                btn.clicked.disconnect()
+            except TypeError:
+                pass
+            btn.setProperty("tooltip_text", None)
+            self.button_pool.append(btn)
 
     def _create_action_badges(self):
         """Crée ou recrée les badges d'action avec les couleurs actuelles"""
@@ -393,29 +444,32 @@ class RadialMenu(QWidget):
                     }
                 """)
 
-    def update_buttons(self, buttons):
-        """Met à jour les boutons existants sans recréer le widget entier"""
+    def update_buttons(self, buttons, reveal=True):
+        """
+        Met à jour les boutons existants sans recréer le widget entier.
+        Les boutons sont recyclés (pool) : changer de page ne crée ni ne détruit aucun widget.
+        reveal=False laisse les boutons cachés (l'appelant rejoue l'animation d'ouverture).
+        """
         # Sauvegarder l'état actuel
         was_visible = self.isVisible()
         current_opacity = self.widget_opacity
         
-        # Détruire les anciens boutons
-        for btn in self.buttons:
-            btn.removeEventFilter(self)
-            btn.deleteLater()
+        # Remettre les anciens boutons dans le pool
+        self._release_buttons()
         
-        # Détruire les anciens badges
-        if hasattr(self, 'action_badges'):
-            for badge in self.action_badges.values():
-                badge.deleteLater()
+        # Les badges sont conservés, seulement cachés
+        for badge in self.action_badges.values():
+            badge.setVisible(False)
         
         self.buttons.clear()
+        self._visible_indices_cache = None
+        self.hovered_painted_button = None
+        self.pressed_painted_button = None
         self.tooltips.clear()
         self.button_colors.clear()
         self.button_actions.clear()
         self.button_labels.clear()
         self.button_is_group.clear()
-        self.action_badges = {}
         self.storage_button_index = None  # Réinitialiser l'index du bouton ➖
         self.plus_button_index = None  # Réinitialiser l'index du bouton ➕
         self.special_button_indices = []  # Réinitialiser les indices des boutons spéciaux
@@ -460,7 +514,8 @@ class RadialMenu(QWidget):
             self.diameter = 2 * (self.radius + self.btn_size)
             self.widget_size = self.diameter + 100
             self.resize(self.widget_size, self.widget_size)
-            # Recentrer
+            # Recentrer (le cercle agrandi doit rester sur l'écran)
+            self.x, self.y = clamp_center_to_screen(self.x, self.y, self.diameter // 2)
             self.move(self.x - self.widget_size // 2, self.y - self.widget_size // 2)
         # Réinitialiser le hover
         self.hovered_action = None
@@ -468,7 +523,7 @@ class RadialMenu(QWidget):
         # Créer les nouveaux boutons
         self.create_buttons(buttons)
         # Restaurer l'état
-        if was_visible:
+        if was_visible and reveal:
             self.set_widget_opacity(current_opacity)
             # Utiliser reveal_buttons pour respecter la logique des boutons spéciaux
             self.reveal_buttons()
@@ -478,8 +533,8 @@ class RadialMenu(QWidget):
         # Repositionner la fenêtre tooltip
         self.update_tooltip_position()
         
-        # Recréer les badges d'action avec les couleurs actuelles
-        self._create_action_badges()
+        # Badges d'action avec les couleurs actuelles
+        self.update_badge_colors()
         
         # Réinitialiser le focus visuel mais garder l'état du clavier
         # Si l'utilisateur a déjà utilisé le clavier, on garde cet état
@@ -491,6 +546,10 @@ class RadialMenu(QWidget):
     def eventFilter(self, watched, event):
         """Gère les événements de hover sur les boutons"""
         
+        # Un bouton apparaît ou disparaît : la liste des boutons visibles est à recalculer
+        if event.type() in (QEvent.Type.Show, QEvent.Type.Hide) and watched in self.buttons:
+            self._visible_indices_cache = None
+        
         # === GESTION DU DRAG & DROP DES CLIPS (toujours actif) ===
         if watched in self.buttons:
             button_index = self.buttons.index(watched)
@@ -592,12 +651,7 @@ class RadialMenu(QWidget):
             
             # Afficher le message de hover dans la fenêtre tooltip (sauf pendant le drag)
             if not self.drag_active and watched in self.tooltips:
-                tooltip_data = self.tooltips[watched]
-                # Supporter l'ancien format (string) et le nouveau (tuple)
-                if isinstance(tooltip_data, tuple):
-                    tooltip_text, tooltip_html = tooltip_data
-                else:
-                    tooltip_text, tooltip_html = tooltip_data, None
+                tooltip_text, tooltip_html = self.button_tooltip(watched, button_index)
                 # Afficher dans la fenêtre tooltip en dessous (durée infinie)
                 self.tooltip_window.show_message(tooltip_text, 0, html=tooltip_html)
                 self.update_tooltip_position()
@@ -621,37 +675,51 @@ class RadialMenu(QWidget):
     
     def is_angle_in_special_zone(self, mouse_angle):
         """Détermine si l'angle de la souris correspond à une zone de bouton spécial"""
-        # Obtenir les boutons visibles
-        visible_indices = [i for i, btn in enumerate(self.buttons) if btn.isVisible()]
-        if not visible_indices:
+        table = self.sector_table()
+        if not table.count:
             return False
+        return table.position_at(mouse_angle) in table.special_positions
+    
+    def sector_table(self):
+        """SectorTable des boutons visibles (reconstruite si les visibles, le rayon ou le tri changent)"""
+        visible_indices = self.visible_button_indices()
+        sort_mode = getattr(self.app_instance, 'sort_mode', 'group')
+        table = self._sector_table
+        if table is None or table.indices is not visible_indices or table.radius != self.radius or table.sort_mode != sort_mode:
+            all_special_indices = set(self.special_button_indices)
+            if self.plus_button_index is not None:
+                all_special_indices.add(self.plus_button_index)
+            table = SectorTable(
+                visible_indices, self.button_actions, self.button_labels,
+                self.special_buttons_by_numbers[self.nb_icons_menu], all_special_indices,
+                self.radius, sort_mode
+            )
+            self._sector_table = table
+        return table
+    
+    def show_action_badge(self, table, use_custom_angle=True):
+        """Affiche le badge de l'action survolée à l'angle moyen de ses boutons"""
+        # Masquer tous les badges d'abord
+        for badge in self.action_badges.values():
+            badge.setVisible(False)
+        if not self.hovered_action or self.hovered_action not in self.action_badges:
+            return
+        if self.hovered_action not in table.action_angles:
+            return
+        avg_angle_rad = table.action_angles[self.hovered_action]
+        if use_custom_angle and table.sort_mode == "custom":
+            avg_angle_rad = math.radians(-90)
         
-        num_visible = len(visible_indices)
-        angle_step = 360 / num_visible
-        
-        # Tous les indices spéciaux (y compris ➕)
-        all_special_indices = self.special_button_indices + ([self.plus_button_index] if self.plus_button_index is not None else [])
-        
-        # Trouver la position de chaque bouton spécial visible dans le cercle
-        for pos, btn_index in enumerate(visible_indices):
-            if btn_index in all_special_indices:
-                # Calculer l'angle de ce bouton
-                button_angle = pos * angle_step
-                
-                # Vérifier si l'angle de la souris est dans cette zone
-                half_step = angle_step / 2
-                min_angle = (button_angle - half_step) % 360
-                max_angle = (button_angle + half_step) % 360
-                
-                # Gérer le cas où la zone traverse 0°
-                if min_angle > max_angle:
-                    if mouse_angle >= min_angle or mouse_angle < max_angle:
-                        return True
-                else:
-                    if min_angle <= mouse_angle < max_angle:
-                        return True
+        # Distance du badge depuis le centre (juste après les boutons)
+        badge_distance = self.radius + self.btn_size + 20
+        center = self.rect().center()
+        badge_x = center.x() + badge_distance * math.cos(avg_angle_rad)
+        badge_y = center.y() + badge_distance * math.sin(avg_angle_rad)
         
-        return False
+        # Centrer le badge sur cette position
+        badge = self.action_badges[self.hovered_action]
+        badge.move(int(badge_x - badge.width() / 2), int(badge_y - badge.height() / 2))
+        badge.setVisible(True)
     
     def on_enter_special_zone(self):
         """Appelé quand la souris entre dans la zone des boutons spéciaux"""
@@ -785,7 +853,7 @@ class RadialMenu(QWidget):
     def reposition_visible_buttons(self):
         """Repositionne les boutons visibles uniformément sur le cercle et ajuste le rayon"""
         # Obtenir les indices des boutons visibles (dans l'ordre)
-        visible_indices = [i for i, btn in enumerate(self.buttons) if btn.isVisible()]
+        visible_indices = self.visible_button_indices()
         
         if not visible_indices:
             return
@@ -803,6 +871,7 @@ class RadialMenu(QWidget):
             self.diameter = 2 * (self.radius + self.btn_size)
             self.widget_size = self.diameter + 100
             self.resize(self.widget_size, self.widget_size)
+            self.x, self.y = clamp_center_to_screen(self.x, self.y, self.diameter // 2)
             self.move(self.x - self.widget_size // 2, self.y - self.widget_size // 2)
         
         # Repositionner chaque bouton visible uniformément sur le cercle
@@ -967,12 +1036,18 @@ class RadialMenu(QWidget):
             child_alias = child.get('alias', '')
             child_string = child.get('string', '')
             child_action = child.get('action', 'copy')
-            child_html = child.get('html_string') or child.get('html')  # Récupérer le HTML
+            # Aperçus tronqués du tooltip (HTML complet à défaut)
+            tooltip_text, child_html = clip_tooltip_from_record(child)
+            # Enfant exec suivi : état de sa dernière exécution, comme au premier niveau
+            status = exec_run_status(child_string) if child_action == "exec" and child.get('tracked') else None
+            if status:
+                tooltip_text = f"{tooltip_text}\n\n{status}"
+                if child_html:
+                    child_html = f"{child_html}<p>{html.escape(status).replace(chr(10), '<br>')}</p>"
             
             # Créer le handler pour ce clip enfant (passer group_alias pour les modes update/delete/store)
-            handler = self.make_group_child_click_handler(child_alias, child_string, child_action, group_alias)
+            handler = self.make_group_child_click_handler(child_alias, child_string, child_action, group_alias, group_child_html(child), exec_kwargs(child))
             
-            tooltip_text = child_string.replace(r'\n', '\n')
             # Passer un tuple (tooltip_text, tooltip_html) pour supporter le linting
             tooltip = (tooltip_text, child_html) if child_html else tooltip_text
             submenu_buttons.append((child_alias, handler, tooltip))
@@ -991,7 +1066,7 @@ class RadialMenu(QWidget):
         self.hover_submenu.show()
         self.hover_submenu.animate_open()
     
-    def make_group_child_click_handler(self, alias, string, action, group_alias):
+    def make_group_child_click_handler(self, alias, string, action, group_alias, html_string=None, command_kwargs=None):
         """Crée un handler pour un clip enfant d'un groupe (appelé depuis le sous-menu)"""
         
         def handler():
@@ -1024,13 +1099,14 @@ class RadialMenu(QWidget):
             
             # Mode NORMAL : exécuter l'action du clip
             if action == "copy":
-                paperclip_copy(string)
+                paperclip_copy(string, html_string)
                 message = f'"{string}" copié'
             elif action == "term":
                 execute_terminal(string)
                 message = f'"{string}" exécuté dans un terminal'
             elif action == "exec":
-                execute_command(string)
+                # "tracked" suit le clip dans les groupes comme au premier niveau
+                execute_command(string, **(command_kwargs or {}))
                 message = f'"{string}" lancé'
             else:
                 message = None
@@ -1127,11 +1203,19 @@ class RadialMenu(QWidget):
 
     def toggle_neon(self, enabled: bool):
         self.neon_enabled = enabled
+        if not enabled:
+            self.timer.stop()
         self.update()
 
+    def neon_rect(self):
+        """Zone couverte par le néon (rayon maximal), seule à redessiner pendant la pulsation"""
+        radius = int(max(self.keyframes) * self.scale_factor) + 2
+        center = self.rect().center()
+        return QRect(center.x() - radius, center.y() - radius, 2 * radius, 2 * radius)
+
     def advance_animation(self):
-        self.set_neon_radius(self.keyframes[self.current_index])
-        self.update()
+        self.neon_radius = self.keyframes[self.current_index]
+        self.update(self.neon_rect())
         self.current_index = (self.current_index + 1) % len(self.keyframes)
 
     def make_click_handler(self, cb, label, value, action):
@@ -1147,7 +1231,35 @@ class RadialMenu(QWidget):
             cb()
         return handler
 
+    # === MOTEUR "painted" : hit-test et transmission des événements aux PaintedButton ===
+    def button_at(self, pos):
+        """PaintedButton visible sous la position (coordonnées du menu), ou None"""
+        for btn in reversed(self.buttons):
+            if btn.contains(pos):
+                return btn
+        return None
+
+    def _update_painted_hover(self, pos):
+        """Envoie Leave/Enter aux PaintedButton, comme Qt le fait pour les widgets"""
+        btn = self.button_at(pos) if pos is not None else None
+        if btn is self.hovered_painted_button:
+            return
+        previous, self.hovered_painted_button = self.hovered_painted_button, btn
+        if previous is not None:
+            QApplication.sendEvent(previous, QEvent(QEvent.Type.Leave))
+        if btn is not None:
+            QApplication.sendEvent(btn, QEvent(QEvent.Type.Enter))
+
     def mousePressEvent(self, event):
+        self.flush_mouse_move()
+        if self.painted_engine:
+            btn = self.button_at(event.pos())
+            if btn is not None:
+                # Comme pour un QPushButton : l'appui est pour le bouton, pas pour le menu
+                self.pressed_painted_button = btn
+                QApplication.sendEvent(btn, event)
+                return
+        
         # Calculer la distance au centre
         center = self.rect().center()
         dx = event.pos().x() - center.x()
@@ -1188,6 +1300,14 @@ class RadialMenu(QWidget):
 
     def mouseReleaseEvent(self, event):
         """Gère la fin du drag en mode réordonnancement"""
+        # L'état du drop doit refléter la dernière position de la souris
+        self.flush_mouse_move()
+        if self.painted_engine and self.pressed_painted_button is not None and not self.drag_active:
+            # Le bouton qui a reçu l'appui reçoit le relâchement (déclenche le clic)
+            btn, self.pressed_painted_button = self.pressed_painted_button, None
+            QApplication.sendEvent(btn, event)
+            return
+        
         if self.drag_active and event.button() == Qt.MouseButton.LeftButton:
             # Libérer la capture de la souris
             self.releaseMouse()
@@ -1405,6 +1525,9 @@ class RadialMenu(QWidget):
         self.drop_on_center = False
         self.drop_outside = False
         self.drag_left_widget = False
+        if self.pressed_painted_button is not None:
+            self.pressed_painted_button.pressed = False
+            self.pressed_painted_button = None
         self.setCursor(Qt.CursorShape.ArrowCursor)
         # Masquer les badges
         for badge in self.action_badges.values():
@@ -1440,6 +1563,10 @@ class RadialMenu(QWidget):
     
     def leaveEvent(self, event):
         """Efface l'icône centrale quand la souris quitte le widget"""
+        self.flush_mouse_move()
+        if self.painted_engine and not self.drag_active:
+            self._update_painted_hover(None)
+        
         if self.show_central_icon and self.central_icon is not None:
             self.central_icon = None
             self.hovered_button_index = None
@@ -1478,7 +1605,33 @@ class RadialMenu(QWidget):
     def mouseMoveEvent(self, event):
         """Détecte quelle action est survolée par la souris (zone angulaire complète)
         et gère également la détection des zones spéciales pour l'expand/collapse"""
+        if self.painted_engine and not self.drag_active and self.pressed_painted_button is not None:
+            # Bouton appuyé : il reçoit les déplacements (détection du drag dans eventFilter)
+            QApplication.sendEvent(self.pressed_painted_button, event)
+            return
         
+        # Regrouper les déplacements (souris à haute fréquence) : au plus une évaluation par image
+        self._pending_mouse_pos = event.pos()
+        if not self._mouse_move_timer.isActive():
+            self._mouse_move_timer.start(0)
+    
+    def flush_mouse_move(self):
+        """Traite tout de suite le dernier déplacement en attente (avant un clic, une sortie...)"""
+        self._mouse_move_timer.stop()
+        pos, self._pending_mouse_pos = self._pending_mouse_pos, None
+        if pos is not None:
+            self.process_mouse_move(pos)
+    
+    def _mouse_angle(self, pos):
+        """(distance² au centre, angle en degrés 0-360, 0° = droite, sens horaire)"""
+        center = self.rect().center()
+        dx = pos.x() - center.x()
+        dy = pos.y() - center.y()
+        angle_deg = math.degrees(math.atan2(dy, dx)) % 360
+        return dx * dx + dy * dy, angle_deg
+    
+    def process_mouse_move(self, pos):
+        """Évaluation du survol / du drag pour une position de la souris"""
         # === GESTION DU DRAG EN COURS (grabMouse actif) ===
         if self.drag_active:
             # Si on était sorti et on revient, reset drop_outside
@@ -1487,19 +1640,8 @@ class RadialMenu(QWidget):
                 self.drop_outside = False
             
             # Calculer l'angle et la distance de la souris
-            center = self.rect().center()
-            dx = event.pos().x() - center.x()
-            dy = event.pos().y() - center.y()
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            angle_rad = math.atan2(dy, dx)
-            if angle_rad < 0:
-                angle_rad += 2 * math.pi
-            angle_deg = math.degrees(angle_rad)
-            
-            # Obtenir les boutons visibles
-            visible_indices = [i for i, btn in enumerate(self.buttons) if btn.isVisible()]
-            num_visible = len(visible_indices)
+            distance_sq, angle_deg = self._mouse_angle(pos)
+            table = self.sector_table()
             
             # Zone centrale pour le stockage (rayon < 40 pixels)
             center_radius = 40
@@ -1512,14 +1654,14 @@ class RadialMenu(QWidget):
             old_drop_indicator_angle = self.drop_indicator_angle
             old_drop_on_clip_index = self.drop_on_clip_index
             
-            if distance < center_radius:
+            if distance_sq < center_radius * center_radius:
                 # On est au centre -> proposer de stocker
                 self.drop_on_center = True
                 self.drop_outside = False
                 self.drop_indicator_angle = None
                 self.drop_target_info = None
                 self.drop_on_clip_index = None
-            elif distance > outer_limit:
+            elif distance_sq > outer_limit * outer_limit:
                 # On est en dehors -> proposer de supprimer
                 self.drop_outside = True
                 self.drop_on_center = False
@@ -1530,8 +1672,8 @@ class RadialMenu(QWidget):
                 # Zone normale de réordonnancement
                 self.drop_on_center = False
                 self.drop_outside = False
-                if num_visible > 0:
-                    self._update_drop_indicator(angle_deg, visible_indices, num_visible)
+                if table.count > 0:
+                    self._update_drop_indicator(angle_deg, table)
             
             # Mettre à jour le tooltip si l'état a changé
             state_changed = (
@@ -1547,35 +1689,22 @@ class RadialMenu(QWidget):
             self.update()
             return  # Pas de gestion de hover pendant le drag
         
+        if self.painted_engine:
+            self._update_painted_hover(pos)
+        
         if not self.buttons:
             return
         
-        # Obtenir les boutons visibles
-        visible_indices = [i for i, btn in enumerate(self.buttons) if btn.isVisible()]
-        if not visible_indices:
+        # Table des secteurs des boutons visibles
+        table = self.sector_table()
+        if not table.count:
             return
-        num_visible = len(visible_indices)
-        
-        # Calculer la position relative au centre
-        center = self.rect().center()
-        dx = event.pos().x() - center.x()
-        dy = event.pos().y() - center.y()
-        # Calculer la distance au centre
-        distance = math.sqrt(dx * dx + dy * dy)
         
-        # Calculer l'angle de la souris (0° = droite, sens horaire)
-        angle_rad = math.atan2(dy, dx)
-        
-        # Normaliser pour être positif (0 à 2π)
-        if angle_rad < 0:
-            angle_rad += 2 * math.pi
-        
-        # Convertir en degrés
-        angle_deg = math.degrees(angle_rad)
+        distance_sq, angle_deg = self._mouse_angle(pos)
         
         # Si on est trop près du centre ou au-delà de la zone externe, pas de hover
-        # if distance < 58 or distance > self.radius + self.btn_size + 10:
-        if distance < 20 or distance > self.radius + self.btn_size + 10:
+        outer_limit = self.radius + self.btn_size + 10
+        if distance_sq < 20 * 20 or distance_sq > outer_limit * outer_limit:
             if self.hovered_action is not None or self.central_icon is not None:
                 self.hovered_action = None
                 self.hovered_button_index = None
@@ -1586,72 +1715,35 @@ class RadialMenu(QWidget):
                 self.update()
             # Sortie de zone spéciale si on était dedans
             if self.mouse_in_special_zone:
-                # print("sortie mouse_in_special_zone 1")
                 self.mouse_in_special_zone = False
                 self.on_leave_special_zone()
             return
         
+        # Position (parmi les visibles) du secteur sous la souris
+        visible_pos = table.position_at(angle_deg)
+        
         # === GESTION DE LA ZONE SPÉCIALE (expand/collapse) ===
-        in_special_zone = self.is_angle_in_special_zone(angle_deg)
+        in_special_zone = visible_pos in table.special_positions
         
         if in_special_zone and self.mouse_in_special_zone and not self.special_animating:
             self.on_enter_special_zone()
             # On entre dans la zone spéciale
-            # print("entrée mouse_in_special_zone")
             self.mouse_in_special_zone = True
         elif not in_special_zone and self.mouse_in_special_zone and not self.special_animating:
             # On sort de la zone spéciale
-            # self.mouse_in_special_zone = False
-            print("sortie mouse_in_special_zone 2")
             self.on_leave_special_zone()
         
         # === GESTION DES HOVERS D'ACTIONS (basé sur boutons VISIBLES) ===
-        # Trouver l'index du bouton VISIBLE correspondant à cet angle
-        angle_step = 360 / num_visible
-        visible_pos = int(round(angle_deg / angle_step)) % num_visible
-        # Convertir la position visible en index réel du bouton
-        button_index = visible_indices[visible_pos]
-        # Récupérer l'action de ce bouton
-        hovered_action = None
-        if button_index < len(self.button_actions):
-            hovered_action = self.button_actions[button_index]
-        sort_mode = getattr(self.app_instance, 'sort_mode', 'group')
+        hovered_action = table.actions[visible_pos]
         # Mettre à jour si l'action survolée a changé
         if hovered_action != self.hovered_action:
             self.on_leave_special_zone()
             self.hovered_action = hovered_action
-            # Masquer tous les badges d'abord
-            for badge in self.action_badges.values():
-                badge.setVisible(False)
-            
-            # Si une action est survolée, calculer la position et afficher son badge
-            if self.hovered_action and self.hovered_action in self.action_badges:
-                # Trouver tous les indices des boutons VISIBLES ayant cette action
-                indices_visible_pos = [pos for pos, idx in enumerate(visible_indices) 
-                                       if idx < len(self.button_actions) and self.button_actions[idx] == self.hovered_action]
-                
-                if indices_visible_pos:
-                    # Calculer l'angle moyen de tous ces boutons avec moyenne vectorielle
-                    angles_rad = [math.radians(pos * angle_step) for pos in indices_visible_pos]
-                    avg_x = sum(math.cos(a) for a in angles_rad) / len(angles_rad)
-                    avg_y = sum(math.sin(a) for a in angles_rad) / len(angles_rad)
-                    avg_angle_rad = math.atan2(avg_y, avg_x) if sort_mode != "custom" else math.radians(-90)
-                    
-                    # Distance du badge depuis le centre (juste après les boutons)
-                    badge_distance = self.radius + self.btn_size + 20
-                    
-                    # Position du badge
-                    center = self.rect().center()
-                    badge_x = center.x() + badge_distance * math.cos(avg_angle_rad)
-                    badge_y = center.y() + badge_distance * math.sin(avg_angle_rad)
-                    
-                    # Centrer le badge sur cette position
-                    badge = self.action_badges[self.hovered_action]
-                    badge.move(int(badge_x - badge.width() / 2), int(badge_y - badge.height() / 2))
-                    badge.setVisible(True)
+            # Badge à l'angle moyen précalculé des boutons de cette action
+            self.show_action_badge(table)
             self.update()
     
-    def _update_drop_indicator(self, mouse_angle_deg, visible_indices, num_visible):
+    def _update_drop_indicator(self, mouse_angle_deg, table):
         """
         Calcule la position de l'indicateur de drop pendant un drag.
         L'indicateur apparaît entre deux boutons adjacents, ou avant le premier / après le dernier.
@@ -1660,8 +1752,7 @@ class RadialMenu(QWidget):
         
         Args:
             mouse_angle_deg: Angle de la souris en degrés (0° = droite)
-            visible_indices: Liste des indices des boutons visibles
-            num_visible: Nombre de boutons visibles
+            table: SectorTable des boutons visibles (positions de drop précalculées)
         """
         # Vérifier si un drag est actif (soit un bouton normal, soit un enfant de groupe)
         if not self.drag_active:
@@ -1673,152 +1764,26 @@ class RadialMenu(QWidget):
         if self.dragged_button_index is None and not is_child_drag:
             return
         
-        # Boutons spéciaux à ignorer
-        special_buttons = self.special_buttons_by_numbers[self.nb_icons_menu]
-        
-        # Calculer l'angle par bouton visible
-        angle_step = 360 / num_visible
+        angle_step = table.angle_step
+        mouse_pos = table.position_at(mouse_angle_deg)
         
         # === 1. Mettre à jour hovered_action en fonction de l'angle de la souris ===
-        # Trouver quel bouton est sous l'angle de la souris
         old_hovered_action = self.hovered_action
-        for pos, btn_index in enumerate(visible_indices):
-            button_angle = pos * angle_step
-            # Calculer la distance angulaire
-            dist = abs(button_angle - mouse_angle_deg)
-            if dist > 180:
-                dist = 360 - dist
-            # Si la souris est dans la zone de ce bouton (demi-angle de chaque côté)
-            if dist < angle_step / 2:
-                action = self.button_actions[btn_index] if btn_index < len(self.button_actions) else None
-                if action is not None:
-                    self.hovered_action = action
-                break
+        if table.actions[mouse_pos] is not None:
+            self.hovered_action = table.actions[mouse_pos]
         
         # === 1b. Afficher le badge de l'action survolée (comme en mode normal) ===
         if self.hovered_action != old_hovered_action:
-            # Masquer tous les badges d'abord
-            for badge in self.action_badges.values():
-                badge.setVisible(False)
-            
-            # Si une action est survolée, calculer la position et afficher son badge
-            if self.hovered_action and self.hovered_action in self.action_badges:
-                # Trouver tous les indices des boutons VISIBLES ayant cette action
-                indices_visible_pos = [pos for pos, idx in enumerate(visible_indices) 
-                                       if idx < len(self.button_actions) and self.button_actions[idx] == self.hovered_action]
-                
-                if indices_visible_pos:
-                    # Calculer l'angle moyen de tous ces boutons avec moyenne vectorielle
-                    angles_rad = [math.radians(pos * angle_step) for pos in indices_visible_pos]
-                    avg_x = sum(math.cos(a) for a in angles_rad) / len(angles_rad)
-                    avg_y = sum(math.sin(a) for a in angles_rad) / len(angles_rad)
-                    avg_angle_rad = math.atan2(avg_y, avg_x)
-                    
-                    # Distance du badge depuis le centre (juste après les boutons)
-                    badge_distance = self.radius + self.btn_size + 20
-                    
-                    # Position du badge
-                    center = self.rect().center()
-                    badge_x = center.x() + badge_distance * math.cos(avg_angle_rad)
-                    badge_y = center.y() + badge_distance * math.sin(avg_angle_rad)
-                    
-                    # Centrer le badge sur cette position
-                    badge = self.action_badges[self.hovered_action]
-                    badge.move(int(badge_x - badge.width() / 2), int(badge_y - badge.height() / 2))
-                    badge.setVisible(True)
-        
-        # === 2. Trouver tous les clips (pas les boutons spéciaux) ===
-        all_clips = []
-        for pos, btn_index in enumerate(visible_indices):
-            label = self.button_labels[btn_index] if btn_index < len(self.button_labels) else ""
-            action = self.button_actions[btn_index] if btn_index < len(self.button_actions) else None
-            if label not in special_buttons and action is not None:
-                all_clips.append((btn_index, pos, action))
-        
-        if len(all_clips) < 1:
-            # Pas de clips pour réordonner
-            self.drop_indicator_angle = None
-            self.drop_target_info = None
-            return
-        
-        # === 3. Calculer toutes les positions de drop possibles ===
-        drop_positions = []
-        
-        # Filtrer les clips sans celui qu'on drag (sauf pour le drag d'enfant où on garde tout)
-        if is_child_drag:
-            clips_without_dragged = all_clips  # Tous les clips sont des cibles possibles
-        else:
-            clips_without_dragged = [(btn_index, pos, action) for btn_index, pos, action in all_clips 
-                                      if btn_index != self.dragged_button_index]
+            self.show_action_badge(table, use_custom_angle=False)
         
+        # === 2-4. Clips cibles et positions de drop (précalculées pour ce bouton déplacé) ===
+        clips_without_dragged, drop_positions = table.drop_positions(self.dragged_button_index, is_child_drag)
         if not clips_without_dragged:
+            # Pas de clips pour réordonner
             self.drop_indicator_angle = None
             self.drop_target_info = None
             return
         
-        # Pour chaque paire de clips adjacents
-        for i in range(len(clips_without_dragged)):
-            curr_btn_index, curr_pos, curr_action = clips_without_dragged[i]
-            next_i = (i + 1) % len(clips_without_dragged)
-            next_btn_index, next_pos, next_action = clips_without_dragged[next_i]
-            
-            # Calculer les angles
-            curr_angle = curr_pos * angle_step
-            next_angle = next_pos * angle_step
-            
-            # Gérer le passage par 0°
-            diff = next_angle - curr_angle
-            if diff > 180:
-                diff -= 360
-            elif diff < -180:
-                diff += 360
-            
-            if curr_action == next_action or (self.app_instance and getattr(self.app_instance, 'sort_mode', 'group') != "group"):
-                # Même zone OU pas de regroupement par zone : une seule position au milieu
-                indicator_angle = (curr_angle + diff / 2) % 360
-                drop_positions.append((indicator_angle, next_btn_index, True, curr_action))
-            else:
-                # Zones différentes ET mode group : deux positions distinctes
-                # Position pour "fin de zone courante" (1/3 de l'espace)
-                indicator_end_curr = (curr_angle + diff / 3) % 360
-                drop_positions.append((indicator_end_curr, curr_btn_index, False, curr_action))
-                
-                # Position pour "début de zone suivante" (2/3 de l'espace)
-                indicator_start_next = (curr_angle + 2 * diff / 3) % 360
-                drop_positions.append((indicator_start_next, next_btn_index, True, next_action))
-        
-        # === 4. Ajouter des positions explicites AVANT le premier clip et APRÈS le dernier ===
-        if len(clips_without_dragged) == 1:
-            # Un seul clip : ajouter des positions avant et après
-            only_btn_index, only_pos, only_action = clips_without_dragged[0]
-            only_angle = only_pos * angle_step
-            
-            # Position avant
-            indicator_before = (only_angle - angle_step / 2) % 360
-            drop_positions.append((indicator_before, only_btn_index, True, only_action))
-            
-            # Position après
-            indicator_after = (only_angle + angle_step / 2) % 360
-            drop_positions.append((indicator_after, only_btn_index, False, only_action))
-        else:
-            # Plusieurs clips : ajouter des positions aux extrémités absolues
-            # Trouver le premier et dernier clip (par position sur le cercle)
-            sorted_by_pos = sorted(clips_without_dragged, key=lambda x: x[1])
-            first_btn_index, first_pos, first_action = sorted_by_pos[0]
-            last_btn_index, last_pos, last_action = sorted_by_pos[-1]
-            
-            first_angle = first_pos * angle_step
-            last_angle = last_pos * angle_step
-            
-            # Position AVANT le tout premier clip (juste avant lui)
-            indicator_before_first = (first_angle - angle_step * 0.4) % 360
-            drop_positions.append((indicator_before_first, first_btn_index, True, first_action))
-            
-            # Position APRÈS le tout dernier clip (juste après lui)
-            # IMPORTANT: Toujours ajouter cette position pour permettre de mettre un clip en dernier
-            indicator_after_last = (last_angle + angle_step * 0.4) % 360
-            drop_positions.append((indicator_after_last, last_btn_index, False, last_action))
-        
         # === 5. Vérifier si on est directement SUR un clip (pour créer un groupe) ===
         # Seuil pour la fusion : si on est très proche du centre d'un clip
         fusion_threshold = angle_step * 0.2
@@ -1832,19 +1797,10 @@ class RadialMenu(QWidget):
         # Seulement permettre le drop ON clip si :
         # - le dragged n'est pas un groupe
         # - on ne drag PAS un enfant de groupe (il sort du groupe, pas fusion)
+        # Le seuil étant inférieur au demi-secteur, seul le clip du secteur sous la souris peut convenir
         if not dragged_is_group and not is_child_drag:
             for btn_index, pos, action in clips_without_dragged:
-                # Vérifier si la cible est un groupe (on peut dragger UN CLIP sur un groupe pour l'ajouter)
-                target_is_group = False
-                if btn_index < len(self.button_is_group):
-                    target_is_group = self.button_is_group[btn_index]
-                
-                clip_angle = pos * angle_step
-                dist = abs(clip_angle - mouse_angle_deg)
-                if dist > 180:
-                    dist = 360 - dist
-                
-                if dist < fusion_threshold:
+                if pos == mouse_pos and table.angular_distance(pos, mouse_angle_deg) < fusion_threshold:
                     drop_on_clip = btn_index
                     break
         
@@ -1944,6 +1900,27 @@ class RadialMenu(QWidget):
                     self.focused_index = i
                     break
     
+    def button_tooltip(self, btn, button_index):
+        """
+        (texte, html) du tooltip d'un bouton. Pour un clip exec, l'état de sa
+        dernière exécution (daemon) est ajouté à la suite.
+        """
+        tooltip_data = self.tooltips[btn]
+        # Supporter l'ancien format (string) et le nouveau (tuple)
+        if isinstance(tooltip_data, tuple):
+            tooltip_text, tooltip_html = tooltip_data
+        else:
+            tooltip_text, tooltip_html = tooltip_data, None
+        if (self.app_instance and button_index < len(self.button_actions)
+                and self.button_actions[button_index] == "exec"):
+            clip_data = self.app_instance.actions_map_sub.get(self.button_labels[button_index])
+            status = exec_run_status(clip_data[1]) if clip_data else None
+            if status:
+                tooltip_text = f"{tooltip_text}\n\n{status}"
+                if tooltip_html:
+                    tooltip_html = f"{tooltip_html}<p>{html.escape(status).replace(chr(10), '<br>')}</p>"
+        return tooltip_text, tooltip_html
+
     def show_focused_button_info(self):
         """Affiche les infos du bouton focusé"""
         if not (0 <= self.focused_index < len(self.buttons)):
@@ -1952,12 +1929,7 @@ class RadialMenu(QWidget):
         # Afficher le tooltip
         focused_button = self.buttons[self.focused_index]
         if focused_button in self.tooltips:
-            tooltip_data = self.tooltips[focused_button]
-            # Supporter l'ancien format (string) et le nouveau (tuple)
-            if isinstance(tooltip_data, tuple):
-                tooltip_text, tooltip_html = tooltip_data
-            else:
-                tooltip_text, tooltip_html = tooltip_data, None
+            tooltip_text, tooltip_html = self.button_tooltip(focused_button, self.focused_index)
             self.tooltip_window.show_message(tooltip_text, 0, html=tooltip_html)
             self.update_tooltip_position()
         
@@ -1987,21 +1959,73 @@ class RadialMenu(QWidget):
         # Repositionner les boutons visibles pour que le cercle soit adapté
         self.reposition_visible_buttons()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        center = self.rect().center()
-        # Appliquer le scale au diamètre
-        scaled_diameter = int(self.diameter * self.scale_factor)
-        
-        # Le cercle du menu radial (plus petit que le widget)
-        circle_rect = QRect(
-            (self.widget_size - scaled_diameter) // 2,
-            (self.widget_size - scaled_diameter) // 2,
-            scaled_diameter,
-            scaled_diameter
+    def painted_indices(self):
+        """Indices des boutons dessinés : les visibles, ou les capturés pendant la fermeture"""
+        if self.snapshot_indices is not None:
+            return self.snapshot_indices
+        return self.visible_button_indices()
+
+    def capture_button_snapshots(self):
+        """Remplace les boutons visibles par leurs captures, mises à l'échelle dans paintEvent"""
+        if self.snapshot_indices is not None:
+            return
+        self.snapshot_indices = list(self.visible_button_indices())
+        self.button_snapshots = [(QPointF(self.buttons[i].pos()), self.buttons[i].grab()) for i in self.snapshot_indices]
+        for i in self.snapshot_indices:
+            self.buttons[i].setVisible(False)
+
+    def visible_button_indices(self):
+        """Indices des boutons visibles (mis en cache, invalidé par les événements Show/Hide des boutons)"""
+        if self._visible_indices_cache is None:
+            self._visible_indices_cache = [i for i, btn in enumerate(self.buttons) if btn.isVisible()]
+        return self._visible_indices_cache
+
+    def _draw_sectors(self, painter, circle_rect, pos_actions, colors):
+        """Dessine les secteurs colorés des positions dont l'action a une couleur dans colors"""
+        num_visible = len(pos_actions)
+        angle_step = 360 / num_visible
+        # Léger chevauchement en degrés pour masquer les artefacts d'anti-aliasing
+        overlap = 1.0
+        painter.setPen(Qt.PenStyle.NoPen)
+        for pos, action in enumerate(pos_actions):
+            if action not in colors:
+                continue
+            # Calculer l'angle basé sur la position dans les visibles
+            button_angle = pos * angle_step
+            
+            # Ajouter un overlap si le secteur adjacent a la même couleur
+            extra_start = overlap if pos_actions[(pos - 1) % num_visible] == action else 0
+            extra_end = overlap if pos_actions[(pos + 1) % num_visible] == action else 0
+            
+            # Convertir en angle Qt (0° à droite, sens anti-horaire)
+            start_angle = -button_angle - (angle_step / 2) - extra_start
+            span_angle = angle_step + extra_start + extra_end
+            
+            painter.setBrush(colors[action])
+            painter.drawPie(circle_rect, int(start_angle * 16), int(span_angle * 16))
+
+    def _static_layer(self, circle_rect, pos_actions):
+        """
+        Couches statiques (ombre, fond, secteurs en couleur de base) rendues dans un pixmap.
+        Recalculé seulement si la configuration, les boutons visibles ou l'échelle changent.
+        """
+        ratio = self.devicePixelRatioF()
+        key = (
+            self.widget_size, self.diameter, self.scale_factor, ratio,
+            self.shadow_enabled, self.shadow_offset, tuple(self.shadow_color), self.shadow_angle,
+            tuple(self.menu_background_color), self.widget_opacity, self.zone_basic_opacity,
+            tuple((action, tuple(rgb)) for action, rgb in self.action_zone_colors.items()),
+            pos_actions,
         )
+        if key == self._static_layer_key:
+            return self._static_layer_pixmap
+        
+        pixmap = QPixmap(int(self.widget_size * ratio), int(self.widget_size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        scaled_diameter = circle_rect.width()
 
         # === OMBRE pour effet de volume (seulement la partie visible) ===
         if self.shadow_enabled and self.shadow_offset > 0:
@@ -2033,77 +2057,59 @@ class RadialMenu(QWidget):
         # Dessiner le fond global avec opacité contrôlée par MENU_OPACITY
         # _widget_opacity va de 0.0 à 1.0, on le convertit en alpha 0-255
         background_alpha = int(255 * self.widget_opacity)
-        
-        # Dessiner d'abord le fond complet
         painter.setBrush(QColor(*self.menu_background_color, background_alpha))
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawEllipse(circle_rect)
         
-        # Préparer les zones colorées seulement pour les boutons VISIBLES
+        # Zones colorées des boutons VISIBLES, en couleur de base
         # Convertir les opacités de 0-100 (config) vers 0-255 (QColor alpha)
-        basic_alpha = int(self.zone_basic_opacity * 255 / 100)
-        hover_alpha = int(self.zone_hover_opacity * 255 / 100)
+        if pos_actions:
+            basic_alpha = int(self.zone_basic_opacity * 255 / 100)
+            action_colors_base = {
+                action: QColor(*rgb, basic_alpha)
+                for action, rgb in self.action_zone_colors.items()
+            }
+            # CompositionMode_Source pour écraser le fond
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+            self._draw_sectors(painter, circle_rect, pos_actions, action_colors_base)
+        painter.end()
         
-        action_colors_base = {
-            action: QColor(*rgb, basic_alpha)
-            for action, rgb in self.action_zone_colors.items()
-        }
+        self._static_layer_key = key
+        self._static_layer_pixmap = pixmap
+        return pixmap
 
-        action_colors_hover = {
-            action: QColor(*rgb, hover_alpha)
-            for action, rgb in self.action_zone_colors.items()
-        }
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        center = self.rect().center()
+        # Appliquer le scale au diamètre
+        scaled_diameter = int(self.diameter * self.scale_factor)
         
-        # Obtenir les indices des boutons visibles
-        visible_indices = [i for i, btn in enumerate(self.buttons) if btn.isVisible()]
+        # Le cercle du menu radial (plus petit que le widget)
+        circle_rect = QRect(
+            (self.widget_size - scaled_diameter) // 2,
+            (self.widget_size - scaled_diameter) // 2,
+            scaled_diameter,
+            scaled_diameter
+        )
+
+        # Action de chaque position visible (détermine les secteurs et leurs adjacences)
+        visible_indices = self.painted_indices()
+        pos_actions = tuple(
+            self.button_actions[btn_index] if btn_index < len(self.button_actions) else None
+            for btn_index in visible_indices
+        )
+
+        # === COUCHES STATIQUES (ombre, fond, secteurs de base) : une seule copie de pixmap ===
+        painter.drawPixmap(0, 0, self._static_layer(circle_rect, pos_actions))
         
-        if visible_indices:
-            angle_step = 360 / len(visible_indices)
-            num_visible = len(visible_indices)
-            
-            # Pré-calculer l'action de chaque position pour détecter les adjacences
-            pos_actions = []
-            for pos, btn_index in enumerate(visible_indices):
-                action = self.button_actions[btn_index] if btn_index < len(self.button_actions) else None
-                pos_actions.append(action)
-            
-            # Dessiner les zones avec CompositionMode_Source pour écraser le fond
+        # === SURVOL : seuls les secteurs de l'action survolée sont redessinés par-dessus ===
+        if pos_actions and self.hovered_action in self.action_zone_colors:
+            hover_alpha = int(self.zone_hover_opacity * 255 / 100)
+            hover_color = QColor(*self.action_zone_colors[self.hovered_action], hover_alpha)
             painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
-            
-            # Léger chevauchement en degrés pour masquer les artefacts d'anti-aliasing
-            overlap = 1.0
-            
-            for pos, btn_index in enumerate(visible_indices):
-                action = pos_actions[pos]
-                
-                if action in action_colors_base:
-                    # Choisir la couleur selon si c'est survolé ou non
-                    if action == self.hovered_action:
-                        color = action_colors_hover[action]
-                    else:
-                        color = action_colors_base[action]
-                    
-                    # Calculer l'angle basé sur la position dans les visibles
-                    button_angle = pos * angle_step
-                    
-                    # Vérifier si les secteurs adjacents ont la même action
-                    prev_pos = (pos - 1) % num_visible
-                    next_pos = (pos + 1) % num_visible
-                    same_as_prev = pos_actions[prev_pos] == action
-                    same_as_next = pos_actions[next_pos] == action
-                    
-                    # Ajouter un overlap si le secteur adjacent a la même couleur
-                    extra_start = overlap if same_as_prev else 0
-                    extra_end = overlap if same_as_next else 0
-                    
-                    # Convertir en angle Qt (0° à droite, sens anti-horaire)
-                    start_angle = -button_angle - (angle_step / 2) - extra_start
-                    span_angle = angle_step + extra_start + extra_end
-                    
-                    painter.setBrush(color)
-                    painter.setPen(Qt.PenStyle.NoPen)
-                    painter.drawPie(circle_rect, int(start_angle * 16), int(span_angle * 16))
-            
+            self._draw_sectors(painter, circle_rect, pos_actions, {self.hovered_action: hover_color})
             # Revenir au mode de composition normal
             painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
         
@@ -2364,7 +2370,7 @@ class RadialMenu(QWidget):
         # === INDICATEUR DE FUSION (drop sur un clip pour créer un groupe) ===
         if self.drag_active and self.drop_on_clip_index is not None:
             # Trouver la position du clip cible
-            visible_indices = [i for i, btn in enumerate(self.buttons) if btn.isVisible()]
+            visible_indices = self.visible_button_indices()
             if self.drop_on_clip_index in visible_indices:
                 pos_in_visible = visible_indices.index(self.drop_on_clip_index)
                 angle_step = 360 / len(visible_indices)
@@ -2484,7 +2490,7 @@ class RadialMenu(QWidget):
             painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self.central_text)
         
         # === INDICATEURS DE GROUPE (petit badge sur les boutons qui sont des groupes) ===
-        visible_indices = [i for i, btn in enumerate(self.buttons) if btn.isVisible()]
+        visible_indices = self.painted_indices()
         if visible_indices and len(self.button_is_group) > 0:
             angle_step = 360 / len(visible_indices)
             center_offset = self.widget_size // 2
@@ -2530,7 +2536,7 @@ class RadialMenu(QWidget):
             # Vérifier si le bouton focusé est visible
             if self.buttons[self.focused_index].isVisible():
                 # Trouver la position du bouton focusé parmi les visibles
-                visible_indices = [i for i, btn in enumerate(self.buttons) if btn.isVisible()]
+                visible_indices = self.visible_button_indices()
                 if self.focused_index in visible_indices:
                     pos_in_visible = visible_indices.index(self.focused_index)
                     angle_step = 360 / len(visible_indices)
@@ -2556,6 +2562,24 @@ class RadialMenu(QWidget):
                     painter.setBrush(Qt.BrushStyle.NoBrush)
                     painter.drawEllipse(QPointF(btn_center_x, btn_center_y), focus_radius, focus_radius)
 
+        # === BOUTONS DU MOTEUR "painted" (par-dessus le reste, comme des widgets enfants) ===
+        if self.painted_engine:
+            for btn in self.buttons:
+                if btn.isVisible():
+                    btn.paint(painter)
+
+        # === CAPTURES DES BOUTONS (animation de fermeture) : une seule transformation ===
+        if self.button_snapshots:
+            center_offset = QPointF(self.widget_size / 2, self.widget_size / 2)
+            painter.save()
+            painter.translate(center_offset)
+            painter.scale(self.scale_factor, self.scale_factor)
+            painter.translate(-center_offset)
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            for pos, pixmap in self.button_snapshots:
+                painter.drawPixmap(pos, pixmap)
+            painter.restore()
+
     def handle_click_outside(self):
         """Gère le clic en dehors du menu (sur le tracker ou au centre)"""
         # Effacer l'icône centrale
@@ -2621,91 +2645,41 @@ class RadialMenu(QWidget):
         self.diameter = 2 * (self.radius + self.btn_size)
         self.widget_size = self.diameter + 100
         self.resize(self.widget_size, self.widget_size)
+        self.x, self.y = clamp_center_to_screen(self.x, self.y, self.diameter // 2)
         self.move(self.x - self.widget_size // 2, self.y - self.widget_size // 2)
         
-        self.anim = QVariantAnimation(self)
-        self.anim.setDuration(200)  # Réduit de 350ms à 250ms
-        self.anim.setStartValue(0.1)  # Partir de 10% de la taille, pas 0
-        self.anim.setEndValue(1.0)
-        self.anim.setEasingCurve(QEasingCurve.Type.OutBack)
-
-        def update_scale(value):
-            self.scale_factor = value
-            self.apply_scale()
-        
-        self.anim.valueChanged.connect(update_scale)
-        self.anim.finished.connect(self.on_animation_finished)
+        # Animation créée une fois et rejouée à chaque changement de page
+        if self.open_anim is None:
+            self.open_anim = QVariantAnimation(self)
+            self.open_anim.setDuration(200)  # Réduit de 350ms à 250ms
+            self.open_anim.setStartValue(0.1)  # Partir de 10% de la taille, pas 0
+            self.open_anim.setEndValue(1.0)
+            self.open_anim.setEasingCurve(QEasingCurve.Type.OutBack)
+
+            def update_scale(value):
+                self.scale_factor = value
+                self.apply_scale()
+            
+            self.open_anim.valueChanged.connect(update_scale)
+            self.open_anim.finished.connect(self.on_animation_finished)
+        self.anim = self.open_anim
+        self.anim.stop()
         self.anim.start()
+
+    def show_page(self, buttons, clips_by_link):
+        """
+        Affiche une autre page dans ce même menu : les boutons sont recyclés
+        (update_buttons) puis l'animation d'ouverture est rejouée.
+        """
+        self.update_buttons(buttons, reveal=False)
+        self.update_clips_by_link(clips_by_link)
+        self.animate_open()
     
     def apply_scale(self):
         """Trigger un repaint avec le nouveau scale factor"""
-        # Le scale sera appliqué dans paintEvent via une transformation
-        # On met aussi à jour la position/taille des boutons
-        if self.scale_factor > 0:
-            for i, btn in enumerate(self.buttons):
-                # Repositionner et redimensionner chaque bouton selon le scale
-                angle_step = 360 / len(self.buttons)
-                angle = math.radians(i * angle_step)
-                center_offset = self.widget_size // 2
-                
-                # Position originale
-                orig_bx = center_offset + self.radius * math.cos(angle) - self.btn_size // 2
-                orig_by = center_offset + self.radius * math.sin(angle) - self.btn_size // 2
-                
-                # Appliquer le scale depuis le centre
-                scaled_bx = center_offset + (orig_bx - center_offset) * self.scale_factor
-                scaled_by = center_offset + (orig_by - center_offset) * self.scale_factor
-                scaled_size = int(self.btn_size * self.scale_factor)
-                
-                btn.move(int(scaled_bx), int(scaled_by))
-                btn.setFixedSize(scaled_size, scaled_size)
-                
-                # Adapter la taille de l'icône selon le type
-                label = self.button_labels[i] if i < len(self.button_labels) else ""
-                if "/" in label:
-                    # Image - légèrement plus petit pour voir le hover
-                    btn.setIconSize(QSize(int(48 * self.scale_factor), int(48 * self.scale_factor)))
-                else:
-                    # Emoji ou texte - taille d'icône standard
-                    btn.setIconSize(QSize(int(32 * self.scale_factor), int(32 * self.scale_factor)))
-                
-                # Mettre à jour le style avec le border-radius scalé
-                special_buttons = self.special_buttons_by_numbers[self.nb_icons_menu]
-                if label in special_buttons:
-                    btn.setStyleSheet(f"""
-                        QPushButton {{
-                            background-color: transparent;
-                            border-radius: {int((self.btn_size // 2) * self.scale_factor)}px;
-                            border: none;
-                        }}
-                        QPushButton:hover {{
-                            background-color: rgba(255, 255, 255, 100);
-                        }}
-                    """)
-                elif "/" in label:
-                    # Boutons avec images - pas de padding
-                    btn.setStyleSheet(f"""
-                        QPushButton {{
-                            background-color: transparent;
-                            border-radius: {int((self.btn_size // 2) * self.scale_factor)}px;
-                            border: none;
-                            padding: 0px;
-                        }}
-                        QPushButton:hover {{
-                            background-color: rgba(255, 255, 255, 30);
-                        }}
-                    """)
-                else:
-                    btn.setStyleSheet(f"""
-                        QPushButton {{
-                            background-color: rgba(255, 255, 255, 10);
-                            border-radius: {int((self.btn_size // 2) * self.scale_factor)}px;
-                            border: none;
-                        }}
-                        QPushButton:hover {{
-                            background-color: rgba(255, 255, 255, 100);
-                        }}
-                    """)
+        # Le scale est appliqué dans paintEvent via une transformation : aucune
+        # opération par bouton à chaque image (les boutons sont cachés pendant
+        # l'ouverture, et remplacés par leurs captures pendant la fermeture)
         self.update()
 
     def on_animation_finished(self):
@@ -3339,6 +3313,7 @@ class RadialMenu(QWidget):
             return
         
         self.neon_enabled = False
+        self.timer.stop()
         
         # Fermer le sous-menu hover s'il existe
         if self.hover_submenu:
@@ -3352,6 +3327,9 @@ class RadialMenu(QWidget):
         # Masquer la fenêtre tooltip
         self.tooltip_window.hide()
         
+        # Les boutons ne sont plus redimensionnés à chaque image : leurs captures le sont
+        self.capture_button_snapshots()
+        
         self.anim = QVariantAnimation(self)
         self.anim.setDuration(200)
         self.anim.setStartValue(1.0)
@@ -3379,6 +3357,8 @@ class RadialMenu(QWidget):
         if self.app_instance and hasattr(self.app_instance, 'close_page_selector'):
             self.app_instance.close_page_selector()
         
-        if self.tracker:
+        if self.app_instance and hasattr(self.app_instance, 'dismiss_tracker'):
+            self.app_instance.dismiss_tracker()
+        elif self.tracker:
             self.tracker.close()
         self.close()
\ No newline at end of file
@@ -0,0 +1,142 @@
+from datetime import datetime
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget, QTableWidgetItem
+from PyQt6.QtWidgets import QPlainTextEdit, QHeaderView, QAbstractItemView
+
+from action_runner import STATUS_LABELS, format_duration
+
+class RecentRunsView(QWidget):
+    """
+    Exécutions récentes des clips exec (onglet « Exécutions » de la configuration).
+
+    Une ligne par exécution, la plus récente en tête : état, commande, heure de
+    début, durée, code de retour. La sortie (stdout puis stderr, tronquée aux
+    derniers octets) de la ligne sélectionnée s'affiche en dessous. Suivie en
+    direct via ActionRunner.run_changed ; les durées en cours sont rafraîchies
+    chaque seconde.
+    """
+    HEADERS = ("État", "Commande", "Début", "Durée", "Code")
+
+    def __init__(self, runner, parent=None):
+        super().__init__(parent)
+        self.runner = runner
+        self.runs = []
+        self._shown_output = None  # Sortie affichée : évite de la réécrire (et de perdre le défilement) si rien n'a changé
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        if runner is None:
+            label = QLabel("Le suivi des commandes exec est disponible en mode daemon\n(python3 ClipNotesWindow.py --daemon).")
+            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            layout.addWidget(label)
+            return
+
+        self.table = QTableWidget(0, len(self.HEADERS))
+        self.table.setHorizontalHeaderLabels(self.HEADERS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.table.itemSelectionChanged.connect(self.show_output)
+        layout.addWidget(self.table, 2)
+
+        self.output = QPlainTextEdit()
+        self.output.setReadOnly(True)
+        self.output.setPlaceholderText("Sortie de l'exécution sélectionnée")
+        layout.addWidget(self.output, 1)
+
+        buttons_layout = QHBoxLayout()
+        self.stop_button = QPushButton("⏹ Arrêter")
+        self.stop_button.clicked.connect(self.stop_selected)
+        clear_button = QPushButton("🧹 Effacer l'historique")
+        clear_button.clicked.connect(self.clear_history)
+        buttons_layout.addWidget(self.stop_button)
+        buttons_layout.addStretch()
+        buttons_layout.addWidget(clear_button)
+        layout.addLayout(buttons_layout)
+
+        runner.run_changed.connect(self.on_run_changed)
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh_running)
+        self.refresh_timer.start(1000)
+        self.refresh()
+
+    def selected_run(self):
+        rows = self.table.selectionModel().selectedRows()
+        return self.runs[rows[0].row()] if rows else None
+
+    def refresh(self):
+        """Reconstruit la table (au plus HISTORY_SIZE lignes) en gardant la sélection"""
+        selected = self.selected_run()
+        self.runs = list(reversed(self.runner.history))
+        self.table.blockSignals(True)
+        self.table.setRowCount(len(self.runs))
+        for row, run in enumerate(self.runs):
+            self.update_row(row, run)
+        if selected in self.runs:
+            self.table.selectRow(self.runs.index(selected))
+        self.table.blockSignals(False)
+        self.show_output()
+
+    def update_row(self, row, run):
+        icon, label = STATUS_LABELS[run.status]
+        started = datetime.fromtimestamp(run.started_at).strftime("%H:%M:%S") if run.started_at else ""
+        duration = format_duration(run.duration) if run.duration is not None else ""
+        code = "" if run.exit_code is None else str(run.exit_code)
+        for column, text in enumerate((f"{icon} {label}", run.command.replace("\n", " ⏎ "), started, duration, code)):
+            item = self.table.item(row, column)
+            if item is None:
+                item = QTableWidgetItem()
+                self.table.setItem(row, column, item)
+            item.setText(text)
+        self.table.item(row, 1).setToolTip(run.command)
+
+    def on_run_changed(self, run):
+        if run in self.runs:
+            self.update_row(self.runs.index(run), run)
+            if run is self.selected_run():
+                self.show_output()
+        else:
+            self.refresh()
+
+    def refresh_running(self):
+        """Durées (et sortie sélectionnée) des exécutions en cours"""
+        for row, run in enumerate(self.runs):
+            if run.status == "running":
+                self.update_row(row, run)
+        self.show_output()
+
+    def show_output(self):
+        run = self.selected_run()
+        self.stop_button.setEnabled(run is not None and run.status in ("pending", "running"))
+        shown = None if run is None else (run.id, run.status, run.pid, len(run.stdout.data) + run.stdout.dropped, len(run.stderr.data) + run.stderr.dropped)
+        if shown == self._shown_output:
+            return
+        self._shown_output = shown
+        if run is None:
+            self.output.clear()
+            return
+        parts = [f"$ {run.command}"]
+        if run.pid:
+            parts.append(f"pid {run.pid}")
+        if run.error:
+            parts.append(f"[Erreur] {run.error}")
+        stdout, stderr = run.stdout.text(), run.stderr.text()
+        if stdout:
+            parts.append(stdout.rstrip())
+        if stderr:
+            parts.append("--- stderr ---\n" + stderr.rstrip())
+        self.output.setPlainText("\n".join(parts))
+
+    def stop_selected(self):
+        run = self.selected_run()
+        if run is not None:
+            self.runner.stop(run)
+
+    def clear_history(self):
+        self.runner.clear_history()
+        self.refresh()
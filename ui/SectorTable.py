@@ -0,0 +1,103 @@
+import math
+
+class SectorTable:
+    """
+    Table des secteurs du menu radial, précalculée pour un ensemble de boutons visibles.
+
+    Associe à chaque angle la position (et donc le bouton, l'action) sous la souris,
+    l'angle moyen de chaque action (position des badges) et, pendant un drag, les
+    positions de drop possibles. Reconstruite seulement quand les boutons visibles,
+    le rayon ou le mode de tri changent : le survol ne fait plus que des accès directs.
+    """
+    def __init__(self, visible_indices, button_actions, button_labels, special_labels, special_indices, radius, sort_mode):
+        self.indices = visible_indices
+        self.radius = radius
+        self.sort_mode = sort_mode
+        self.count = len(visible_indices)
+        self.angle_step = 360 / self.count if self.count else 360
+        self.actions = [button_actions[i] if i < len(button_actions) else None for i in visible_indices]
+        # Positions des boutons spéciaux (y compris ➕)
+        self.special_positions = {pos for pos, i in enumerate(visible_indices) if i in special_indices}
+        # Clips réordonnables : (index du bouton, position, action)
+        self.clips = []
+        for pos, btn_index in enumerate(visible_indices):
+            label = button_labels[btn_index] if btn_index < len(button_labels) else ""
+            action = self.actions[pos]
+            if label not in special_labels and action is not None:
+                self.clips.append((btn_index, pos, action))
+        # Angle moyen (moyenne vectorielle, radians) des boutons de chaque action
+        self.action_angles = {}
+        for action in set(self.actions):
+            if action is None:
+                continue
+            angles = [math.radians(pos * self.angle_step) for pos, a in enumerate(self.actions) if a == action]
+            avg_x = sum(math.cos(a) for a in angles) / len(angles)
+            avg_y = sum(math.sin(a) for a in angles) / len(angles)
+            self.action_angles[action] = math.atan2(avg_y, avg_x)
+        self._drop_positions = {}
+
+    def position_at(self, angle_deg):
+        """Position (parmi les visibles) du secteur contenant l'angle (0° = droite)"""
+        return int(round(angle_deg / self.angle_step)) % self.count
+
+    def angular_distance(self, pos, angle_deg):
+        dist = abs(pos * self.angle_step - angle_deg)
+        return 360 - dist if dist > 180 else dist
+
+    def drop_positions(self, dragged_index, is_child_drag):
+        """
+        (clips cibles, positions de drop) pour un drag, mis en cache par bouton déplacé.
+        Chaque position : (angle de l'indicateur, index du bouton, insérer avant, action).
+        """
+        key = (dragged_index, is_child_drag)
+        if key not in self._drop_positions:
+            self._drop_positions[key] = self._compute_drop_positions(dragged_index, is_child_drag)
+        return self._drop_positions[key]
+
+    def _compute_drop_positions(self, dragged_index, is_child_drag):
+        angle_step = self.angle_step
+        # Filtrer les clips sans celui qu'on drag (sauf pour le drag d'enfant où on garde tout)
+        if is_child_drag:
+            targets = list(self.clips)
+        else:
+            targets = [clip for clip in self.clips if clip[0] != dragged_index]
+        if not targets:
+            return targets, []
+
+        drop_positions = []
+        # Pour chaque paire de clips adjacents
+        for i in range(len(targets)):
+            curr_btn_index, curr_pos, curr_action = targets[i]
+            next_btn_index, next_pos, next_action = targets[(i + 1) % len(targets)]
+            curr_angle = curr_pos * angle_step
+            next_angle = next_pos * angle_step
+
+            # Gérer le passage par 0°
+            diff = next_angle - curr_angle
+            if diff > 180:
+                diff -= 360
+            elif diff < -180:
+                diff += 360
+
+            if curr_action == next_action or self.sort_mode != "group":
+                # Même zone OU pas de regroupement par zone : une seule position au milieu
+                drop_positions.append(((curr_angle + diff / 2) % 360, next_btn_index, True, curr_action))
+            else:
+                # Zones différentes ET mode group : "fin de zone courante" (1/3) et "début de zone suivante" (2/3)
+                drop_positions.append(((curr_angle + diff / 3) % 360, curr_btn_index, False, curr_action))
+                drop_positions.append(((curr_angle + 2 * diff / 3) % 360, next_btn_index, True, next_action))
+
+        # Positions explicites AVANT le premier clip et APRÈS le dernier
+        if len(targets) == 1:
+            only_btn_index, only_pos, only_action = targets[0]
+            only_angle = only_pos * angle_step
+            drop_positions.append(((only_angle - angle_step / 2) % 360, only_btn_index, True, only_action))
+            drop_positions.append(((only_angle + angle_step / 2) % 360, only_btn_index, False, only_action))
+        else:
+            sorted_by_pos = sorted(targets, key=lambda x: x[1])
+            first_btn_index, first_pos, first_action = sorted_by_pos[0]
+            last_btn_index, last_pos, last_action = sorted_by_pos[-1]
+            drop_positions.append(((first_pos * angle_step - angle_step * 0.4) % 360, first_btn_index, True, first_action))
+            # Toujours présente pour permettre de mettre un clip en dernier
+            drop_positions.append(((last_pos * angle_step + angle_step * 0.4) % 360, last_btn_index, False, last_action))
+        return targets, drop_positions
@@ -0,0 +1,128 @@
+from PyQt6.QtCore import Qt, QEvent, QRect, QRectF, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QPen
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle
+from ui import StoredClipsModel
+
+class StoredClipsDelegate(QStyledItemDelegate):
+    """
+    Dessin des lignes de l'onglet "Clips stockés" : icône de l'alias, action,
+    aperçu de la valeur, date, et la rangée de boutons (restaurer, modifier,
+    supprimer, copier, terminal, lancer) peinte directement dans la cellule.
+    Aucun widget par ligne : un clic sur un bouton émet button_clicked(nom, clip).
+    """
+    button_clicked = pyqtSignal(str, object)
+    # Survol d'un bouton (aide affichée sous la liste, comme les autres widgets du dialogue)
+    help_requested = pyqtSignal(str)
+
+    BUTTON_SIZE = 30
+    BUTTON_SPACING = 4
+    GROUP_SPACING = 10  # Entre les boutons de gestion et ceux d'exécution
+    # (nom, emoji, aide, couleur RGB par défaut)
+    BUTTONS = (
+        ("restore", "↩️", "Restaurer", (100, 200, 100)),
+        ("edit", "🔧", "Modifier", (255, 255, 150)),
+        ("delete", "🗑️", "Supprimer", (255, 100, 100)),
+        ("copy", "✂️", "Copier dans le presse-papier", (98, 160, 234)),
+        ("term", "💻", "Lancer dans un terminal", (248, 228, 92)),
+        ("exec", "🚀", "Lancer", (224, 27, 36)),
+    )
+    BUTTONS_WIDTH = len(BUTTONS) * BUTTON_SIZE + (len(BUTTONS) - 1) * BUTTON_SPACING + GROUP_SPACING
+
+    def __init__(self, action_zone_colors=None, parent=None):
+        super().__init__(parent)
+        colors = action_zone_colors or {}
+        # Les boutons d'exécution prennent la couleur de leur zone d'action
+        self.button_colors = {
+            name: QColor(*colors.get(name, rgb)) for name, emoji, help_text, rgb in self.BUTTONS
+        }
+        self.button_emojis = {name: emoji for name, emoji, help_text, rgb in self.BUTTONS}
+        self.button_help = {name: help_text for name, emoji, help_text, rgb in self.BUTTONS}
+        self.emoji_font = QFont()
+        self.emoji_font.setPointSize(12)
+        self.placeholder_font = QFont()
+        self.placeholder_font.setPointSize(24)
+        self.date_font = QFont()
+        self.date_font.setPointSize(8)
+
+    def button_rects(self, cell_rect):
+        """[(nom, rectangle)] des boutons dans la cellule de la colonne "buttons" """
+        rects = []
+        x = cell_rect.x()
+        y = cell_rect.y() + (cell_rect.height() - self.BUTTON_SIZE) // 2
+        for i, button in enumerate(self.BUTTONS):
+            if i == 3:
+                x += self.GROUP_SPACING
+            rects.append((button[0], QRect(x, y, self.BUTTON_SIZE, self.BUTTON_SIZE)))
+            x += self.BUTTON_SIZE + self.BUTTON_SPACING
+        return rects
+
+    def button_at(self, cell_rect, pos):
+        for name, rect in self.button_rects(cell_rect):
+            if rect.contains(pos):
+                return name
+        return None
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        rect = option.rect
+        if option.state & QStyle.StateFlag.State_MouseOver:
+            painter.fillRect(rect, QColor(255, 255, 255, 15))
+        column = StoredClipsModel.COLUMNS[index.column()]
+        text = index.data(Qt.ItemDataRole.DisplayRole) or ""
+
+        if column == "alias":
+            pixmap = index.data(Qt.ItemDataRole.DecorationRole)
+            if pixmap is not None and not pixmap.isNull():
+                ratio = pixmap.devicePixelRatio() or 1
+                size = min(int(pixmap.width() / ratio), rect.width(), rect.height())
+                target = QRect(0, 0, size, size)
+                target.moveCenter(rect.center())
+                painter.drawPixmap(target, pixmap)
+            elif text == "🖼️":
+                # Image manquante
+                painter.setFont(self.placeholder_font)
+                painter.setPen(QColor("gray"))
+                painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+            else:
+                painter.setPen(QColor("white"))
+                painter.drawText(rect, Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap, text)
+        elif column == "action":
+            painter.setPen(QColor("lightblue"))
+            painter.drawText(rect.adjusted(4, 0, -4, 0), Qt.AlignmentFlag.AlignVCenter | Qt.TextFlag.TextWordWrap, text)
+        elif column == "string":
+            painter.setPen(QColor("white"))
+            # Aperçu sur une ligne (les retours à la ligne restent visibles dans l'aide)
+            elided = option.fontMetrics.elidedText(text.replace("\n", " "), Qt.TextElideMode.ElideRight, rect.width() - 8)
+            painter.drawText(rect.adjusted(4, 0, -4, 0), Qt.AlignmentFlag.AlignVCenter, elided)
+        elif column == "created_at":
+            painter.setFont(self.date_font)
+            painter.setPen(QColor(180, 180, 180, 255))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+        elif column == "buttons":
+            painter.setFont(self.emoji_font)
+            for name, button_rect in self.button_rects(rect):
+                color = self.button_colors[name]
+                painter.setPen(QPen(QColor(color.red(), color.green(), color.blue(), 150), 1))
+                painter.setBrush(QColor(color.red(), color.green(), color.blue(), 100))
+                painter.drawRoundedRect(QRectF(button_rect).adjusted(0.5, 0.5, -0.5, -0.5), 10, 10)
+                painter.drawText(button_rect, Qt.AlignmentFlag.AlignCenter, self.button_emojis[name])
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if StoredClipsModel.COLUMNS[index.column()] != "buttons":
+            return super().editorEvent(event, model, option, index)
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            name = self.button_at(option.rect, event.position().toPoint())
+            if name:
+                self.button_clicked.emit(name, index.data(StoredClipsModel.ClipRole))
+                return True
+        return False
+
+    def helpEvent(self, event, view, option, index):
+        if StoredClipsModel.COLUMNS[index.column()] == "buttons":
+            name = self.button_at(option.rect, event.pos())
+            if name:
+                self.help_requested.emit(self.button_help[name])
+                return True
+        return super().helpEvent(event, view, option, index)
@@ -0,0 +1,155 @@
+import os
+from datetime import datetime
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from utils import *
+
+class StoredClipsModel(QAbstractTableModel):
+    """
+    Modèle des clips stockés (onglet "Clips stockés").
+
+    Une ligne par clip, colonnes alias / action / valeur / date / boutons. Les valeurs
+    affichées (date formatée, aperçu, icône) sont calculées à la première demande puis
+    gardées : la vue ne peint que les lignes visibles, et trier ou filtrer (via un
+    QSortFilterProxyModel sur SortRole) ne recrée aucun widget.
+    Supprimer ou modifier un clip ne touche que sa ligne (rowsRemoved / dataChanged).
+    """
+    ClipRole = Qt.ItemDataRole.UserRole + 1  # dict du clip
+    SortRole = Qt.ItemDataRole.UserRole + 2  # clé de tri / filtre
+    HelpRole = Qt.ItemDataRole.UserRole + 3  # (texte d'aide, html ou None) pour l'aperçu du dialogue
+
+    COLUMNS = ("alias", "action", "string", "created_at", "buttons")
+    HEADERS = ("Alias", "Action", "Valeur", "Date", "")
+
+    ACTIONS_READABLE = {
+        "copy": "copier",
+        "term": "exécuter terminal",
+        "exec": "exécuter",
+    }
+    ACTIONS_READABLE_TOOLTIP = {
+        "copy": "copie la valeur dans le presse-papier",
+        "term": "exécute la valeur dans un terminal",
+        "exec": "exécute la valeur hors terminal",
+    }
+
+    def __init__(self, clips=None, parent=None):
+        super().__init__(parent)
+        self._clips = list(clips or [])
+        self._display = [None] * len(self._clips)
+        self._rows = self._index_rows()
+
+    # === API QAbstractTableModel ===
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._clips)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._clips):
+            return None
+        row = index.row()
+        clip = self._clips[row]
+        column = self.COLUMNS[index.column()]
+        if role == self.ClipRole:
+            return clip
+        if column == "buttons":
+            return None
+        display = self._display_values(row)
+        if role == Qt.ItemDataRole.DisplayRole:
+            return display[column]
+        if role == Qt.ItemDataRole.DecorationRole and column == "alias":
+            return display["pixmap"]
+        if role == self.SortRole:
+            if column == "created_at":
+                # Tri chronologique : la date ISO telle quelle
+                return clip.get("created_at") or ""
+            return str(clip.get(column) or "").lower()
+        if role == self.HelpRole:
+            if column == "action":
+                return self.ACTIONS_READABLE_TOOLTIP.get(clip.get("action", "copy"), ""), None
+            if column == "string":
+                return clip_tooltip_from_record(clip)
+        return None
+
+    # === Accès et modifications ligne par ligne ===
+    def set_clips(self, clips):
+        """Remplace tous les clips (rechargement du fichier)"""
+        self.beginResetModel()
+        self._clips = list(clips)
+        self._display = [None] * len(self._clips)
+        self._rows = self._index_rows()
+        self.endResetModel()
+
+    def _index_rows(self, start=0):
+        """alias -> ligne, pour les lignes à partir de start"""
+        return {clip.get("alias"): row for row, clip in enumerate(self._clips[start:], start)}
+
+    def clip_at(self, row):
+        return self._clips[row] if 0 <= row < len(self._clips) else None
+
+    def row_of(self, alias):
+        return self._rows.get(alias, -1)
+
+    def remove_clip(self, alias):
+        """Retire la ligne d'un clip (supprimé ou restauré dans le menu)"""
+        row = self.row_of(alias)
+        if row < 0:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._clips[row]
+        del self._display[row]
+        del self._rows[alias]
+        # Les lignes suivantes remontent d'un cran
+        self._rows.update(self._index_rows(row))
+        self.endRemoveRows()
+        return True
+
+    def update_clip(self, alias, clip):
+        """Remplace les données d'un clip et ne signale que sa ligne"""
+        row = self.row_of(alias)
+        if row < 0:
+            return False
+        self._clips[row] = clip
+        self._display[row] = None
+        # Alias éventuellement renommé
+        del self._rows[alias]
+        self._rows[clip.get("alias")] = row
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1))
+        return True
+
+    def _display_values(self, row):
+        """Valeurs affichées d'une ligne, calculées au premier affichage"""
+        display = self._display[row]
+        if display is None:
+            clip = self._clips[row]
+            alias = clip.get("alias", "")
+            pixmap = None
+            if "/" in alias:
+                # Image manquante : pas d'icône, le délégué affiche un placeholder
+                if os.path.exists(alias):
+                    pixmap = image_pixmap(alias, 48)
+            elif is_emoji(alias):
+                pixmap = emoji_pixmap(alias, 32)
+            string = clip.get("string", "")
+            created_at = clip.get("created_at", "")
+            if created_at:
+                try:
+                    date_display = datetime.fromisoformat(created_at).strftime("%d/%m/%Y %H:%M")
+                except ValueError:
+                    date_display = created_at[:16]
+            else:
+                date_display = "-"
+            display = {
+                "alias": "" if pixmap is not None else ("🖼️" if "/" in alias else alias),
+                "pixmap": pixmap,
+                "action": self.ACTIONS_READABLE.get(clip.get("action", "copy"), "copy"),
+                "string": string[:50] + "..." if len(string) > 50 else string,
+                "created_at": date_display,
+            }
+            self._display[row] = display
+        return display
@@ -1,10 +1,21 @@
 
+from collections import OrderedDict
 from PyQt6.QtCore import Qt, QTimer, QRect
-from PyQt6.QtGui import QFontMetrics
+from PyQt6.QtGui import QFontMetrics, QTextDocument
 from PyQt6.QtWidgets import QWidget, QTextBrowser, QVBoxLayout
 
 class TooltipWindow(QWidget):
-    """Fenêtre semi-transparente pour afficher des messages en dessous du menu radial"""
+    """
+    Fenêtre semi-transparente pour afficher des messages en dessous du menu radial.
+
+    Les documents des textes longs et du HTML sont construits et mis en page une
+    seule fois, puis gardés dans un LRU indexé par leur contenu : survoler à nouveau
+    un clip ne fait que rebrancher son document et redimensionner la fenêtre.
+    """
+    DOCUMENT_CACHE_SIZE = 48
+    DOCUMENT_WIDTH = 560  # Largeur de mise en page des textes longs et du HTML
+    DOCUMENT_MARGIN = 4   # Marge interne des documents (valeur par défaut de Qt)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -36,6 +47,18 @@ class TooltipWindow(QWidget):
             }
         """)
         
+        # Document des textes courts (réécrit à chaque message) ; les autres
+        # documents viennent du cache et ne sont jamais modifiés.
+        # Possédé par la fenêtre : le document d'origine du QTextBrowser serait
+        # détruit par Qt au premier setDocument d'un document du cache
+        self.text_browser.ensurePolished()
+        self.plain_document = QTextDocument(self)
+        self.plain_document.setDefaultFont(self.text_browser.font())
+        self.plain_document.setDocumentMargin(self.DOCUMENT_MARGIN)
+        self.text_browser.setDocument(self.plain_document)
+        # (type, contenu) -> (QTextDocument, largeur, hauteur)
+        self.document_cache = OrderedDict()
+        
         # Layout
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -74,23 +97,14 @@ class TooltipWindow(QWidget):
             self.text_browser.setMinimumSize(0, 0)
             self.text_browser.setMaximumSize(600, 400)
             
-            if html:
-                self.text_browser.setHtml(html)
-            else:
-                self.text_browser.setPlainText(text)
-            
-            # Ajuster la taille au contenu
-            doc = self.text_browser.document()
-            doc.setTextWidth(560)  # Largeur fixe pour le calcul
-            content_height = min(int(doc.size().height()) + 20, 400)
-            content_width = min(int(doc.idealWidth()), 600)
-            # S'assurer d'une largeur minimale raisonnable
-            content_width = max(content_width, 200)
+            content_width, content_height = self.show_cached_document(text, html)
             self.text_browser.setFixedSize(content_width, content_height)
             self.calculated_width = content_width
             self.setFixedSize(content_width, content_height)
         else:
             # Textes courts : nouveau comportement avec taille fixe
+            if self.text_browser.document() is not self.plain_document:
+                self.text_browser.setDocument(self.plain_document)
             self.text_browser.setPlainText(text)
             font = self.text_browser.font()
             fm = QFontMetrics(font)
@@ -118,6 +132,50 @@ class TooltipWindow(QWidget):
         else:
             self.hide_timer.stop()
     
+    def show_cached_document(self, text, html=None):
+        """
+        Affiche le document (mis en page) d'un texte long ou d'un HTML, en le
+        construisant au premier affichage. Retourne (largeur, hauteur) de la fenêtre.
+        """
+        # Le hash d'une str est calculé une fois puis gardé par Python :
+        # la recherche ne relit pas le contenu à chaque survol
+        key = ("html", html) if html else ("text", text)
+        entry = self.document_cache.get(key)
+        if entry is None:
+            entry = self.build_document(html, text)
+            self.document_cache[key] = entry
+        else:
+            self.document_cache.move_to_end(key)
+        
+        doc, content_width, content_height = entry
+        self.text_browser.setDocument(doc)
+        
+        # Éviction après le changement de document : le document affiché
+        # (le plus récent) n'est jamais détruit
+        while len(self.document_cache) > self.DOCUMENT_CACHE_SIZE:
+            _, (old_doc, _, _) = self.document_cache.popitem(last=False)
+            old_doc.deleteLater()
+        return content_width, content_height
+    
+    def build_document(self, html, text):
+        """Construit et mesure un document : (QTextDocument, largeur, hauteur)"""
+        self.text_browser.ensurePolished()
+        doc = QTextDocument(self)
+        doc.setDefaultFont(self.text_browser.font())
+        doc.setDocumentMargin(self.DOCUMENT_MARGIN)
+        if html:
+            doc.setHtml(html)
+        else:
+            doc.setPlainText(text)
+        
+        # Ajuster la taille au contenu
+        doc.setTextWidth(self.DOCUMENT_WIDTH)  # Largeur fixe pour le calcul
+        content_height = min(int(doc.size().height()) + 20, 400)
+        content_width = min(int(doc.idealWidth()), 600)
+        # S'assurer d'une largeur minimale raisonnable
+        content_width = max(content_width, 200)
+        return doc, content_width, content_height
+    
     def position_below_menu(self, menu_center_x, menu_center_y, menu_radius):
         """
         Positionne la fenêtre tooltip en dessous du menu radial.
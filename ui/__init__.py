@@ -1,6 +1,8 @@
+from .EmojiListModel import EmojiListModel
 from .EmojiSelector import EmojiSelector
 from .AutoScrollListWidget import AutoScrollListWidget
 from .WhiteDropIndicatorStyle import WhiteDropIndicatorStyle
+from .AnimationClock import AnimationClock, ClockTimer, animation_clock
 from .HoverSubMenu import HoverSubMenu
 from .RadialKeyboardListener import RadialKeyboardListener
 from .CursorTracker import CursorTracker
@@ -9,5 +11,10 @@ from .TooltipWindow import TooltipWindow
 from .StorageBar import StorageBar
 from .CircularSlider import CircularSlider
 from .CircularColorPicker import CircularColorPicker
-from .RadialMenu import RadialMenu
+from .StoredClipsModel import StoredClipsModel
+from .StoredClipsDelegate import StoredClipsDelegate
+from .RecentRunsView import RecentRunsView
+from .PaintedButton import PaintedButton
+from .SectorTable import SectorTable
+from .RadialMenu import RadialMenu, button_pixmap
 from .KeyboardShortcutsManager import KeyboardShortcutsManager
\ No newline at end of file
@@ -1,10 +1,17 @@
-import pyperclip, subprocess, io, json, os, hashlib
+import pyperclip, subprocess, json, os, hashlib, functools
 from datetime import datetime
 
 from PIL import Image, ImageDraw, ImageFont
 
-from PyQt6.QtGui import QColor, QPixmap, QImage, QIcon
+from PyQt6.QtCore import QMimeData
+from PyQt6.QtGui import QColor, QPixmap, QImage, QIcon, QTextDocument, QTextCursor, QGuiApplication
 import re
+from collections import OrderedDict
+
+from clip_store import get_clip_store, flush_all_stores, LAZY_HTML_KEY
+from icon_atlas import get_icon_atlas, make_key, file_signature
+from terminal_launcher import run_in_terminal
+from action_runner import get_action_runner
 
 def is_emoji(s):
     """
@@ -116,27 +123,116 @@ def couleur_avec_opacite(couleur, opacite):
         r, g, b = couleur
     return QColor(r, g, b, opacite)
 
+# ====== CACHE DES PIXMAPS D'ICÔNES ======
+# Les mêmes labels sont rendus sans cesse (création des boutons, survol, focus clavier,
+# sous-menus...) : on garde les pixmaps prêts dans un LRU commun à tout le processus.
+
+PIXMAP_CACHE_SIZE = 1024
+_PIXMAP_CACHE = OrderedDict()
+
+EMOJI_FONT_PATH = "seguiemj.ttf"
+TEXT_FONT_PATHS = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+]
+
+@functools.lru_cache(maxsize=64)
+def _truetype_font(path, size):
+    """ImageFont.truetype mémoïsé (le chargement d'une police coûte plus que le rendu)"""
+    return ImageFont.truetype(path, size)
+
+@functools.lru_cache(maxsize=64)
+def _text_font(size):
+    """Police système pour text_pixmap, avec repli sur la police par défaut de PIL"""
+    for path in TEXT_FONT_PATHS:
+        try:
+            return _truetype_font(path, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+@functools.lru_cache(maxsize=None)
+def _font_signature(path):
+    """Signature de la police utilisée (les icônes de l'atlas sont invalidées si elle change)"""
+    return file_signature(path)
+
+def _text_font_signature():
+    for path in TEXT_FONT_PATHS:
+        if os.path.exists(path):
+            return _font_signature(path)
+    return "default"
+
+def _atlas_pixmap(atlas_key, render):
+    """Pixmap depuis l'atlas disque, ou rendu par PIL puis ajouté à l'atlas"""
+    atlas = get_icon_atlas()
+    cached = atlas.get(atlas_key)
+    if cached is not None:
+        width, height, pixels = cached
+        qt_img = QImage(pixels, width, height, width * 4, QImage.Format.Format_RGBA8888)
+        return QPixmap.fromImage(qt_img)
+    img = render()
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
+    atlas.put(atlas_key, img.width, img.height, img.tobytes("raw", "RGBA"))
+    return pil_to_qpixmap(img)
+
+def _cached_pixmap(key, render, atlas_key):
+    """
+    Retourne le pixmap du cache mémoire, sinon de l'atlas disque,
+    sinon le rend (render() retourne une image PIL) et le mémorise.
+    """
+    pixmap = _PIXMAP_CACHE.get(key)
+    if pixmap is None:
+        pixmap = _atlas_pixmap(atlas_key, render)
+        _PIXMAP_CACHE[key] = pixmap
+        if len(_PIXMAP_CACHE) > PIXMAP_CACHE_SIZE:
+            _PIXMAP_CACHE.popitem(last=False)
+    else:
+        _PIXMAP_CACHE.move_to_end(key)
+    # Copie légère (partage implicite Qt) : l'appelant peut peindre dessus sans toucher au cache
+    return QPixmap(pixmap)
+
+def clear_pixmap_cache():
+    _PIXMAP_CACHE.clear()
+
+def pil_to_qpixmap(img):
+    """
+    Convertit une image PIL en QPixmap directement depuis son buffer RGBA
+    (sans encodage/décodage PNG intermédiaire).
+    """
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
+    buffer = img.tobytes("raw", "RGBA")
+    qt_img = QImage(buffer, img.width, img.height, img.width * 4, QImage.Format.Format_RGBA8888)
+    # fromImage copie les pixels : le buffer peut être libéré ensuite
+    return QPixmap.fromImage(qt_img)
+
 def emoji_pixmap(emoji_char, size=32):
-    
-    font = ImageFont.truetype("seguiemj.ttf", size=int(size / 1.5))
+    atlas_key = make_key("emoji", emoji_char, size, _font_signature(EMOJI_FONT_PATH))
+    return _cached_pixmap(("emoji", emoji_char, size), lambda: _render_emoji_image(emoji_char, size), atlas_key)
+
+def image_pixmap(path, size=32):
+    signature = file_signature(path)
+    atlas_key = make_key("image", signature, size)
+    return _cached_pixmap(("image", signature, size), lambda: _render_image(path, size), atlas_key)
+
+def text_pixmap(text, size=32):
+    atlas_key = make_key("text", text, size, _text_font_signature())
+    return _cached_pixmap(("text", text, size), lambda: _render_text_image(text, size), atlas_key)
+
+def _render_emoji_image(emoji_char, size=32, font=None):
+    # font : police propre à l'appelant (les rendus hors du thread principal n'utilisent pas la police partagée)
+    font = font or _truetype_font(EMOJI_FONT_PATH, int(size / 1.5))
     img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
     draw.text((size/2, size/2), emoji_char, font=font, embedded_color=True, anchor="mm")
     
-    # Convert PIL Image to QPixmap
-    data = io.BytesIO()
-    img.save(data, format='PNG')
-    qt_img = QImage.fromData(data.getvalue(), "PNG")
-    return QPixmap.fromImage(qt_img)
+    return img
 
-def image_pixmap(path, size=32):
-    img = Image.open(path).convert("RGBA").resize((size, size), Image.LANCZOS)
-    data = io.BytesIO()
-    img.save(data, format="PNG")
-    qt_img = QImage.fromData(data.getvalue(), "PNG")
-    return QPixmap.fromImage(qt_img)
+def _render_image(path, size=32):
+    return Image.open(path).convert("RGBA").resize((size, size), Image.LANCZOS)
 
-def text_pixmap(text, size=32):
+def _render_text_image(text, size=32):
     """
     Crée un pixmap avec du texte dont la taille s'adapte à la longueur.
     Plus le texte est long, plus la police est petite.
@@ -157,13 +253,7 @@ def text_pixmap(text, size=32):
         font_size = int(size * 0.22)  # ~7px pour les très longs textes
     
     # Utiliser une police système standard
-    try:
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", font_size)
-    except:
-        try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf", font_size)
-        except:
-            font = ImageFont.load_default()
+    font = _text_font(font_size)
     
     img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
@@ -180,11 +270,7 @@ def text_pixmap(text, size=32):
     # Dessiner le texte en blanc
     draw.text((x, y), text, font=font, fill=(255, 255, 255, 255))
     
-    # Convert PIL Image to QPixmap
-    data = io.BytesIO()
-    img.save(data, format='PNG')
-    qt_img = QImage.fromData(data.getvalue(), "PNG")
-    return QPixmap.fromImage(qt_img)
+    return img
 
 def sort_actions_map(actions_map, json_order=None, custom_action_order=None, sort_mode="group", json_data=None):
     """
@@ -251,18 +337,28 @@ def get_json_order(file_path):
     """
     Retourne un dictionnaire {alias: index} basé sur l'ordre des entrées dans le JSON.
     """
-    if not os.path.exists(file_path):
+    if not get_clip_store(file_path).exists():
         return {}
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = get_clip_store(file_path).load()
         return {item.get('alias'): i for i, item in enumerate(data) if item.get('alias')}
     except:
         return {}
 
 
 # ====== FONCTIONS OPTIMISÉES (chargement unique du JSON) ======
+# Les données vivent dans un ClipStore (clip_store.py) : lues une seule fois,
+# écrites en arrière-plan. Les mutateurs tiennent son verrou pendant la modification.
+
+def with_clip_store_lock(func):
+    """Décorateur : exécute un mutateur JSON sous le verrou du ClipStore du fichier"""
+    @functools.wraps(func)
+    def wrapper(file_path, *args, **kwargs):
+        with get_clip_store(file_path).lock:
+            return func(file_path, *args, **kwargs)
+    return wrapper
+
 
 def load_clip_notes_data(file_path):
     """
@@ -270,13 +366,11 @@ def load_clip_notes_data(file_path):
     Les clips stockés (stored=True) sont exclus.
     """
     json_path = file_path.replace('.txt', '.json')
-    if not os.path.exists(json_path):
+    if not get_clip_store(json_path).exists():
         return []
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            all_data = json.load(f)
-        # Filtrer pour ne garder que les clips non stockés
-        return [item for item in all_data if not item.get('stored', False)]
+        # Les clips stockés ne sont pas lus (backend SQLite) ni renvoyés
+        return get_clip_store(json_path).load_active()
     except:
         return []
 
@@ -287,11 +381,10 @@ def load_stored_clips_data(file_path):
     Les clips actifs (stored=False ou absent) sont exclus.
     """
     json_path = file_path.replace('.txt', '.json')
-    if not os.path.exists(json_path):
+    if not get_clip_store(json_path).exists():
         return []
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            all_data = json.load(f)
+        all_data = get_clip_store(json_path).load()
         # Filtrer pour ne garder que les clips stockés
         return [item for item in all_data if item.get('stored', False)]
     except:
@@ -304,15 +397,15 @@ def load_all_clips_data(file_path):
     Utilisé pour calculer le prochain ID disponible.
     """
     json_path = file_path.replace('.txt', '.json')
-    if not os.path.exists(json_path):
+    if not get_clip_store(json_path).exists():
         return []
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return list(get_clip_store(json_path).load())
     except:
         return []
 
 
+@with_clip_store_lock
 def set_clip_stored_status(file_path, alias, stored):
     """
     Met à jour le statut 'stored' d'un clip dans le fichier JSON.
@@ -326,29 +419,21 @@ def set_clip_stored_status(file_path, alias, stored):
         True si succès, False sinon
     """
     json_path = file_path.replace('.txt', '.json')
-    if not os.path.exists(json_path):
+    if not get_clip_store(json_path).exists():
         return False
     
+    store = get_clip_store(json_path)
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        item = store.index.by_alias.get(alias)
     except json.JSONDecodeError:
         return False
     
-    # Chercher le clip et mettre à jour son statut
-    found = False
-    for item in data:
-        if item.get('alias') == alias:
-            item['stored'] = stored
-            found = True
-            break
-    
-    if not found:
+    if item is None:
         return False
+    item['stored'] = stored
     
-    # Sauvegarder
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    # Sauvegarder (champ modifié : l'index reste valide)
+    store.save(reindex=False)
     
     print(f"[Info] Statut 'stored' de '{alias}' mis à jour: {stored}")
     return True
@@ -382,7 +467,14 @@ def populate_actions_map_from_data(json_data, actions_map_sub, callback):
             else:
                 func = callback  # Fallback
             
-            actions_map_sub[alias] = [(func, [string], {}), string, action]
+            if action == 'copy':
+                # Corps HTML différé (backend SQLite) : lu seulement à la copie
+                kwargs = copy_kwargs(item.get('html_string') or item.get(LAZY_HTML_KEY))
+            elif action == 'exec':
+                kwargs = exec_kwargs(item)
+            else:
+                kwargs = {}
+            actions_map_sub[alias] = [(func, [string], kwargs), string, action]
 
 
 def get_json_order_from_data(json_data):
@@ -402,6 +494,117 @@ def get_clip_data_from_data(json_data, alias):
     return (0, None)
 
 
+def get_clip_data(file_path, alias):
+    """Comme get_clip_data_from_data, en O(1) via l'index du ClipStore."""
+    try:
+        item = get_clip_store(file_path).index.by_alias.get(alias)
+    except:
+        item = None
+    if item is None:
+        return (0, None)
+    action_to_slider = {'copy': 0, 'term': 1, 'exec': 2}
+    return (action_to_slider.get(item.get('action', 'copy'), 0), item.get('html_string', None))
+
+
+def get_clip_tooltip(file_path, alias):
+    """
+    (texte, html) à afficher au survol d'un clip : les aperçus tronqués calculés à
+    l'enregistrement, ou le contenu complet s'il est assez court (ou pour les clips
+    enregistrés avant les aperçus).
+    """
+    try:
+        item = get_clip_store(file_path).index.by_alias.get(alias)
+    except:
+        item = None
+    if item is None:
+        return (None, None)
+    return clip_tooltip_from_record(item)
+
+
+def get_clip_record(file_path, alias):
+    """Retourne le clip (ou groupe) de premier niveau portant cet alias, ou None."""
+    try:
+        return get_clip_store(file_path).index.by_alias.get(alias)
+    except:
+        return None
+
+
+# ====== APERÇUS DES TOOLTIPS ======
+# Le tooltip d'un clip n'a pas besoin de tout son contenu : un HTML issu de
+# QTextEdit.toHtml() peut peser des mégaoctets. L'aperçu est tronqué une fois,
+# à l'enregistrement, et stocké dans le clip ("preview" / "html_preview") seulement
+# s'il diffère du contenu complet.
+
+TOOLTIP_PREVIEW_CHARS = 1500
+TOOLTIP_PREVIEW_LINES = 25
+
+def _truncate_position(text):
+    """Position de coupure d'un texte trop long pour un tooltip, ou None"""
+    position = None
+    if len(text) > TOOLTIP_PREVIEW_CHARS:
+        position = TOOLTIP_PREVIEW_CHARS
+    line_end = -1
+    for _ in range(TOOLTIP_PREVIEW_LINES):
+        line_end = text.find("\n", line_end + 1)
+        if line_end < 0:
+            break
+    else:
+        position = line_end if position is None else min(position, line_end)
+    return position
+
+def make_tooltip_preview(string, html_string=None):
+    """
+    Aperçus tronqués d'un clip pour son tooltip.
+    
+    Returns:
+        tuple: (texte, html), chacun None si le contenu complet convient tel quel
+    """
+    text = (string or "").replace(r'\n', '\n')
+    position = _truncate_position(text)
+    text_preview = text[:position].rstrip() + " …" if position is not None else None
+    
+    html_preview = None
+    if html_string:
+        try:
+            doc = QTextDocument()
+            doc.setHtml(html_string)
+            position = _truncate_position(doc.toPlainText())
+            if position is not None:
+                cursor = QTextCursor(doc)
+                cursor.setPosition(position)
+                cursor.movePosition(QTextCursor.MoveOperation.End, QTextCursor.MoveMode.KeepAnchor)
+                cursor.removeSelectedText()
+                cursor.insertText(" …")
+                html_preview = doc.toHtml()
+        except Exception as e:
+            print(f"[Erreur] Aperçu HTML impossible : {e}")
+    return text_preview, html_preview
+
+def set_tooltip_preview(record, string, html_string=None):
+    """Calcule et range (ou retire) les aperçus du clip dans son enregistrement"""
+    text_preview, html_preview = make_tooltip_preview(string, html_string)
+    for key, value in (("preview", text_preview), ("html_preview", html_preview)):
+        if value is None:
+            record.pop(key, None)
+        else:
+            record[key] = value
+
+def clip_tooltip_from_record(record):
+    """(texte, html) du tooltip d'un clip ou d'un enfant de groupe"""
+    text = record.get("preview") or record.get("string", "").replace(r'\n', '\n')
+    html = record.get("html_preview") or record.get("html_string") or record.get("html")
+    return text, html
+
+
+def drop_from_index(index, old_data, new_data):
+    """Retire de l'index les clips de premier niveau de old_data absents de new_data (mêmes objets)"""
+    kept = {id(item) for item in new_data}
+    for item in old_data:
+        if id(item) not in kept and index.by_alias.get(item.get('alias')) is item:
+            index.remove(item.get('alias'))
+
+
+@with_clip_store_lock
 def reorder_json_clips(file_path, action, new_order):
     """
     Réordonne les clips d'une action spécifique dans le fichier JSON.
@@ -412,12 +615,13 @@ def reorder_json_clips(file_path, action, new_order):
         action: L'action concernée ("copy", "term", "exec")
         new_order: Liste des alias dans le nouvel ordre
     """
-    if not os.path.exists(file_path):
+    if not get_clip_store(file_path).exists():
         return
     
+    store = get_clip_store(file_path)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = store.load()
+        index = store.index
     except:
         return
     
@@ -448,11 +652,12 @@ def reorder_json_clips(file_path, action, new_order):
     # Reconstruire la liste complète (copy, term, exec) + clips stockés à la fin
     new_data = clips_by_action["copy"] + clips_by_action["term"] + clips_by_action["exec"] + stored_clips
     
-    # Sauvegarder
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(new_data, f, indent=4, ensure_ascii=False)
+    # Sauvegarder (mêmes enregistrements : l'index ne perd que les clips écartés)
+    drop_from_index(index, data, new_data)
+    store.save(new_data, reindex=False)
 
 
+@with_clip_store_lock
 def move_clip_in_json(file_path, source_alias, target_position_alias, insert_before=True, new_action=None, context=None):
     """
     Déplace un clip ou un groupe vers une nouvelle position dans le fichier JSON.
@@ -469,12 +674,13 @@ def move_clip_in_json(file_path, source_alias, target_position_alias, insert_bef
     Returns:
         bool: True si le déplacement a réussi, False sinon
     """
-    if not os.path.exists(file_path):
+    if not get_clip_store(file_path).exists():
         return False
     
+    store = get_clip_store(file_path)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = store.load()
+        index = store.index
     except:
         return False
     
@@ -536,9 +742,12 @@ def move_clip_in_json(file_path, source_alias, target_position_alias, insert_bef
     new_data = clips_by_action["copy"] + clips_by_action["term"] + clips_by_action["exec"] + stored_clips
     
     data_sent = new_data if context != "custom" else (active_data + stored_clips)
+    # Le clip déplacé est une copie : la référencer dans l'index à la place de l'original
+    index.remove(source_alias)
+    index.add(source_clip)
+    drop_from_index(index, data, data_sent)
     # Sauvegarder
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data_sent, f, indent=4, ensure_ascii=False)
+    store.save(data_sent, reindex=False)
     
     return True
 
@@ -547,16 +756,13 @@ def populate_actions_map_from_file(file_path, actions_map_sub, callback):
     json_path = file_path.replace('.txt', '.json')
     
     # Lire uniquement depuis le JSON
-    if not os.path.exists(json_path):
+    if not get_clip_store(json_path).exists():
         print(f"[Info] Fichier JSON introuvable: {json_path}")
         return
     
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            all_data = json.load(f)
-        
-        # Filtrer pour ne garder que les clips non stockés
-        json_data = [item for item in all_data if not item.get('stored', False)]
+        # Clips non stockés seulement (les stockés ne sont pas lus avec SQLite)
+        json_data = get_clip_store(json_path).load_active()
             
         for item in json_data:
             alias = item.get('alias')
@@ -593,8 +799,15 @@ def populate_actions_map_from_file(file_path, actions_map_sub, callback):
             else:
                 func = callback  # Fallback
             
-            # Format: [(func, [string], {}), string, action]
-            actions_map_sub[alias] = [(func, [string], {}), string, action]
+            # Format: [(func, [string], kwargs), string, action]
+            if action == 'copy':
+                # Corps HTML différé (backend SQLite) : lu seulement à la copie
+                kwargs = copy_kwargs(item.get('html_string') or item.get(LAZY_HTML_KEY))
+            elif action == 'exec':
+                kwargs = exec_kwargs(item)
+            else:
+                kwargs = {}
+            actions_map_sub[alias] = [(func, [string], kwargs), string, action]
             
     except Exception as e:
         print(f"[Erreur lecture JSON] {e}")
@@ -645,6 +858,7 @@ def get_next_clip_id(data):
     
     return max_id + 1
 
+@with_clip_store_lock
 def append_to_actions_file_json(file_path, alias, string, action="copy", html_string=None, stored=False):
     """
     Ajoute une entrée dans le fichier JSON d'actions.
@@ -662,20 +876,18 @@ def append_to_actions_file_json(file_path, alias, string, action="copy", html_st
         return
     
     # Charger le fichier JSON existant ou créer une liste vide
-    if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            try:
-                data = json.load(f)
-            except json.JSONDecodeError:
-                data = []
-    else:
+    store = get_clip_store(file_path)
+    try:
+        data = store.load()
+        index = store.index
+    except json.JSONDecodeError:
         data = []
+        index = None
     
     # Vérifier si l'alias existe déjà (parmi TOUS les clips, stockés ou non)
-    for item in data:
-        if item.get("alias") == alias:
-            print(f"[Info] L'alias '{alias}' existe déjà.")
-            return
+    if index is not None and alias in index.by_alias:
+        print(f"[Info] L'alias '{alias}' existe déjà.")
+        return
     
     # Calculer le prochain ID et le timestamp
     next_id = get_next_clip_id(data)
@@ -693,12 +905,14 @@ def append_to_actions_file_json(file_path, alias, string, action="copy", html_st
     # Ajouter le HTML seulement s'il est fourni
     if html_string:
         new_entry["html_string"] = html_string
+    set_tooltip_preview(new_entry, string, html_string)
     
     data.append(new_entry)
     
     # Sauvegarder dans le fichier JSON
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    if index is not None:
+        index.add(new_entry)
+    store.save(data, reindex=index is None)
     
     # print(f"[Info] L'alias '{alias}' a été ajouté au fichier.")
 
@@ -747,6 +961,7 @@ def replace_or_append_at_lineno(chemin_fichier, clef, valeur, numero_ligne):
     with open(chemin_fichier, 'w', encoding='utf-8') as f:
         f.write('\n'.join(lignes) + '\n')  # ajoute un \n final propre
 
+@with_clip_store_lock
 def replace_or_append_json(file_path, alias, string, action="copy", html_string=None, stored=None):
     """
     Remplace une entrée existante ou l'ajoute si elle n'existe pas.
@@ -764,33 +979,32 @@ def replace_or_append_json(file_path, alias, string, action="copy", html_string=
         return
     
     # Charger le fichier JSON existant ou créer une liste vide
-    if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            try:
-                data = json.load(f)
-            except json.JSONDecodeError:
-                data = []
-    else:
+    store = get_clip_store(file_path)
+    try:
+        data = store.load()
+        index = store.index
+    except json.JSONDecodeError:
         data = []
+        index = None
     
     # Chercher si l'alias existe déjà
     found = False
-    for item in data:
-        if item.get("alias") == alias:
-            # Remplacer les valeurs (mais garder id, created_at et stored existants)
-            item["string"] = string
-            item["action"] = action
-            # Gérer le HTML : l'ajouter, le mettre à jour, ou le supprimer
-            if html_string:
-                item["html_string"] = html_string
-            elif "html_string" in item:
-                del item["html_string"]  # Supprimer si plus de HTML
-            # Mettre à jour stored seulement si explicitement fourni
-            if stored is not None:
-                item["stored"] = stored
-            found = True
-            print(f"[Info] L'alias '{alias}' a été mis à jour.")
-            break
+    item = index.by_alias.get(alias) if index is not None else None
+    if item is not None:
+        # Remplacer les valeurs (mais garder id, created_at et stored existants)
+        item["string"] = string
+        item["action"] = action
+        # Gérer le HTML : l'ajouter, le mettre à jour, ou le supprimer
+        if html_string:
+            item["html_string"] = html_string
+        elif "html_string" in item:
+            del item["html_string"]  # Supprimer si plus de HTML
+        set_tooltip_preview(item, string, html_string)
+        # Mettre à jour stored seulement si explicitement fourni
+        if stored is not None:
+            item["stored"] = stored
+        found = True
+        print(f"[Info] L'alias '{alias}' a été mis à jour.")
     
     # Si l'alias n'existe pas, l'ajouter avec id, created_at et stored
     if not found:
@@ -807,13 +1021,16 @@ def replace_or_append_json(file_path, alias, string, action="copy", html_string=
         }
         if html_string:
             new_entry["html_string"] = html_string
+        set_tooltip_preview(new_entry, string, html_string)
         data.append(new_entry)
+        if index is not None:
+            index.add(new_entry)
         print(f"[Info] L'alias '{alias}' a été ajouté.")
     
-    # Sauvegarder dans le fichier JSON
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    # Sauvegarder dans le fichier JSON (index déjà à jour)
+    store.save(data, reindex=index is None)
 
+@with_clip_store_lock
 def delete_from_json(file_path, alias):
     """
     Supprime une entrée du fichier JSON.
@@ -822,21 +1039,24 @@ def delete_from_json(file_path, alias):
         file_path: Chemin du fichier JSON
         alias: L'alias à supprimer
     """
-    if not os.path.exists(file_path):
+    if not get_clip_store(file_path).exists():
         return
     
+    store = get_clip_store(file_path)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = store.load()
+        index = store.index
     except json.JSONDecodeError:
         data = []
+        index = None
     
     # Filtrer pour retirer l'alias
-    data = [item for item in data if item.get('alias') != alias]
+    new_data = [item for item in data if item.get('alias') != alias]
     
     # Sauvegarder
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    if index is not None:
+        drop_from_index(index, data, new_data)
+    store.save(new_data, reindex=index is None)
     
     print(f"[Info] L'alias '{alias}' a été supprimé.")
 
@@ -857,41 +1077,81 @@ def remove_from_actions_file(path, name_to_remove):
             if not line.strip().startswith(f"{name_to_remove}:"):
                 f.write(line)
 
-def paperclip_copy(string):
+# ====== PRESSE-PAPIER ======
+# Processus résident (daemon) : la copie passe par QClipboard, sans lancer
+# xclip/wl-copy à chaque clic. Qt reste propriétaire du presse-papier tant que le
+# daemon tourne. Une instance ponctuelle quitte juste après le clic : elle garde
+# pyperclip, dont le processus externe survit à l'application.
+_native_clipboard = False
+
+def use_native_clipboard(enabled=True):
+    """Active la copie via QClipboard (à appeler par un processus qui reste en vie)"""
+    global _native_clipboard
+    _native_clipboard = enabled
+
+def group_child_html(child):
+    """HTML d'un enfant de groupe : 'html' (format des groupes), 'html_string' pour les anciennes entrées"""
+    html = child.get('html') or child.get('html_string')
+    if html is None and LAZY_HTML_KEY in child:
+        html = child[LAZY_HTML_KEY]()
+    return html
+
+def copy_kwargs(html_string):
+    """kwargs d'une action copy dans actions_map_sub (HTML du clip, ou fonction qui le lit)"""
+    return {'html_string': html_string} if html_string else {}
+
+def paperclip_copy(string, html_string=None):
+    """
+    Copie un clip : text/plain, plus text/html si le clip a un formatage riche.
+    pyperclip (texte seul) sert de repli hors Qt ou en cas d'échec.
+    """
     # Remplacer '\\n' par des sauts de ligne réels
     formatted_string = string.replace(r'\n', '\n')
+    if callable(html_string):
+        html_string = html_string()
+    if _native_clipboard and QGuiApplication.instance() is not None:
+        try:
+            mime_data = QMimeData()
+            mime_data.setText(formatted_string)
+            if html_string:
+                mime_data.setHtml(html_string)
+            # Le presse-papier prend possession de mime_data
+            QGuiApplication.clipboard().setMimeData(mime_data)
+            return
+        except Exception as e:
+            print(f"[Erreur] Copie Qt impossible, repli sur pyperclip : {e}")
     pyperclip.copy(formatted_string)
 
 def execute_terminal(string):
     # Remplacer '\\n' par des sauts de ligne réels
     formatted_string = string.replace(r'\n', '\n')
-    
-    # Détecter et ouvrir un nouveau terminal selon l'environnement
-    terminals = [
-        ['gnome-terminal', '--', 'bash', '-c', formatted_string + '; exec bash'],
-        ['konsole', '-e', 'bash', '-c', formatted_string + '; exec bash'],
-        ['xterm', '-e', 'bash', '-c', formatted_string + '; exec bash'],
-        ['x-terminal-emulator', '-e', 'bash', '-c', formatted_string + '; exec bash'],
-    ]
-    
-    for terminal in terminals:
-        try:
-            subprocess.Popen(terminal)
-            return
-        except FileNotFoundError:
-            continue
-    
-    # Si aucun terminal n'est trouvé
-    print("Aucun terminal trouvé. Exécution dans le shell actuel...")
-    subprocess.run(formatted_string, shell=True)
+    # Terminal détecté une fois (ou session tmux), voir terminal_launcher.py
+    run_in_terminal(formatted_string)
 
-def execute_command(string):
+def execute_command(string, tracked=False):
     formatted_string = string.replace(r'\n', '\n')
+    runner = get_action_runner()
+    if tracked and runner is not None:
+        # Tâche courte suivie par le daemon (durée, code de retour, sorties), voir action_runner.py
+        runner.run(formatted_string)
+        return
     subprocess.Popen(formatted_string, shell=True, 
         stdout=subprocess.DEVNULL, 
         stderr=subprocess.DEVNULL,
         stdin=subprocess.DEVNULL,
         start_new_session=True)  # Détache complètement du processus parent
+
+def exec_kwargs(record):
+    """kwargs d'une action exec dans actions_map_sub (suivi si le clip est marqué "tracked")"""
+    return {'tracked': True} if record and record.get('tracked') else {}
+
+def exec_run_status(string):
+    """État de la dernière exécution d'un clip exec (daemon uniquement), ou None"""
+    runner = get_action_runner()
+    if runner is None:
+        return None
+    run = runner.last_run(string.replace(r'\n', '\n'))
+    return run.status_line() if run is not None else None
     
 
 def create_thumbnail(image_path, thumbnails_dir, size=48):
@@ -954,6 +1214,7 @@ def create_color_icon(rgb_tuple, size=16):
 
 # === GESTION DES GROUPES (MINI-MENUS) ===
 
+@with_clip_store_lock
 def create_group_in_json(file_path, clip1_alias, clip2_alias, group_alias="📁"):
     """
     Crée un groupe à partir de deux clips existants.
@@ -968,12 +1229,13 @@ def create_group_in_json(file_path, clip1_alias, clip2_alias, group_alias="📁"
     Returns:
         True si succès, False sinon
     """
-    if not os.path.exists(file_path):
+    if not get_clip_store(file_path).exists():
         return False
     
+    store = get_clip_store(file_path)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = store.load()
+        index = store.index
     except json.JSONDecodeError:
         return False
     
@@ -996,10 +1258,9 @@ def create_group_in_json(file_path, clip1_alias, clip2_alias, group_alias="📁"
         return False
     
     # Générer un alias unique si nécessaire
-    existing_aliases = [item.get('alias') for item in data]
     final_alias = group_alias
     counter = 1
-    while final_alias in existing_aliases:
+    while final_alias in index.by_alias:
         final_alias = f"{group_alias}{counter}"
         counter += 1
     
@@ -1028,15 +1289,18 @@ def create_group_in_json(file_path, clip1_alias, clip2_alias, group_alias="📁"
     # Insérer le groupe à la position du premier clip
     insert_pos = min(clip1_index, clip2_index)
     data.insert(insert_pos, group)
+    index.remove(clip1_alias)
+    index.remove(clip2_alias)
+    index.add(group)
     
     # Sauvegarder
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    store.save(data, reindex=False)
     
     print(f"[Info] Groupe '{final_alias}' créé avec {clip1_alias} et {clip2_alias}")
     return True
 
 
+@with_clip_store_lock
 def add_clip_to_group(file_path, group_alias, clip_alias):
     """
     Ajoute un clip existant à un groupe.
@@ -1049,12 +1313,13 @@ def add_clip_to_group(file_path, group_alias, clip_alias):
     Returns:
         True si succès, False sinon
     """
-    if not os.path.exists(file_path):
+    if not get_clip_store(file_path).exists():
         return False
     
+    store = get_clip_store(file_path)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = store.load()
+        index = store.index
     except json.JSONDecodeError:
         return False
     
@@ -1079,15 +1344,17 @@ def add_clip_to_group(file_path, group_alias, clip_alias):
     
     # Retirer le clip du niveau principal
     del data[clip_index]
+    index.remove(clip_alias)
+    index.add_child(group_alias, clip_data)
     
     # Sauvegarder
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    store.save(data, reindex=False)
     
     print(f"[Info] Clip '{clip_alias}' ajouté au groupe '{group_alias}'")
     return True
 
 
+@with_clip_store_lock
 def remove_clip_from_group(file_path, group_alias, clip_alias, context = "normal_mode"):
     """
     Retire un clip d'un groupe et le remet au niveau principal.
@@ -1101,12 +1368,13 @@ def remove_clip_from_group(file_path, group_alias, clip_alias, context = "normal
     Returns:
         True si succès, False sinon
     """
-    if not os.path.exists(file_path):
+    if not get_clip_store(file_path).exists():
         return False
     
+    store = get_clip_store(file_path)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = store.load()
+        index = store.index
     except json.JSONDecodeError:
         return False
     
@@ -1140,6 +1408,7 @@ def remove_clip_from_group(file_path, group_alias, clip_alias, context = "normal
     
     # Retirer le clip du groupe
     del group_data['children'][clip_index_in_group]
+    index.remove_child(group_alias, clip_alias)
     
     # Vérifier si le groupe doit être dissous
     remaining_children = group_data.get('children', [])
@@ -1150,40 +1419,46 @@ def remove_clip_from_group(file_path, group_alias, clip_alias, context = "normal
             # Remettre le dernier clip au niveau principal
             last_clip = remaining_children[0]
             data[group_index] = last_clip
+            index.remove(group_alias)
+            index.add(last_clip)
             print(f"[Info] Groupe '{group_alias}' dissous, clip '{last_clip.get('alias')}' restauré")
         else:
             # Groupe vide, le supprimer
             del data[group_index]
+            index.remove(group_alias)
             print(f"[Info] Groupe '{group_alias}' supprimé (vide)")
         
         # Ajouter le clip retiré après la position du groupe
         if context != "storage_mode" and context != "delete_mode":
             # Ajouter le clip retiré après la position du groupe
             data.insert(group_index + 1, clip_data)
+            index.add(clip_data)
     else:
         if context != "storage_mode" and context != "delete_mode":
         # Ajouter le clip retiré après le groupe
             data.insert(group_index + 1, clip_data)
+            index.add(clip_data)
     
     # Sauvegarder
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    store.save(data, reindex=False)
     
     print(f"[Info] Clip '{clip_alias}' retiré du groupe '{group_alias}'")
     return True
 
+@with_clip_store_lock
 def store_clip_from_group(file_path, group_alias, clip_alias):
     """
     Retire un clip d'un groupe pour stockage.
     Le clip n'est pas réinséré dans la timeline.
     Retourne les données complètes du clip retiré.
     """
-    if not os.path.exists(file_path):
+    if not get_clip_store(file_path).exists():
         return None
 
+    store = get_clip_store(file_path)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = store.load()
+        index = store.index
     except json.JSONDecodeError:
         return None
 
@@ -1215,22 +1490,25 @@ def store_clip_from_group(file_path, group_alias, clip_alias):
 
     # Retirer le clip du groupe
     del group_data['children'][clip_index]
+    index.remove_child(group_alias, clip_alias)
 
     remaining_children = group_data.get('children', [])
 
     # Dissolution du groupe si nécessaire
     if len(remaining_children) <= 1:
+        index.remove(group_alias)
         if len(remaining_children) == 1:
             data[group_index] = remaining_children[0]
+            index.add(remaining_children[0])
         else:
             del data[group_index]
 
     # Sauvegarde
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    store.save(data, reindex=False)
 
     return clip_data
 
+@with_clip_store_lock
 def extract_clip_from_group_to_position(file_path, group_alias, clip_alias, target_alias, insert_before=True, new_action=None, context = ""):
     """
     Extrait un clip d'un groupe et le place à une position spécifique en une seule opération.
@@ -1247,12 +1525,13 @@ def extract_clip_from_group_to_position(file_path, group_alias, clip_alias, targ
     Returns:
         True si succès, False sinon
     """
-    if not os.path.exists(file_path):
+    if not get_clip_store(file_path).exists():
         return False
     
+    store = get_clip_store(file_path)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = store.load()
+        index = store.index
     except json.JSONDecodeError:
         return False
     
@@ -1290,6 +1569,7 @@ def extract_clip_from_group_to_position(file_path, group_alias, clip_alias, targ
     
     # Retirer le clip du groupe
     del group_data['children'][clip_index_in_group]
+    index.remove_child(group_alias, clip_alias)
     
     # === 2. Gérer la dissolution du groupe si nécessaire ===
     remaining_children = group_data.get('children', [])
@@ -1303,10 +1583,13 @@ def extract_clip_from_group_to_position(file_path, group_alias, clip_alias, targ
             last_clip = remaining_children[0]
             replacement_alias = last_clip.get('alias')
             data[group_index] = last_clip
+            index.remove(group_alias)
+            index.add(last_clip)
             print(f"[Info] Groupe '{group_alias}' dissous, clip '{replacement_alias}' restauré")
         else:
             # Groupe vide, le supprimer
             del data[group_index]
+            index.remove(group_alias)
             print(f"[Info] Groupe '{group_alias}' supprimé (vide)")
     
     # === 3. Trouver la position cible ===
@@ -1334,14 +1617,16 @@ def extract_clip_from_group_to_position(file_path, group_alias, clip_alias, targ
         else:
             data.insert(target_index + 1, clip_data)
     
+    index.add(clip_data)
+    
     # === 4. Sauvegarder ===
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    store.save(data, reindex=False)
     
     print(f"[Info] Clip '{clip_alias}' extrait du groupe et placé {'avant' if insert_before else 'après'} '{actual_target}'")
     return True
 
 
+@with_clip_store_lock
 def delete_group_from_json(file_path, group_alias):
     """
     Supprime un groupe et tous ses clips enfants.
@@ -1353,12 +1638,13 @@ def delete_group_from_json(file_path, group_alias):
     Returns:
         True si succès, False sinon
     """
-    if not os.path.exists(file_path):
+    if not get_clip_store(file_path).exists():
         return False
     
+    store = get_clip_store(file_path)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = store.load()
+        index = store.index
     except json.JSONDecodeError:
         return False
     
@@ -1370,8 +1656,8 @@ def delete_group_from_json(file_path, group_alias):
         return False
     
     # Sauvegarder
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(new_data, f, indent=4, ensure_ascii=False)
+    drop_from_index(index, data, new_data)
+    store.save(new_data, reindex=False)
     
     print(f"[Info] Groupe '{group_alias}' et ses clips supprimés")
     return True
@@ -1388,22 +1674,18 @@ def get_group_children(file_path, group_alias):
     Returns:
         Liste des clips enfants ou None si groupe non trouvé
     """
-    if not os.path.exists(file_path):
+    if not get_clip_store(file_path).exists():
         return None
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        children = get_clip_store(file_path).index.group_children.get(group_alias)
     except json.JSONDecodeError:
         return None
     
-    for item in data:
-        if item.get('alias') == group_alias and item.get('type') == 'group':
-            return item.get('children', [])
-    
-    return None
+    return list(children) if children is not None else None
 
 
+@with_clip_store_lock
 def update_group_action(file_path, group_alias, new_action):
     """
     Met à jour l'action d'un groupe et de tous ses clips enfants.
@@ -1416,32 +1698,25 @@ def update_group_action(file_path, group_alias, new_action):
     Returns:
         True si succès, False sinon
     """
-    if not os.path.exists(file_path):
+    if not get_clip_store(file_path).exists():
         return False
     
+    store = get_clip_store(file_path)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        item = store.index.by_alias.get(group_alias)
     except json.JSONDecodeError:
         return False
     
     # Trouver le groupe
-    found = False
-    for item in data:
-        if item.get('alias') == group_alias and item.get('type') == 'group':
-            item['action'] = new_action
-            # Mettre à jour tous les enfants
-            for child in item.get('children', []):
-                child['action'] = new_action
-            found = True
-            break
-    
-    if not found:
+    if item is None or item.get('type') != 'group':
         return False
+    item['action'] = new_action
+    # Mettre à jour tous les enfants
+    for child in item.get('children', []):
+        child['action'] = new_action
     
     # Sauvegarder
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    store.save(reindex=False)
     
     print(f"[Info] Action du groupe '{group_alias}' mise à jour: {new_action}")
     return True
@@ -1458,22 +1733,18 @@ def is_group(file_path, alias):
     Returns:
         True si c'est un groupe, False sinon
     """
-    if not os.path.exists(file_path):
+    if not get_clip_store(file_path).exists():
         return False
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        item = get_clip_store(file_path).index.by_alias.get(alias)
     except json.JSONDecodeError:
         return False
     
-    for item in data:
-        if item.get('alias') == alias:
-            return item.get('type') == 'group'
-    
-    return False
+    return item is not None and item.get('type') == 'group'
 
 
+@with_clip_store_lock
 def update_group_alias(file_path, old_alias, new_alias):
     """
     Met à jour l'alias (icône) d'un groupe.
@@ -1486,34 +1757,30 @@ def update_group_alias(file_path, old_alias, new_alias):
     Returns:
         True si succès, False sinon
     """
-    if not os.path.exists(file_path):
+    if not get_clip_store(file_path).exists():
         return False
     
+    store = get_clip_store(file_path)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        index = store.index
     except json.JSONDecodeError:
         return False
     
     # Trouver le groupe
-    found = False
-    for item in data:
-        if item.get('alias') == old_alias and item.get('type') == 'group':
-            item['alias'] = new_alias
-            found = True
-            break
-    
-    if not found:
+    item = index.by_alias.get(old_alias)
+    if item is None or item.get('type') != 'group':
         return False
+    item['alias'] = new_alias
+    index.rename(old_alias, new_alias)
     
     # Sauvegarder
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    store.save(reindex=False)
     
     print(f"[Info] Alias du groupe mis à jour: {old_alias} -> {new_alias}")
     return True
 
 
+@with_clip_store_lock
 def update_group_child(file_path, group_alias, child_alias, new_alias=None, new_string=None, new_action=None, new_html=None):
     """
     Met à jour un clip enfant d'un groupe.
@@ -1530,21 +1797,19 @@ def update_group_child(file_path, group_alias, child_alias, new_alias=None, new_
     Returns:
         True si succès, False sinon
     """
-    if not os.path.exists(file_path):
+    if not get_clip_store(file_path).exists():
         return False
     
+    store = get_clip_store(file_path)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        index = store.index
     except json.JSONDecodeError:
         return False
     
     # Trouver le groupe
-    group_data = None
-    for item in data:
-        if item.get('alias') == group_alias and item.get('type') == 'group':
-            group_data = item
-            break
+    group_data = index.by_alias.get(group_alias)
+    if group_data is not None and group_data.get('type') != 'group':
+        group_data = None
     
     if group_data is None:
         print(f"[Erreur] Groupe non trouvé: {group_alias}")
@@ -1564,20 +1829,24 @@ def update_group_child(file_path, group_alias, child_alias, new_alias=None, new_
     # Mettre à jour les champs
     if new_alias is not None:
         child_data['alias'] = new_alias
+        index.rename_child(group_alias, child_alias, new_alias)
     if new_string is not None:
         child_data['string'] = new_string
     if new_action is not None:
         child_data['action'] = new_action
     if new_html is not None:
+        # Ancien champ : ne doit pas survivre à une modification du HTML
+        child_data.pop('html_string', None)
         if new_html == "":
             # Supprimer le HTML
             child_data.pop('html', None)
         else:
             child_data['html'] = new_html
+    if new_string is not None or new_html is not None:
+        set_tooltip_preview(child_data, child_data.get('string', ''), child_data.get('html'))
     
     # Sauvegarder
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    store.save(reindex=False)
     
     print(f"[Info] Clip enfant '{child_alias}' mis à jour dans le groupe '{group_alias}'")
     return True